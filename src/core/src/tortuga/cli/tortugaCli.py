@@ -20,13 +20,14 @@ import logging
 import os
 import sys
 from abc import ABCMeta, abstractmethod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
-from tortuga.config.configManager import ConfigManager
+from tortuga.config.configManager import ConfigManager, get_root
 from tortuga.exceptions.tortugaException import TortugaException
 from tortuga.logging import CLI_NAMESPACE, ROOT_NAMESPACE
-from tortuga.scripts.tortuga.script import ConfigException, \
-    TortugaScriptConfig
+
+if TYPE_CHECKING:
+    from tortuga.scripts.tortuga.script import TortugaScriptConfig
 
 
 T = TypeVar('T')
@@ -48,15 +49,31 @@ class TortugaCli(metaclass=ABCMeta):
     def __init__(self, validArgCount=0):
         self._logger = logging.getLogger(CLI_NAMESPACE)
 
-        self._config: TortugaScriptConfig = None
+        self._config: 'TortugaScriptConfig' = None
         self._parser = argparse.ArgumentParser()
         self._args = []
         self._validArgCount = validArgCount
         self._optionGroupDict = {}
-        self._cm = ConfigManager()
+        self.__cm: Optional[ConfigManager] = None
 
         self.__initializeLocale()
 
+    @property
+    def _cm(self) -> ConfigManager:
+        """
+        The ConfigManager is created when first required, since loading
+        the configuration is not required to parse arguments or display
+        help.
+        """
+        if self.__cm is None:
+            self.__cm = ConfigManager()
+
+        return self.__cm
+
+    @_cm.setter
+    def _cm(self, cm: ConfigManager):
+        self.__cm = cm
+
     def __initializeLocale(self):
         """Initialize the gettext domain """
         langdomain = 'tortugaStrings'
@@ -64,7 +81,7 @@ class TortugaCli(metaclass=ABCMeta):
         # Locate the Internationalization stuff
         localedir = '../share/locale' \
             if os.path.exists('../share/locale') else \
-            os.path.join(self._cm.getRoot(), 'share/locale')
+            os.path.join(get_root(), 'share/locale')
 
         gettext.install(langdomain, localedir)
 
@@ -182,6 +199,9 @@ class TortugaCli(metaclass=ABCMeta):
         Implements the --config argument.
 
         """
+        from tortuga.scripts.tortuga.script import ConfigException, \
+            TortugaScriptConfig
+
         #
         # Load a config, filename may or may-not be provided...
         #
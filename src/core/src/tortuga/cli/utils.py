@@ -16,10 +16,7 @@ import argparse
 import json
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.objects.osInfo import OsInfo
 
 
 class ParseOperatingSystemArgAction(argparse.Action):
@@ -36,6 +33,8 @@ class ParseOperatingSystemArgAction(argparse.Action):
         version = osValues[1]
         arch = osValues[2]
 
+        from tortuga.objects.osInfo import OsInfo
+
         setattr(namespace, 'osInfo', OsInfo(name, version, arch))
 
 
@@ -99,4 +98,6 @@ def pretty_print(data: Any, fmt: Optional[str] = None) -> None:
         return
 
     # fallback to default
+    import yaml
+
     print(yaml.safe_dump(data, default_flow_style=False))
@@ -18,16 +18,8 @@ import shlex
 import socket
 from typing import Optional, Union
 
-from tortuga.objects.provisioningInfo import ProvisioningInfo
 from tortuga.utility.helper import str2bool
 
-# For encryption of sensitve data
-import base64
-import os
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-
 
 # Defaults.
 DEFAULT_TORTUGA_ROOT = '/opt/tortuga'
@@ -77,6 +69,8 @@ DEFAULT_TORTUGA_RELATIVE_REPOS_DIR = os.path.join(
 DEFAULT_TORTUGA_RELATIVE_KICKSTARTS_DIR = os.path.join(
     DEFAULT_TORTUGA_WWW_INTERNAL, 'kickstarts')
 DEFAULT_TORTUGA_ACTION_LOG = '/var/action-log'
+DEFAULT_TORTUGA_CLUSTER_UPDATE_WINDOW = 10.0
+DEFAULT_TORTUGA_REDIS_MAX_CONNECTIONS = 100
 
 DEFAULT_TORTUGA_PROFILE_NII_FILE = '/etc/profile.nii'
 DEFAULT_TORTUGA_RELEASE_FILE = os.path.join(
@@ -130,6 +124,14 @@ def getfqdn():
     return fqdn
 
 
+def get_root() -> str:
+    """
+    Return the tortuga root directory, without loading the configuration
+    (see ConfigManager.getRoot())
+    """
+    return os.environ.get('TORTUGA_ROOT', DEFAULT_TORTUGA_ROOT)
+
+
 def lookup_ipaddress(fqdn: str) -> str:
     aiInfo = socket.getaddrinfo(fqdn, None, socket.AF_INET, socket.SOCK_STREAM)
 
@@ -341,6 +343,8 @@ class ConfigManager(dict): \
         if not xmlstring:
             return
 
+        from tortuga.objects.provisioningInfo import ProvisioningInfo
+
         self['defaultProvisioningInfo'] = \
             ProvisioningInfo.getFromXml(xmlstring)
 
@@ -852,11 +856,64 @@ class ConfigManager(dict): \
 
         return str2bool(cfg.get('installer', 'offline_installation'))
 
+    def is_compact_event_storage(self) -> bool:
+        """
+        Return True if events should be stored as a single serialized blob,
+        rather than field by field.
+
+        """
+        cfg = self._get_cfg()
+
+        if not cfg.has_option('events', 'compact_storage'):
+            return False
+
+        return str2bool(cfg.get('events', 'compact_storage'))
+
+    def get_event_pubsub_backend(self) -> str:
+        """
+        Return the event pub/sub back-end, either "pubsub" (Redis pub/sub,
+        the default) or "streams" (Redis streams).
+
+        """
+        cfg = self._get_cfg()
+
+        return cfg.get('events', 'pubsub_backend', fallback='pubsub')
+
+    def get_cluster_update_window(self) -> float:
+        """
+        Return the number of seconds during which cluster update requests
+        are merged into a single cluster update.
+
+        """
+        cfg = self._get_cfg()
+
+        return cfg.getfloat(
+            'installer', 'cluster_update_window',
+            fallback=DEFAULT_TORTUGA_CLUSTER_UPDATE_WINDOW)
+
+    def get_redis_max_connections(self) -> int:
+        """
+        Return the maximum number of connections each process keeps open
+        to Redis.
+
+        """
+        cfg = self._get_cfg()
+
+        return cfg.getint(
+            'redis', 'max_connections',
+            fallback=DEFAULT_TORTUGA_REDIS_MAX_CONNECTIONS)
+
     def get_encryption_key(self, default='__internal__') -> bytes:
         """ return encryption key """
         # We do this on demand since it is an expensive operation and this method
         # is not used by most of the system
         if self.get('defaultEncryptionKey') is None:
+            # For encryption of sensitve data
+            import base64
+            from cryptography.hazmat.backends import default_backend
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
             # set encryption key
             password = self.getCfmPassword().encode()
             salt = b'salt_fixed'
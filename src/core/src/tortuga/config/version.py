@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from distutils.version import LooseVersion
-
-
 VERSION = '7.1.0+006'
 
 
 def version_is_compatible(version_string: str):
+    # distutils is slow to import, and rarely required
+    from distutils.version import LooseVersion
+
     return LooseVersion(VERSION) >= LooseVersion(version_string)
@@ -18,6 +18,8 @@ import logging
 import os
 from pathlib import Path
 import shutil
+import sys
+import tarfile
 
 from tortuga.config import version_is_compatible, VERSION
 from tortuga.exceptions.commandFailed import CommandFailed
@@ -25,6 +27,7 @@ from tortuga.exceptions.kitBuildError import KitBuildError
 from tortuga.logging import KIT_NAMESPACE
 from tortuga.os_utility.tortugaSubprocess import executeCommand
 
+from .compression import DEFAULT_COMPRESSION, get_compression
 from .metadata import KitMetadataSchema
 
 
@@ -33,6 +36,14 @@ logger = logging.getLogger(KIT_NAMESPACE)
 
 KIT_METADATA_FILE = 'kit.json'
 KIT_PACKAGE_NAME = 'tortuga_kits'
+KIT_REQUIREMENTS_FILE = 'requirements.txt'
+
+#
+# The directory, next to each requirements.txt file in the kit, containing
+# wheels for the requirements, so they can be installed without a package
+# index
+#
+WHEELHOUSE_DIR = 'wheelhouse'
 
 SRC_DIR = 'src'
 BUILD_DIR = 'build'
@@ -60,7 +71,10 @@ DEFAULT_EXCLUDE_FILES = [
 
 class KitBuilder(object):
     def __init__(self, working_directory: str = None, version: str = None,
-                 ignore_directory_version: bool = False):
+                 ignore_directory_version: bool = False,
+                 compression: str = DEFAULT_COMPRESSION,
+                 compression_workers: int = None,
+                 build_wheels: bool = True):
         """
         Initialization.
 
@@ -71,8 +85,24 @@ class KitBuilder(object):
                                               of x.y.z
         :param bool ignore_directory_version: don't move tortuga_kits/kitname
                                               to tortuga_kits/kitname_x_y_z
+        :param str compression:               the kit tarball compression
+                                              (bzip2, gzip, xz or zstd)
+        :param int compression_workers:       the number of compression
+                                              threads, defaults to the
+                                              number of CPUs
+        :param bool build_wheels:             build wheels for the kit
+                                              python requirements
 
         """
+        try:
+            self._compression = get_compression(compression)
+        except ValueError as ex:
+            raise KitBuildError(str(ex))
+
+        self._compression_workers = compression_workers
+
+        self._build_wheels = build_wheels
+
         if working_directory:
             os.chdir(working_directory)
 
@@ -338,6 +368,11 @@ class KitBuilder(object):
         self._build_python_package()
         self._copy_python_package(dist_dir, kit_build_dir)
 
+        #
+        # Build wheels for python requirements
+        #
+        self._build_requirements_wheels(build_kit_dest_dir)
+
         #
         # Generate kit tarball
         #
@@ -422,6 +457,72 @@ class KitBuilder(object):
 
         self._copy_file(python_whl_src_path, python_whl_dest_path)
 
+    def _build_requirements_wheels(self, build_kit_dest_dir):
+        """
+        Builds wheels for each requirements.txt file in the kit, into a
+        wheelhouse directory next to it. Kit installation uses these
+        wheels, rather than resolving the requirements against the package
+        index.
+
+        A requirements file for which the wheels cannot be built (e.g. a
+        requirement is only available from the installer package repo) is
+        skipped; the requirements are installed from the package index
+        instead.
+
+        :param build_kit_dest_dir: the kit package directory in the build
+                                   directory
+
+        """
+        if not self._build_wheels:
+            return
+
+        for base_path, directory_names, file_names in os.walk(
+                build_kit_dest_dir):
+            if WHEELHOUSE_DIR in directory_names:
+                directory_names.remove(WHEELHOUSE_DIR)
+
+            if KIT_REQUIREMENTS_FILE not in file_names:
+                continue
+
+            requirements_path = os.path.join(base_path,
+                                             KIT_REQUIREMENTS_FILE)
+            if not self._has_requirements(requirements_path):
+                continue
+
+            wheelhouse_path = os.path.join(base_path, WHEELHOUSE_DIR)
+
+            logger.info('Building wheels for {}...'.format(
+                requirements_path))
+
+            cmd = '{} -m pip wheel --quiet -r {} -w {}'.format(
+                sys.executable, requirements_path, wheelhouse_path)
+
+            try:
+                self._run_command(cmd)
+            except KitBuildError as ex:
+                logger.warning(
+                    'Unable to build wheels for {}, requirements will be'
+                    ' installed from the package index: {}'.format(
+                        requirements_path, ex))
+
+                if os.path.exists(wheelhouse_path):
+                    shutil.rmtree(wheelhouse_path)
+
+    @staticmethod
+    def _has_requirements(requirements_path):
+        """
+        Returns True if a requirements.txt file contains any requirements,
+        i.e. anything other than blank lines and comments.
+
+        """
+        with open(requirements_path) as fp:
+            for line in fp:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    return True
+
+        return False
+
     def _copy_puppet_modules(self, kit_build_dir):
         """
         Copies all puppet modules that were successfully built to the
@@ -464,18 +565,41 @@ class KitBuilder(object):
         """
         logger.info('Generating kit tarball...')
 
-        tarball_file_name = '{}.tar.bz2'.format(self._kit_descriptor)
+        tarball_file_name = '{}.tar.{}'.format(self._kit_descriptor,
+                                               self._compression.extension)
         tarball_path = os.path.abspath(
             os.path.join(dist_dir, tarball_file_name))
 
         logger.info('Tarball path: {}'.format(tarball_path))
 
-        cmd = 'tar -C {} -cjvf {} {}'.format(
-            BUILD_DIR,
-            tarball_path,
-            self._kit_descriptor
-        )
-        self._run_command(cmd)
+        #
+        # The metadata file is written as the first member of the archive,
+        # so that it can be read without decompressing the whole archive
+        #
+        metadata_arcname = os.path.join(self._kit_descriptor,
+                                        KIT_METADATA_FILE)
+
+        def exclude_metadata(tarinfo: tarfile.TarInfo):
+            if tarinfo.name == metadata_arcname:
+                return None
+            return tarinfo
+
+        try:
+            with self._compression.open_writer(
+                    tarball_path, workers=self._compression_workers) as fp, \
+                    tarfile.open(fileobj=fp, mode='w|') as tarball:
+                tarball.add(
+                    os.path.join(BUILD_DIR, metadata_arcname),
+                    arcname=metadata_arcname
+                )
+                tarball.add(
+                    os.path.join(BUILD_DIR, self._kit_descriptor),
+                    arcname=self._kit_descriptor,
+                    filter=exclude_metadata
+                )
+        except (OSError, tarfile.TarError) as ex:
+            raise KitBuildError(
+                'Error generating kit tarball: {}'.format(ex))
 
         return tarball_path
 
@@ -0,0 +1,423 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compression backends for kit archives.
+
+Archives are compressed as a sequence of independently compressed
+blocks (multiple bzip2/gzip/xz streams or zstd frames), which allows the
+blocks to be compressed in parallel while remaining readable by the
+standard command line tools and by the python standard library.
+
+"""
+
+import bz2
+import collections
+import gzip
+import logging
+import lzma
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+from tortuga.logging import KIT_NAMESPACE
+
+
+logger = logging.getLogger(KIT_NAMESPACE)
+
+
+DEFAULT_COMPRESSION = 'bzip2'
+
+#
+# The amount of uncompressed data compressed by each worker at a time
+#
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024
+
+#
+# The number of bytes required to detect the compression of a file
+#
+MAGIC_SIZE = 6
+
+
+class ParallelCompressedWriter:
+    """
+    A write-only file object that splits the data written to it into
+    blocks, compresses the blocks in parallel, and writes the compressed
+    blocks, in order, to the underlying file.
+
+    """
+    def __init__(self, fileobj: BinaryIO,
+                 compress: Callable[[bytes], bytes],
+                 block_size: int = DEFAULT_BLOCK_SIZE,
+                 workers: Optional[int] = None) -> None:
+        """
+        Initializer.
+
+        :param BinaryIO fileobj:  the file to write the compressed data to
+        :param Callable compress: compresses a block of data into a
+                                  complete, independent, stream
+        :param int block_size:    the size of the uncompressed blocks
+        :param int workers:       the number of compression threads,
+                                  defaults to the number of CPUs
+
+        """
+        self._fileobj = fileobj
+        self._compress = compress
+        self._block_size = block_size
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._buffer.extend(data)
+
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[:self._block_size])
+            del self._buffer[:self._block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(self._compress, block))
+
+        #
+        # Limit the number of blocks held in memory
+        #
+        while len(self._pending) > 2 * self._workers:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+
+        finally:
+            self._executor.shutdown()
+            self._fileobj.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PipeReader:
+    """
+    A read-only file object that reads the output of a decompression
+    command. The command runs in a separate process, so decompression
+    overlaps with whatever is done with the data that is read.
+
+    """
+    def __init__(self, cmd: List[str], path: str) -> None:
+        """
+        Initializer.
+
+        :param List[str] cmd: the decompression command, which reads from
+                              stdin and writes to stdout
+        :param str path:      the path to the compressed file
+
+        """
+        with open(path, 'rb') as fp:
+            self._proc = subprocess.Popen(cmd, stdin=fp,
+                                          stdout=subprocess.PIPE,
+                                          stderr=subprocess.PIPE)
+        self._eof = False
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._proc.stdout.read(size)
+        if size < 0 or (size and not data):
+            self._eof = True
+
+        return data
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+
+        if not self._eof:
+            #
+            # Stopped reading early, e.g. after finding the kit metadata
+            #
+            self._proc.kill()
+
+        self._proc.stdout.close()
+        stderr = self._proc.stderr.read()
+        self._proc.stderr.close()
+        returncode = self._proc.wait()
+
+        if self._eof and returncode:
+            raise OSError('Decompression failed: {}'.format(
+                stderr.decode(errors='replace').strip()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Compression:
+    """
+    Base class for kit archive compression backends.
+
+    """
+    #
+    # The name of the compression, as used on the command line
+    #
+    name: str = None
+
+    #
+    # The file name extension for archives, i.e. kit-x-y-z.tar.<ext>
+    #
+    extension: str = None
+
+    #
+    # The bytes at the start of a compressed file
+    #
+    magic: bytes = None
+
+    #
+    # Decompression commands to use, in order of preference, if they are
+    # installed. Each command reads from stdin and writes to stdout.
+    #
+    decompress_commands: List[List[str]] = []
+
+    def is_available(self) -> bool:
+        """
+        Returns True if this compression is supported on this system.
+
+        """
+        return True
+
+    def compress_block(self, block: bytes) -> bytes:
+        """
+        Compresses a block of data into a complete, independent, stream.
+
+        :param bytes block: the data to compress
+
+        :return bytes: the compressed data
+
+        """
+        raise NotImplementedError()
+
+    def open_stdlib_reader(self, path: str) -> BinaryIO:
+        """
+        Opens a compressed file for reading without using an external
+        command.
+
+        :param str path: the path to the compressed file
+
+        :return BinaryIO: the decompressed file object
+
+        """
+        raise NotImplementedError()
+
+    def open_writer(self, path: str,
+                    workers: Optional[int] = None) -> BinaryIO:
+        """
+        Opens a compressed file for writing.
+
+        :param str path:    the path to the compressed file
+        :param int workers: the number of compression threads
+
+        :return BinaryIO: a file object that compresses the data written
+                          to it
+
+        """
+        return ParallelCompressedWriter(open(path, 'wb'),
+                                        self.compress_block,
+                                        workers=workers)
+
+    def open_reader(self, path: str) -> BinaryIO:
+        """
+        Opens a compressed file for reading.
+
+        :param str path: the path to the compressed file
+
+        :return BinaryIO: the decompressed file object
+
+        """
+        for cmd in self.decompress_commands:
+            if shutil.which(cmd[0]):
+                logger.debug('Decompressing {} using {}'.format(
+                    path, cmd[0]))
+                return PipeReader(cmd, path)
+
+        return self.open_stdlib_reader(path)
+
+
+class Bzip2Compression(Compression):
+    name = 'bzip2'
+    extension = 'bz2'
+    magic = b'BZh'
+    decompress_commands = [
+        ['lbzip2', '-d', '-c'],
+        ['pbzip2', '-d', '-c'],
+        ['bzip2', '-d', '-c'],
+    ]
+
+    def compress_block(self, block: bytes) -> bytes:
+        return bz2.compress(block)
+
+    def open_stdlib_reader(self, path: str) -> BinaryIO:
+        return bz2.open(path, 'rb')
+
+
+class GzipCompression(Compression):
+    name = 'gzip'
+    extension = 'gz'
+    magic = b'\x1f\x8b'
+    decompress_commands = [
+        ['pigz', '-d', '-c'],
+        ['gzip', '-d', '-c'],
+    ]
+
+    def compress_block(self, block: bytes) -> bytes:
+        return gzip.compress(block)
+
+    def open_stdlib_reader(self, path: str) -> BinaryIO:
+        return gzip.open(path, 'rb')
+
+
+class XzCompression(Compression):
+    name = 'xz'
+    extension = 'xz'
+    magic = b'\xfd7zXZ\x00'
+    decompress_commands = [
+        ['xz', '-d', '-c', '-T0'],
+    ]
+
+    def compress_block(self, block: bytes) -> bytes:
+        return lzma.compress(block)
+
+    def open_stdlib_reader(self, path: str) -> BinaryIO:
+        return lzma.open(path, 'rb')
+
+
+class ZstdCompression(Compression):
+    """
+    zstd compression, using the optional zstandard package.
+
+    """
+    name = 'zstd'
+    extension = 'zst'
+    magic = b'\x28\xb5\x2f\xfd'
+    decompress_commands = [
+        ['zstd', '-d', '-c', '-q'],
+    ]
+
+    def is_available(self) -> bool:
+        try:
+            import zstandard  # noqa pylint: disable=unused-variable
+        except ImportError:
+            return False
+
+        return True
+
+    def compress_block(self, block: bytes) -> bytes:
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(block)
+
+    def open_stdlib_reader(self, path: str) -> BinaryIO:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(
+            open(path, 'rb'), read_across_frames=True)
+
+
+COMPRESSIONS: Dict[str, Compression] = {
+    compression.name: compression for compression in [
+        Bzip2Compression(),
+        GzipCompression(),
+        XzCompression(),
+        ZstdCompression(),
+    ]
+}
+
+
+def get_compression(name: str) -> Compression:
+    """
+    Gets a compression backend by name.
+
+    :param str name: the name of the compression
+
+    :return Compression: the compression backend
+
+    :raises ValueError: if the compression is unknown or not available
+
+    """
+    compression = COMPRESSIONS.get(name)
+    if compression is None:
+        raise ValueError('Unsupported compression: {}'.format(name))
+
+    if not compression.is_available():
+        raise ValueError('Compression not available: {}'.format(name))
+
+    return compression
+
+
+def detect_compression(path: str) -> Optional[Compression]:
+    """
+    Detects the compression of a file from its first few bytes.
+
+    :param str path: the path to the file
+
+    :return Compression: the compression backend, or None if the file is
+                         not compressed with a supported compression
+
+    """
+    with open(path, 'rb') as fp:
+        magic = fp.read(MAGIC_SIZE)
+
+    for compression in COMPRESSIONS.values():
+        if magic.startswith(compression.magic):
+            return compression
+
+    return None
+
+
+def open_archive_reader(path: str) -> BinaryIO:
+    """
+    Opens a (possibly compressed) archive for reading, detecting the
+    compression used.
+
+    :param str path: the path to the archive
+
+    :return BinaryIO: the decompressed file object
+
+    """
+    compression = detect_compression(path)
+    if compression is None:
+        return open(path, 'rb')
+
+    return compression.open_reader(path)
@@ -30,6 +30,7 @@ OBJECT_STORE_NAMESPACE      = '{}.objectstore'.format(ROOT_NAMESPACE)
 OS_NAMESPACE                = '{}.os'.format(ROOT_NAMESPACE)
 PARAMETERS_NAMESPACE        = '{}.parameters'.format(ROOT_NAMESPACE)
 PUPPET_NAMESPACE            = '{}.puppet'.format(ROOT_NAMESPACE)
+REDIS_NAMESPACE             = '{}.redis'.format(ROOT_NAMESPACE)
 REPO_NAMESPACE              = '{}.repo'.format(ROOT_NAMESPACE)
 RESOURCE_ADAPTER_NAMESPACE  = '{}.resourceadapter'.format(ROOT_NAMESPACE)
 SAN_NAMESPACE               = '{}.san'.format(ROOT_NAMESPACE)
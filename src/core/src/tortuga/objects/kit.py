@@ -101,7 +101,12 @@ class Kit(TortugaObject): \
 
     def getTarBz2FileName(self):
         """ Return .tar.bz2 file for this kit. """
-        return 'kit-%s-%s.tar.bz2' % (self.get('name'), self.getDbVersion())
+        return self.getArchiveFileName('bz2')
+
+    def getArchiveFileName(self, extension):
+        """ Return .tar.<extension> file for this kit. """
+        return 'kit-%s-%s.tar.%s' % (
+            self.get('name'), self.getDbVersion(), extension)
 
     def getDirName(self):
         """ Return unpacked directory name for this kit. """
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import errno
+import hashlib
+import json
 import platform
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from tortuga.objects.osInfo import OsInfo
 from tortuga.exceptions.unsupportedOperatingSystem \
@@ -241,6 +246,327 @@ def make_symlink_farm(src, dst):
                 os.symlink(target, link)
 
 
+#
+# ioctl(2) request to clone (reflink) a file on filesystems that support
+# it (btrfs, xfs, ...); from linux/fs.h
+#
+FICLONE = 0x40049409
+
+
+def files_match(src, dst):
+    """
+    Returns True if dst is the same file as src, or is a copy of it
+    (i.e. has the same size and modification time).
+
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+
+    if (src_stat.st_dev, src_stat.st_ino) == \
+            (dst_stat.st_dev, dst_stat.st_ino):
+        return True
+
+    return src_stat.st_size == dst_stat.st_size and \
+        src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+
+def _reflink(src_fp, dst_fp):
+    """
+    Clones the contents of one file into another, sharing the data
+    blocks. Raises OSError if the filesystem does not support it.
+
+    """
+    import fcntl
+
+    fcntl.ioctl(dst_fp.fileno(), FICLONE, src_fp.fileno())
+
+
+def _sendfile(src_fp, dst_fp):
+    """
+    Copies the contents of one file into another without copying the
+    data through user space.
+
+    """
+    size = os.fstat(src_fp.fileno()).st_size
+    offset = 0
+
+    while offset < size:
+        sent = os.sendfile(dst_fp.fileno(), src_fp.fileno(), offset,
+                           size - offset)
+        if not sent:
+            break
+
+        offset += sent
+
+
+def copy_file(src, dst, hardlink=True):
+    """
+    Copies a file, unless the destination is already a copy of it (see
+    files_match()). The file is hard linked if hardlink is True and both
+    paths are on the same filesystem; otherwise the contents are cloned
+    (reflink), or copied in the kernel (sendfile), falling back to a
+    regular copy. The modification time is preserved, so the copy can be
+    skipped next time.
+
+    The destination is replaced atomically.
+
+    :param src:      the source file path
+    :param dst:      the destination file path
+    :param hardlink: hard link the file, if possible
+
+    :return: True if the file was copied, False if it was already up to
+             date
+
+    """
+    if files_match(src, dst):
+        return False
+
+    tmp_path = '{}.{}.{}.tmp'.format(dst, os.getpid(),
+                                     threading.get_ident())
+
+    removeFile(tmp_path)
+
+    try:
+        linked = False
+
+        if hardlink:
+            try:
+                os.link(src, tmp_path)
+                linked = True
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.EPERM,
+                                     errno.EMLINK, errno.ENOTSUP):
+                    raise
+
+        if not linked:
+            with open(src, 'rb') as src_fp, open(tmp_path, 'wb') as dst_fp:
+                try:
+                    _reflink(src_fp, dst_fp)
+                except (OSError, ImportError):
+                    try:
+                        _sendfile(src_fp, dst_fp)
+                    except OSError:
+                        dst_fp.seek(0)
+                        dst_fp.truncate()
+                        src_fp.seek(0)
+                        shutil.copyfileobj(src_fp, dst_fp, 1024 * 1024)
+
+            shutil.copystat(src, tmp_path)
+
+        os.replace(tmp_path, dst)
+
+    except BaseException:
+        removeFile(tmp_path)
+        raise
+
+    return True
+
+
+DEFAULT_COPY_WORKERS = 8
+
+
+def file_sha256(path):
+    """ Return the SHA-256 hex digest of a file. """
+    sha256 = hashlib.sha256()
+
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b''):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+#
+# The file, in a content-addressed store, caching the digests of source
+# files, so that unchanged files are not hashed again
+#
+DIGEST_CACHE_FILE = '.digests.json'
+
+
+def _load_digest_cache(store):
+    """
+    Loads the source file digest cache of a content-addressed store.
+
+    :return: dict of source path to [size, mtime_ns, digest]
+
+    """
+    try:
+        with open(os.path.join(store, DIGEST_CACHE_FILE)) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_digest_cache(store, digests):
+    tmp_path = os.path.join(
+        store, '{}.{}.tmp'.format(DIGEST_CACHE_FILE, os.getpid()))
+
+    with open(tmp_path, 'w') as fp:
+        json.dump(digests, fp)
+
+    os.replace(tmp_path, os.path.join(store, DIGEST_CACHE_FILE))
+
+
+def _get_digest(src, digests):
+    """
+    Gets the SHA-256 digest of a file, using the cached digest if the
+    file has not changed since it was hashed.
+
+    """
+    st = os.stat(src)
+
+    cached = digests.get(src)
+    if cached and cached[:2] == [st.st_size, st.st_mtime_ns]:
+        return cached[2]
+
+    digest = file_sha256(src)
+    digests[src] = [st.st_size, st.st_mtime_ns, digest]
+
+    return digest
+
+
+def _content_addressed_copy(src, dst, store, hardlink, digests):
+    """
+    Copies a file into a content-addressed store (unless it is already
+    there), and links (or clones) the stored file to dst.
+
+    :return: 'skipped', 'linked' or 'copied'
+
+    """
+    if files_match(src, dst):
+        return 'skipped'
+
+    digest = _get_digest(src, digests)
+    object_path = os.path.join(store, digest[:2], digest)
+
+    result = 'linked'
+
+    if os.path.exists(object_path):
+        #
+        # dst is already a hard link to the stored file, i.e. one of
+        # several identical files with different modification times
+        #
+        if os.path.exists(dst) and os.path.samefile(object_path, dst):
+            return 'skipped'
+    else:
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+
+        #
+        # Identical files may be copied concurrently: the first copy
+        # linked into the store is kept, the others are discarded
+        #
+        tmp_path = '{}.{}.{}.tmp'.format(object_path, os.getpid(),
+                                         threading.get_ident())
+
+        try:
+            copy_file(src, tmp_path, hardlink=False)
+
+            try:
+                os.link(tmp_path, object_path)
+            except OSError as exc:
+                if exc.errno not in (errno.EPERM, errno.ENOTSUP):
+                    raise
+
+                #
+                # No hard link support; the last copy wins
+                #
+                os.replace(tmp_path, object_path)
+
+            result = 'copied'
+        except FileExistsError:
+            pass
+        finally:
+            removeFile(tmp_path)
+
+    copy_file(object_path, dst, hardlink=hardlink)
+
+    if not os.path.samefile(object_path, dst):
+        #
+        # Clones and copies get the times of the source file, so they are
+        # skipped next time
+        #
+        src_stat = os.stat(src)
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+    return result
+
+
+def content_addressed_copytree(src, dst, store, hardlink=True,
+                               workers=DEFAULT_COPY_WORKERS):
+    """
+    Copies a directory tree, storing each file once in a
+    content-addressed store (by SHA-256), and exposing it in the
+    destination as a hard link to the stored file, or as a reflink if
+    hardlink is False or the store is on another filesystem (falling back
+    to a copy where reflinks are not supported). Identical files, e.g.
+    packages shared by OS point releases, are only stored once.
+
+    Files are copied in parallel. Files in the destination that are
+    already up to date (same size and modification time, or already
+    linked to the stored file) are skipped, and the digests of unchanged
+    source files are cached in the store, so copying the same tree again
+    is incremental. Symbolic links are copied as symbolic links.
+
+    :param src:      the source directory
+    :param dst:      the destination directory
+    :param store:    the content-addressed store directory
+    :param hardlink: expose stored files through hard links
+    :param workers:  the maximum number of files copied concurrently
+
+    :return: dict of the number of files 'copied' into the store,
+             'linked' to a file already in the store, and 'skipped'
+
+    """
+    src = os.path.abspath(src)
+    dst = os.path.abspath(dst)
+
+    if not os.path.isdir(src):
+        raise FileNotFound("Source directory does not exist!")
+
+    createDir(store)
+
+    stats = {'copied': 0, 'linked': 0, 'skipped': 0}
+
+    digests = _load_digest_cache(store)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+
+        for root, dirs, files in os.walk(src):
+            dst_root = os.path.join(dst, os.path.relpath(root, src))
+
+            createDir(dst_root)
+
+            for name in dirs + files:
+                src_path = os.path.join(root, name)
+                dst_path = os.path.join(dst_root, name)
+
+                if os.path.islink(src_path):
+                    target = os.readlink(src_path)
+                    if os.path.islink(dst_path) and \
+                            os.readlink(dst_path) == target:
+                        continue
+
+                    removeFile(dst_path)
+                    os.symlink(target, dst_path)
+
+                elif name in files:
+                    futures.append(executor.submit(
+                        _content_addressed_copy, src_path, dst_path, store,
+                        hardlink, digests))
+
+        try:
+            for future in futures:
+                stats[future.result()] += 1
+        finally:
+            _save_digest_cache(store, digests)
+
+    return stats
+
+
 BACKUP_FILE_SUFFIX = '.UCBAK'
 
 
@@ -20,9 +20,6 @@ import argparse
 from typing import List, Dict, Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.resourceAdapterConfigurationWsApi \
-    import ResourceAdapterConfigurationWsApi
-from tortuga.wsapi.resourceAdapterWsApi import ResourceAdapterWsApi
 from tortuga.exceptions.tortugaException import TortugaException
 from tortuga.exceptions.resourceAdapterNotFound \
     import ResourceAdapterNotFound
@@ -183,6 +180,9 @@ class AdapterMgmtCLI(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.resourceAdapterConfigurationWsApi \
+            import ResourceAdapterConfigurationWsApi
+
         self.parseArgs(usage='Manage Tortuga resource adapter configuration')
 
         args = self.getParser().parse_args()
@@ -357,6 +357,9 @@ class AdapterMgmtCLI(TortugaCli):
                          if found otherwise None
 
         """
+
+        from tortuga.wsapi.resourceAdapterWsApi import ResourceAdapterWsApi
+
         ra_api = self.configureClient(ResourceAdapterWsApi)
         ra_list = ra_api.getResourceAdapterList()
         for ra in ra_list:
@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.admin import AdminCli
-from tortuga.wsapi import adminWsApi
 
 
 class AddAdminCli(AdminCli):
@@ -43,6 +42,8 @@ class AddAdminCli(AdminCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi import adminWsApi
+
         self.parseArgs(_('Add administrative users to the Tortuga system.'
                          ' This user does not need to match any operating'
                          ' system user'))
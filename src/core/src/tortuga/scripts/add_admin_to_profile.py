@@ -16,8 +16,6 @@
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class AddAdminToProfileCli(TortugaCli):
@@ -52,6 +50,9 @@ class AddAdminToProfileCli(TortugaCli):
             help=_('Admin username'))
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Associates an existing adminstrative user with a hardware or software profile.
 """))
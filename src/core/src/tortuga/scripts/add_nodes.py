@@ -25,7 +25,6 @@ from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.cli.utils import parse_tags
 from tortuga.exceptions.httpErrorException import HttpErrorException
 from tortuga.exceptions.urlErrorException import UrlErrorException
-from tortuga.wsapi.addHostWsApi import AddHostWsApi
 
 
 class AddNodes(TortugaCli): \
@@ -136,6 +135,8 @@ class AddNodes(TortugaCli): \
         super(AddNodes, self).parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.addHostWsApi import AddHostWsApi
+
         self.parseArgs()
 
         # Validate options
@@ -15,8 +15,6 @@
 import argparse
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.nodeWsApi import NodeWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class ComponentCli(TortugaCli):
@@ -110,6 +108,8 @@ class ComponentCli(TortugaCli):
         # Get the given software profile information
         self.software_profile_name = self.__get_software_profile_name()
 
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.software_profile_api = self.configureClient(SoftwareProfileWsApi)
 
     def getKitNameVersionIteration(self, pkgname):
@@ -138,6 +138,8 @@ class ComponentCli(TortugaCli):
         if not provided.
         """
 
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         if self.getArgs().applyToInstaller:
             nodeApi = self.configureClient(NodeWsApi)
             node = nodeApi.getInstallerNode(optionDict={
@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli import tortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
 
 
 class CopyHardwareProfileCli(tortugaCli.TortugaCli):
@@ -39,6 +38,8 @@ class CopyHardwareProfileCli(tortugaCli.TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         self.parseArgs(_('Copy an existing hardware profile'))
 
         api = self.configureClient(HardwareProfileWsApi)
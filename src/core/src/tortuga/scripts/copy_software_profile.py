@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli import tortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class CopySoftwareProfileCli(tortugaCli.TortugaCli):
@@ -39,6 +38,8 @@ class CopySoftwareProfileCli(tortugaCli.TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_('Copy an existing software profile'))
 
         api = self.configureClient(SoftwareProfileWsApi)
@@ -24,7 +24,6 @@ from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
 from tortuga.exceptions.invalidProfileCreationTemplate import \
     InvalidProfileCreationTemplate
 from tortuga.objects.hardwareProfile import HardwareProfile
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
 
 
 class CreateHardwareProfileCli(TortugaCli):
@@ -79,6 +78,8 @@ class CreateHardwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         self.parseArgs()
 
         if self.getArgs().name and self.getArgs().deprecated_name:
@@ -25,7 +25,6 @@ from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
 from tortuga.exceptions.invalidProfileCreationTemplate import \
     InvalidProfileCreationTemplate
 from tortuga.objects.softwareProfile import SoftwareProfile
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class CreateSoftwareProfileCli(TortugaCli):
@@ -105,6 +104,8 @@ class CreateSoftwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_('Create software profile'))
 
         if self.getArgs().name and self.getArgs().deprecated_name:
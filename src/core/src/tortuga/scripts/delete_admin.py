@@ -13,7 +13,6 @@
 # limitations under the License.
 
 from tortuga.cli.admin import AdminCli
-from tortuga.wsapi.adminWsApi import AdminWsApi
 
 
 class DeleteAdminCli(AdminCli):
@@ -29,6 +28,8 @@ class DeleteAdminCli(AdminCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.adminWsApi import AdminWsApi
+
         self.parseArgs(_('Deletes administrative user from Tortuga'))
 
         api = self.configureClient(AdminWsApi)
@@ -15,8 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
 
 
@@ -53,6 +51,9 @@ class DeleteAdminFromProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Removes association between an existing adminstrative user and hardware or
 software profile.
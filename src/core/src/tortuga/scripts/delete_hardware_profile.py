@@ -16,7 +16,6 @@ import argparse
 from typing import Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
 
 
 class DeleteHardwareProfileCli(TortugaCli):
@@ -36,6 +35,8 @@ class DeleteHardwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         self.parseArgs(_('Removes hardware profile from system.'))
 
         if not self.getArgs().name and \
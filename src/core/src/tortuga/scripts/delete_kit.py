@@ -14,7 +14,6 @@
 
 from typing import Optional
 from tortuga.kit.kitCli import KitCli
-from tortuga.wsapi.kitWsApi import KitWsApi
 
 
 class DeleteKitCli(KitCli):
@@ -36,6 +35,8 @@ class DeleteKitCli(KitCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.kitWsApi import KitWsApi
+
         self.parseArgs(_("""
 Delete installed operating system or application kit from Tortuga.
 """))
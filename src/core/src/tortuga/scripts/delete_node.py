@@ -19,7 +19,6 @@ import itertools
 import sys
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class DeleteNodeCli(TortugaCli):
@@ -50,6 +49,8 @@ class DeleteNodeCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         node_api = self.configureClient(NodeWsApi)
@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class DeleteProfileMappingCli(TortugaCli):
@@ -44,6 +43,8 @@ class DeleteProfileMappingCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Adjust "software uses hardware" attribute on a software  profile.
 """))
@@ -16,7 +16,6 @@ import argparse
 from typing import Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class DeleteSoftwareProfileCli(TortugaCli):
@@ -36,6 +35,8 @@ class DeleteSoftwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_('Removes software profile from system.'))
 
         if not self.getArgs().name and \
@@ -19,7 +19,6 @@ import xml.etree.cElementTree as ET
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.config.configManager import ConfigManager, getfqdn
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class GenerateNiiProfileCli(TortugaCli):
@@ -43,6 +42,8 @@ class GenerateNiiProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         installer = self.getArgs().installer
@@ -14,7 +14,6 @@
 
 import json
 from tortuga.cli.admin import AdminCli
-from tortuga.wsapi.adminWsApi import AdminWsApi
 
 
 class GetAdminCli(AdminCli):
@@ -45,6 +44,8 @@ class GetAdminCli(AdminCli):
         super(GetAdminCli, self).parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.adminWsApi import AdminWsApi
+
         self.parseArgs(_("""
 Returns admin user from the Tortuga system.
 """))
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 from tortuga.cli.admin import AdminCli
-from tortuga.wsapi.adminWsApi import AdminWsApi
 
 
 class GetAdminListCli(AdminCli):
@@ -26,6 +25,8 @@ class GetAdminListCli(AdminCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.adminWsApi import AdminWsApi
+
         self.parseArgs(_("""
 Return list of administrators in the Tortuga system.
 """))
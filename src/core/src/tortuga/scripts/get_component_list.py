@@ -17,9 +17,6 @@ import gettext
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.helper.osHelper import getOsInfo
-from tortuga.wsapi.kitWsApi import KitWsApi
-from tortuga.wsapi.nodeWsApi import NodeWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 _ = gettext.gettext
 
@@ -63,6 +60,8 @@ class GetComponentList(TortugaCli):
     def __get_software_profile(self):
         # Determine software profile name based on command-line option(s)
 
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         if self.getArgs().applyToInstaller:
             api = self.configureClient(NodeWsApi)
             # Get software profile name from installer node
@@ -77,6 +76,9 @@ class GetComponentList(TortugaCli):
         return self.getArgs().softwareprofile
 
     def runCommand(self):
+        from tortuga.wsapi.kitWsApi import KitWsApi
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Display list of components available for software profiles in the system.
 """))
@@ -26,7 +26,6 @@ Description:
 import yaml
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class GetComponentNodeListCli(TortugaCli):
@@ -48,6 +47,8 @@ class GetComponentNodeListCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs()
 
         comp_name = self.getArgs().component
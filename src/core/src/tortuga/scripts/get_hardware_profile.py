@@ -19,7 +19,6 @@ import json
 from typing import Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
 
 
 class GetHardwareProfileCli(TortugaCli):
@@ -73,6 +72,8 @@ class GetHardwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         self.parseArgs(usage=_('Display hardware profile details'))
 
         if not self.getArgs().name and not self.getArgs().deprecated_name:
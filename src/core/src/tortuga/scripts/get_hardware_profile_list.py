@@ -13,7 +13,6 @@
 # limitations under the License.
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
 from tortuga.cli.utils import FilterTagsAction
 
 
@@ -29,6 +28,8 @@ class GetHardwareProfileListCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         self.parseArgs(_('Returns the list of hardware profiles in the'
                          ' system'))
 
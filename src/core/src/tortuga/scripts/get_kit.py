@@ -19,7 +19,6 @@ import sys
 
 from tortuga.exceptions.kitNotFound import KitNotFound
 from tortuga.kit.kitCli import KitCli
-from tortuga.wsapi.kitWsApi import KitWsApi
 
 
 class GetKitCli(KitCli):
@@ -55,6 +54,8 @@ class GetKitCli(KitCli):
         super(GetKitCli, self).parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.kitWsApi import KitWsApi
+
         self.parseArgs(_("""
 Returns details of the specified kit
 """))
@@ -15,7 +15,6 @@
 from typing import Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.kitWsApi import KitWsApi
 
 
 class GetKitListCli(TortugaCli):
@@ -35,6 +34,8 @@ class GetKitListCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.kitWsApi import KitWsApi
+
         self.parseArgs(usage=_("""
 Returns the list of kits available in the system.
 """))
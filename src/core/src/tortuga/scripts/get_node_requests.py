@@ -19,7 +19,6 @@ import json
 import sys
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class GetNodeRequestsCli(TortugaCli):
@@ -34,6 +33,8 @@ class GetNodeRequestsCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         self.node_wsapi = self.configureClient(NodeWsApi)
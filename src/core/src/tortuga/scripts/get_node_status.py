@@ -15,12 +15,11 @@
 # pylint: disable=no-member
 
 import sys
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.cli.utils import FilterTagsAction
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class GetNodeStatus(TortugaCli): \
@@ -113,6 +112,8 @@ class GetNodeStatus(TortugaCli): \
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         options = self.getArgs()
@@ -123,11 +124,38 @@ class GetNodeStatus(TortugaCli): \
                 ' mutually exclusive'
             )
 
+        states: Optional[List[str]] = None
+        exclude_states: List[str] = []
+
+        if options.bInstalled:
+            states = ['Installed']
+        elif options.state:
+            states = [options.state]
+
+        if options.bNotInstalled:
+            exclude_states.append('Installed')
+
+        if not options.showAll:
+            exclude_states.append('Deleted')
+
+        # Only request the node attributes required for the output
+        fields: List[str] = [
+            'name', 'state', 'softwareprofile.name', 'hardwareprofile.name',
+        ]
+
+        if not options.bShortOutput and not options.bListOutput:
+            fields.extend(['lockedState', 'bootFrom', 'nics.ip'])
+
         api = self.configureClient(NodeWsApi)
         nodes: List[Dict[str, Any]] = [
             dict(x)
-            for x in api.getNodeList(nodespec=options.nodeName,
-                                     tags=options.tags)]
+            for x in api.iterNodeList(nodespec=options.nodeName,
+                                      tags=options.tags,
+                                      states=states,
+                                      exclude_states=exclude_states,
+                                      softwareprofile=options.softwareProfile,
+                                      hardwareprofile=options.hardwareProfile,
+                                      fields=fields)]
 
         if not nodes:
             if options.nodeName:
@@ -136,24 +164,6 @@ class GetNodeStatus(TortugaCli): \
 
             sys.exit(1)
 
-        if options.bInstalled:
-            nodes = self.__filter_nodes(nodes, 'state', 'Installed')
-
-        if options.bNotInstalled:
-            nodes = self.__filter_nodes(nodes, 'state', 'Installed', True)
-
-        if options.state:
-            nodes = self.__filter_nodes(nodes, 'state', options.state)
-
-        if options.softwareProfile:
-            nodes = self.__filter_nodes(nodes, ['softwareprofile', 'name'], options.softwareProfile)
-
-        if options.hardwareProfile:
-            nodes = self.__filter_nodes(nodes, ['hardwareprofile', 'name'], options.hardwareProfile)
-
-        if not options.showAll:
-            nodes = self.__filter_nodes(nodes, 'state', 'Deleted', True)
-
         grouped: Dict[str, List[Dict[str, Any]]] = self.__group_nodes(nodes, options.bByHardwareProfile)
 
         if options.bShortOutput:
@@ -166,32 +176,6 @@ class GetNodeStatus(TortugaCli): \
         if output:
             print(output)
 
-    @staticmethod
-    def __filter_nodes(nodes: List[Dict[str, Any]], filter_key: Union[List[str], str], filter_value: Any,
-                       if_not: bool = False) -> List[Dict[str, Any]]:
-        """
-        Filter from nodes list (list
-        is mutated, thus not returned).
-
-        :param nodes: List
-        :param filter_key: List or String
-        :param filter_value: Object
-        :param if_not: Boolean
-        :return: None
-        """
-        filtered: list = []
-
-        for node in nodes:
-            if type(filter_key) is str:
-                result: bool = node[filter_key] == filter_value
-            else:
-                result: bool = node[filter_key[0]][filter_key[1]] == filter_value
-
-            if not result == if_not:  # Switches based on `if_not`.
-                filtered.append(node)
-
-        return filtered
-
     @staticmethod
     def __group_nodes(nodes: List[Dict[str, Any]], by_hardware_profile: bool) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -21,11 +21,12 @@ Used by Puppet
 import yaml
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.networkWsApi import NetworkWsApi
 
 
 class GetProvisioningNetworks(TortugaCli):
     def runCommand(self):
+        from tortuga.wsapi.networkWsApi import NetworkWsApi
+
         self.parseArgs(_('Returns a YAML list of provisioning networks'))
 
         api = self.configureClient(NetworkWsApi)
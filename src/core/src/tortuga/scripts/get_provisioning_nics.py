@@ -18,8 +18,6 @@ import sys
 import yaml
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class GetProvisioningNicsApp(TortugaCli):
@@ -37,6 +35,9 @@ class GetProvisioningNicsApp(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         if self.getArgs().hardwareProfile:
@@ -15,7 +15,6 @@
 import yaml
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.resourceAdapterWsApi import ResourceAdapterWsApi
 
 
 class GetResourceAdapterListCli(TortugaCli):
@@ -34,6 +33,8 @@ class GetResourceAdapterListCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.resourceAdapterWsApi import ResourceAdapterWsApi
+
         self.parseArgs()
 
         api = self.configureClient(ResourceAdapterWsApi)
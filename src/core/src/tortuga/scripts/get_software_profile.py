@@ -19,8 +19,6 @@ import json
 from typing import Optional
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class GetSoftwareProfileCli(TortugaCli):
@@ -97,6 +95,8 @@ class GetSoftwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(usage=_('Displays software profile details'))
 
         if not self.getArgs().name and not self.getArgs().deprecated_name:
@@ -146,6 +146,8 @@ class GetSoftwareProfileCli(TortugaCli):
             self.__console_output(swprofile)
 
     def __console_output(self, swprofile):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+
         hwprofiles = []
 
         hwprofileapi = self.configureClient(HardwareProfileWsApi)
@@ -14,7 +14,6 @@
 
 import argparse
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 from tortuga.cli.utils import FilterTagsAction
 
 
@@ -30,6 +29,8 @@ class GetSoftwareProfileListCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_('Return list of software profiles configured in'
                          ' the system'))
 
@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class GetSoftwareProfileNodesCli(TortugaCli):
@@ -40,6 +39,8 @@ class GetSoftwareProfileNodesCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Return list of nodes that are using the specified software profile.
 """))
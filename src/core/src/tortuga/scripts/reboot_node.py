@@ -16,7 +16,6 @@
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class RebootNodeCli(TortugaCli):
@@ -37,6 +36,8 @@ class RebootNodeCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs(_("""
 Reboots specified node(s). Mark nodes for reinstallation if --reinstall
 flag is specified.
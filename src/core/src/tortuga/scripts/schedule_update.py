@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi.syncWsApi import SyncWsApi
 
 
 class ScheduleUpdateCli(TortugaCli):
@@ -34,6 +33,8 @@ class ScheduleUpdateCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.syncWsApi import SyncWsApi
+
         self.parseArgs()
 
         api = self.configureClient(SyncWsApi)
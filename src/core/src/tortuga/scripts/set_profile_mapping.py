@@ -17,7 +17,6 @@
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.exceptions.softwareUsesHardwareAlreadyExists \
     import SoftwareUsesHardwareAlreadyExists
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class SetProfileMappingCli(TortugaCli):
@@ -47,6 +46,8 @@ class SetProfileMappingCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(_("""
 Multiple software profiles can be mapped to a single hardware profile to
 accomodate a consistent software stack across mulitple resource adapters,
@@ -16,7 +16,6 @@
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class ShutdownNodeCli(TortugaCli):
@@ -30,6 +29,8 @@ class ShutdownNodeCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs(_('Shuts down the given node'))
 
         api = self.configureClient(NodeWsApi)
@@ -16,7 +16,6 @@
 
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
-from tortuga.wsapi.nodeWsApi import NodeWsApi
 
 
 class StartupNodeCli(TortugaCli):
@@ -42,6 +41,8 @@ class StartupNodeCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         # Turn user input into a list
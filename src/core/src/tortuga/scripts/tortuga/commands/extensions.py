@@ -18,8 +18,6 @@ import subprocess
 from typing import List
 from xml.etree.ElementTree import ElementTree
 
-import requests
-
 from tortuga.cli.base import RootCommand, Command, Argument
 from tortuga.cli.utils import pretty_print
 from tortuga.config.configManager import ConfigManager
@@ -148,6 +146,8 @@ def get_available_extensions(args: argparse.Namespace,
     :return List[str]: the list of available extensions
 
     """
+    import requests
+
     installer = get_installer(config)
     r = requests.get(get_python_package_repo(installer))
     if r.status_code != 200:
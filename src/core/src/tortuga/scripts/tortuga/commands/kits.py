@@ -15,7 +15,6 @@
 import argparse
 
 from tortuga.cli.base import Argument, Command, RootCommand
-from tortuga.kit.builder import KitBuilder
 
 
 class BuildCommand(Command):
@@ -36,15 +35,41 @@ class BuildCommand(Command):
             action='store_true',
             default=False,
             help='Do not rename package to tortuga_kits/<name>_<version>'
+        ),
+        Argument(
+            '-c', '--compression',
+            dest='compression',
+            choices=['bzip2', 'gzip', 'xz', 'zstd'],
+            default='bzip2',
+            help='Kit tarball compression (default: bzip2)'
+        ),
+        Argument(
+            '-j', '--jobs',
+            dest='jobs',
+            type=int,
+            default=None,
+            help='Number of compression threads (default: number of CPUs)'
+        ),
+        Argument(
+            '--no-wheels',
+            dest='build_wheels',
+            action='store_false',
+            default=True,
+            help='Do not build wheels for the kit python requirements'
         )
     ]
     name = 'build'
     help = 'Builds the kit in the current directory'
 
     def execute(self, args: argparse.Namespace):
+        from tortuga.kit.builder import KitBuilder
+
         builder = KitBuilder(
             version=args.kit_version,
-            ignore_directory_version=args.ignore_directory_version
+            ignore_directory_version=args.ignore_directory_version,
+            compression=args.compression,
+            compression_workers=args.jobs,
+            build_wheels=args.build_wheels
         )
         builder.build()
 
@@ -58,6 +83,8 @@ class CleanCommand(Command):
     help = 'Cleans the kit build in the current directory'
 
     def execute(self, args: argparse.Namespace):
+        from tortuga.kit.builder import KitBuilder
+
         builder = KitBuilder()
         builder.clean()
 
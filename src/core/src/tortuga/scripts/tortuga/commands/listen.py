@@ -13,24 +13,46 @@
 # limitations under the License.
 
 import argparse
-import asyncio
 import json
 import ssl
 import sys
-from typing import Optional
-import websockets
+from typing import TYPE_CHECKING, Dict, Optional
 
-from tortuga.cli.base import RootCommand
+from tortuga.cli.base import Argument, RootCommand
 from tortuga.cli.utils import pretty_print
 from tortuga.config.configManager import ConfigManager
 from ..script import TortugaScriptConfig
 
+#
+# websockets (and asyncio) are only imported when the command is run,
+# since all commands are loaded to build the CLI parser
+#
+if TYPE_CHECKING:
+    import websockets
+
 
 class ListenCommand(RootCommand):
     """
     Listen command for listening to websocket events.
 
     """
+    arguments = [
+        Argument(
+            '-e', '--event',
+            dest='event_name',
+            default=None,
+            help='Only listen for events with this name, may be a glob-style '
+                 'pattern, i.e. node-*'
+        ),
+        Argument(
+            '-f', '--filter',
+            dest='filters',
+            action='append',
+            default=[],
+            help='Only listen for events matching this attribute filter, '
+                 'i.e. node__state=Installed; may be specified more than once'
+        )
+    ]
     name = 'listen'
     help = 'Listen on the API websocket for events'
 
@@ -56,21 +78,34 @@ class ListenCommand(RootCommand):
         url = '{}:{}:{}'.format(url_parts[0], url_parts[1],
                                 cm.getWebsocketPort())
 
+        filters = {}
+        for filter_ in args.filters:
+            if '=' not in filter_:
+                raise Exception('Invalid filter: {}'.format(filter_))
+            key, value = filter_.split('=', 1)
+            filters[key] = value
+
         auth_method = config.get_auth_method()
         if auth_method == config.AUTH_METHOD_TOKEN:
             ws_client = WebsocketClient(token=config.get_token(),
                                         url=url,
-                                        verify=config.verify)
+                                        verify=config.verify,
+                                        event_name=args.event_name,
+                                        filters=filters)
 
         elif auth_method == config.AUTH_METHOD_PASSWORD:
             ws_client = WebsocketClient(username=config.username,
                                         password=config.password,
                                         url=url,
-                                        verify=config.verify)
+                                        verify=config.verify,
+                                        event_name=args.event_name,
+                                        filters=filters)
 
         else:
             raise Exception('Unsupported auth method: {}'.format(auth_method))
 
+        import asyncio
+
         try:
             asyncio.get_event_loop().run_until_complete(ws_client.start())
 
@@ -87,12 +122,16 @@ class WebsocketClient:
                  username: Optional[str] = None,
                  password: Optional[str] = None,
                  url: Optional[str] = None,
-                 verify: bool = True):
+                 verify: bool = True,
+                 event_name: Optional[str] = None,
+                 filters: Optional[Dict[str, str]] = None):
         self._token = token
         self._username = username
         self._password = password
         self._url = url
         self._verify = verify
+        self._event_name = event_name
+        self._filters = filters
         self._websocket = None
         self._cm = ConfigManager()
 
@@ -101,6 +140,8 @@ class WebsocketClient:
         Initializes the websocket and starts the event loop.
 
         """
+        import websockets
+
         if self._url.startswith('wss:'):
             ssl_context = ssl.SSLContext()
             if self._verify:
@@ -114,7 +155,7 @@ class WebsocketClient:
         async with websockets.connect(self._url, ssl=ssl_context) as ws:
             await self.send_recieve(ws)
 
-    async def send_recieve(self, ws: websockets.WebSocketClientProtocol):
+    async def send_recieve(self, ws: 'websockets.WebSocketClientProtocol'):
         """
         The main loop that sends/receives data.
 
@@ -134,7 +175,7 @@ class WebsocketClient:
                 if data['name'] == 'authentication-succeeded':
                     await self.send_subscribe(ws)
 
-    async def send_auth(self, ws: websockets.WebSocketClientProtocol):
+    async def send_auth(self, ws: 'websockets.WebSocketClientProtocol'):
         """
         Sends an authentication request.
 
@@ -161,7 +202,7 @@ class WebsocketClient:
 
         await ws.send(json.dumps(data))
 
-    async def send_subscribe(self, ws: websockets.WebSocketClientProtocol):
+    async def send_subscribe(self, ws: 'websockets.WebSocketClientProtocol'):
         """
         Sends a subscription request.
 
@@ -171,5 +212,9 @@ class WebsocketClient:
         data = {
             'action': 'subscribe'
         }
+        if self._event_name:
+            data['event_name'] = self._event_name
+        if self._filters:
+            data['filters'] = self._filters
 
         await ws.send(json.dumps(data))
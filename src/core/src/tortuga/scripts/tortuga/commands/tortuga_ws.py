@@ -17,8 +17,6 @@ import json
 import os
 from typing import List, Dict
 
-import yaml
-
 from tortuga.cli.base import Argument, RootCommand, Command
 from tortuga.cli.utils import pretty_print
 from tortuga.wsapi_v2.client import TortugaWsApiClient
@@ -65,7 +63,28 @@ class ListCommand(Command):
 
         params = self._parse_params(query)
 
-        pretty_print(ws_client.list(**params), args.fmt)
+        #
+        # The list is streamed from the server
+        #
+        objs = ws_client.iter_list(**params)
+
+        if args.fmt == 'json':
+            pretty_print(list(objs), args.fmt)
+            return
+
+        #
+        # YAML lists can be output one item at a time, as they are
+        # received
+        #
+        import yaml
+
+        empty = True
+        for obj in objs:
+            print(yaml.safe_dump([obj], default_flow_style=False), end='')
+            empty = False
+
+        if empty:
+            pretty_print([], args.fmt)
 
     def _parse_params(self, query: List[str]) -> Dict[str, str]:
         """
@@ -180,6 +199,8 @@ class CreateUpdateMixin:
 
     @staticmethod
     def _load_yaml(fp) -> dict:
+        import yaml
+
         return yaml.safe_load(fp)
 
 
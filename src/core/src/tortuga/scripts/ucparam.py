@@ -23,7 +23,6 @@ import sys
 from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.objects.parameter import Parameter
 from tortuga.exceptions.parameterNotFound import ParameterNotFound
-from tortuga.wsapi.parameterWsApi import ParameterWsApi
 
 
 class UcParam(TortugaCli):
@@ -63,6 +62,8 @@ class UcParam(TortugaCli):
         parser_export.set_defaults(subcommand='export')
 
     def get_api(self):
+        from tortuga.wsapi.parameterWsApi import ParameterWsApi
+
         if not self._api:
             self._api = self.configureClient(ParameterWsApi)
 
@@ -14,7 +14,6 @@
 
 from tortuga.cli.admin import AdminCli
 from tortuga.objects.admin import Admin
-from tortuga.wsapi.adminWsApi import AdminWsApi
 
 
 class UpdateAdminCli(AdminCli):
@@ -41,6 +40,8 @@ class UpdateAdminCli(AdminCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.adminWsApi import AdminWsApi
+
         self.parseArgs(_("""
 Updates a administrative user settings in the Tortuga system.
 """))
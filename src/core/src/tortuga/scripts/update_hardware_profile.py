@@ -21,9 +21,6 @@ from tortuga.objects.network import Network
 from tortuga.objects.networkDevice import NetworkDevice
 from tortuga.objects.resourceAdapter import ResourceAdapter
 from tortuga.objects.tortugaObject import TortugaObjectList
-from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
-from tortuga.wsapi.nodeWsApi import NodeWsApi
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class UpdateHardwareProfileCli(TortugaCli):
@@ -135,6 +132,9 @@ class UpdateHardwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.hardwareProfileWsApi import HardwareProfileWsApi
+        from tortuga.wsapi.nodeWsApi import NodeWsApi
+
         self.parseArgs()
 
         if not self.getArgs().name and \
@@ -15,7 +15,6 @@
 # pylint: disable=no-member
 
 from tortuga.cli.tortugaCli import TortugaCli
-from tortuga.wsapi import nodeWsApi
 from tortuga.config.configManager import getfqdn
 
 
@@ -40,6 +39,8 @@ class UpdateNodeStatusCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi import nodeWsApi
+
         self.parseArgs()
 
         # Always go over the web service for this call.
@@ -18,7 +18,6 @@ from tortuga.cli.tortugaCli import TortugaCli
 from tortuga.cli.utils import parse_tags
 from tortuga.exceptions.invalidCliRequest import InvalidCliRequest
 from tortuga.objects.tortugaObject import TortugaObjectList
-from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
 
 
 class UpdateSoftwareProfileCli(TortugaCli):
@@ -180,6 +179,8 @@ class UpdateSoftwareProfileCli(TortugaCli):
         super().parseArgs(usage=usage)
 
     def runCommand(self):
+        from tortuga.wsapi.softwareProfileWsApi import SoftwareProfileWsApi
+
         self.parseArgs(usage=_("""
 Updates software profile in the Tortuga system.
 """))
@@ -26,6 +26,11 @@ class BaseType:
 
         """
         self.id: Optional[str] = kwargs.get('id', None)
+        #
+        # The version of the object in the store it was loaded from, if
+        # any. This is maintained by the store, and is not serialized.
+        #
+        self.version: Optional[int] = kwargs.get('version', None)
 
     def __str__(self):
         schema_class = self.get_schema_class()
@@ -126,6 +126,7 @@ TORTUGA_UGE_CLUSTER_ALREADY_EXISTS_ERROR = 122
 TORTUGA_KIT_BUILD_ERROR = 123
 TORTUGA_KIT_INSTALL_ERROR = 124
 TORTUGA_VALIDATION_ERROR = 125
+TORTUGA_CHECKSUM_MISMATCH_ERROR = 126
 
 exceptionMap = {
     TORTUGA_ERROR: 'exceptions.tortugaException.TortugaException',
@@ -343,6 +344,8 @@ exceptionMap = {
     TORTUGA_KIT_INSTALL_ERROR:
         'exceptions.kitBuildError.KitInstallError',
     TORTUGA_VALIDATION_ERROR: 'exceptions.validationError.ValidationError',
+    TORTUGA_CHECKSUM_MISMATCH_ERROR:
+        'exceptions.checksumMismatch.ChecksumMismatch',
     TORTUGA_UGE_CLUSTER_NOT_FOUND_ERROR:
         'tortuga_kits.uge_8_5_4.exceptions.ugeClusterNotFound.UgeClusterNotFound',
     TORTUGA_UGE_CLUSTER_ALREADY_EXISTS_ERROR:
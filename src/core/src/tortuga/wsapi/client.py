@@ -14,13 +14,26 @@
 
 import json
 import logging
-from typing import Optional, Union
-
-import requests
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from tortuga.config.configManager import ConfigManager
 from tortuga.logging import WEBSERVICE_CLIENT_NAMESPACE
 
+#
+# requests is imported when the first request is made, it is slow to
+# import and not required by CLI commands that do not make requests
+# (ie. --help)
+#
+if TYPE_CHECKING:
+    import requests
+
+
+#
+# The content type of streamed list responses: newline-delimited JSON,
+# one object per line
+#
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
 
 class RequestError(Exception):
     """
@@ -50,12 +63,50 @@ class RestApiClient:
     """
     A generic REST API Client class.
 
+    Requests are made using a persistent session, so that connections
+    to the API server are kept alive and re-used between requests.
+
     """
+    #
+    # The number of connections kept alive in the session pool, per host
+    #
+    POOL_MAXSIZE = 10
+
+    #
+    # The HTTP methods that are retried if the request fails, these must
+    # all be idempotent
+    #
+    RETRY_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+    #
+    # The HTTP status codes that are retried
+    #
+    RETRY_STATUS_CODES = frozenset([502, 503, 504])
+
+    __cm: Optional[ConfigManager] = None
+
     def __init__(self, token: Optional[str] = None,
                  username: Optional[str] = None,
                  password: Optional[str] = None,
                  baseurl: Optional[str] = None,
-                 verify: bool = True):
+                 verify: bool = True,
+                 retries: int = 3,
+                 backoff_factor: float = 0.5):
+        """
+        Initializer.
+
+        :param str token:            the token to use for authentication
+        :param str username:         the username to use for authentication
+        :param str password:         the password to use for authentication
+        :param str baseurl:          the base URL of the API
+        :param bool verify:          verify the SSL certificate of the server
+        :param int retries:          the number of times to retry failed
+                                     requests, for idempotent methods only
+        :param float backoff_factor: the factor used to calculate the
+                                     delay between retries, see
+                                     urllib3.util.retry.Retry
+
+        """
 
         if baseurl.endswith('/'):
             baseurl = baseurl[:-1]
@@ -65,14 +116,26 @@ class RestApiClient:
         self.username = username
         self.password = password
         self.verify = verify
+        self.retries = retries
+        self.backoff_factor = backoff_factor
 
         self._requests_kwargs = None
+        self._session: Optional['requests.Session'] = None
         self._logger = logging.getLogger(WEBSERVICE_CLIENT_NAMESPACE)
 
         if not verify:
             self._logger.warning('SSL verification turned off')
 
-        self._cm = ConfigManager()
+    @property
+    def _cm(self) -> ConfigManager:
+        """
+        The ConfigManager, created when first required.
+
+        """
+        if self.__cm is None:
+            self.__cm = ConfigManager()
+
+        return self.__cm
 
     def get_requests_kwargs(self) -> dict:
         #
@@ -104,6 +167,57 @@ class RestApiClient:
 
         return self._requests_kwargs
 
+    def get_session(self) -> 'requests.Session':
+        """
+        Gets the session used to make requests, creating it if required.
+
+        :return requests.Session: the session
+
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=self.retries,
+                backoff_factor=self.backoff_factor,
+                method_whitelist=self.RETRY_METHODS,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                #
+                # Return the last response, rather than raising an
+                # exception, so that it is handled like any other error
+                # response
+                #
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE,
+                                  max_retries=retry)
+
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['Accept-Encoding'] = 'gzip'
+
+            self._session = session
+
+        return self._session
+
+    def close(self):
+        """
+        Closes the session, and any connections it has open.
+
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> 'RestApiClient':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def build_url(self, path: str) -> str:
         """
         Given a path, returns a fully qualified URL.
@@ -119,7 +233,7 @@ class RestApiClient:
         return '{}{}'.format(self.baseurl, path)
 
     def process_response(self,
-                         response: requests.Response
+                         response: 'requests.Response'
                          ) -> Optional[Union[list, dict]]:
         """
         Process the response, parsing out the data and handling
@@ -152,7 +266,48 @@ class RestApiClient:
 
         return data
 
-    def process_error_response(self, error_response: requests.Response):
+    def process_response_lines(self,
+                               response: 'requests.Response'
+                               ) -> Iterator[Union[list, dict]]:
+        """
+        Process a streamed (newline-delimited JSON) list response,
+        decoding each object as it is received.
+
+        :param requests.Response response: the response from the request
+
+        :return Iterator[Union[list, dict]]: the objects in the response
+
+        :raises RequestError:   if the a non 2xx status code is returned,
+                                or the server failed to send the full list
+
+        """
+        if round(response.status_code / 100) != 2:
+            self.process_error_response(response)
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+
+            data = json.loads(line.decode('utf-8'))
+
+            #
+            # Errors that occur after the response has started are
+            # sent as the last line
+            #
+            if isinstance(data, dict) and list(data.keys()) == ['error']:
+                self._logger.debug('ERROR Payload: {}'.format(
+                    json.dumps(data)))
+
+                raise RequestError(
+                    'ERROR: API Request Error {}'.format(
+                        response.status_code),
+                    status_code=response.status_code,
+                    data=data
+                )
+
+            yield data
+
+    def process_error_response(self, error_response: 'requests.Response'):
         """
         Process the response as an error.
 
@@ -195,13 +350,35 @@ class RestApiClient:
         url = self.build_url(path)
         self._logger.debug('GET: {}'.format(url))
 
-        result = requests.get(
+        result = self.get_session().get(
             url,
             **self.get_requests_kwargs()
         )
 
         return self.process_response(result)
 
+    def iter_get(self, path: str) -> Iterator[Union[list, dict]]:
+        """
+        Performs a GET request on the specified path, requesting that a
+        list response is streamed. Objects are JSON decoded and returned
+        as they are received, rather than after the full list has been
+        received.
+
+        :param str path: the API path to get from
+
+        :return Iterator[Union[list, dict]]: the objects in the list
+
+        """
+        url = self.build_url(path)
+        self._logger.debug('GET (stream): {}'.format(url))
+
+        kwargs = dict(self.get_requests_kwargs())
+        kwargs['headers'] = dict(kwargs.get('headers', {}),
+                                 Accept=NDJSON_CONTENT_TYPE)
+
+        with self.get_session().get(url, stream=True, **kwargs) as result:
+            yield from self.process_response_lines(result)
+
     def post(self, path: str, data: Optional[dict] = None) -> Optional[dict]:
         """
         Post data to a specified path (API endpoint). Data will automatically
@@ -216,7 +393,7 @@ class RestApiClient:
         url = self.build_url(path)
         self._logger.debug('POST: {}'.format(url))
 
-        result = requests.post(
+        result = self.get_session().post(
             url,
             json=data,
             **self.get_requests_kwargs()
@@ -238,7 +415,7 @@ class RestApiClient:
         url = self.build_url(path)
         self._logger.debug('PUT: {}'.format(url))
 
-        result = requests.put(
+        result = self.get_session().put(
             url,
             json=data,
             **self.get_requests_kwargs()
@@ -258,7 +435,7 @@ class RestApiClient:
         url = self.build_url(path)
         self._logger.debug('DELETE: {}'.format(url))
 
-        result = requests.delete(
+        result = self.get_session().delete(
             url,
             **self.get_requests_kwargs()
         )
@@ -279,7 +456,7 @@ class RestApiClient:
         url = self.build_url(path)
         self._logger.debug('PATCH: {}'.format(url))
 
-        result = requests.patch(
+        result = self.get_session().patch(
             url,
             json=data,
             **self.get_requests_kwargs()
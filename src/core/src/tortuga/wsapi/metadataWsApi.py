@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Iterable
+import urllib.parse
+from typing import Dict, Iterable, List, Optional
 
 from tortuga.exceptions.tortugaException import TortugaException
 
@@ -21,13 +22,24 @@ from .tortugaWsApi import TortugaWsApi
 
 class MetadataWsApi(TortugaWsApi):
     def list(self, *, filter_key: Optional[str] = None,
-             filter_value: Optional[str] = None):
+             filter_value: Optional[str] = None,
+             filter_key_prefix: Optional[str] = None,
+             limit: Optional[int] = None,
+             cursor: Optional[int] = None):
+        """
+        Pass the id of the last item returned as the cursor to get the
+        next page of (at most limit) results.
+        """
         url = 'metadata/'
 
         query_string = process_query_string(
-            ('filter_key', 'filter_value'),
+            ('filter_key', 'filter_value', 'filter_key_prefix', 'limit',
+             'cursor'),
             filter_key=filter_key,
             filter_value=filter_value,
+            filter_key_prefix=filter_key_prefix,
+            limit=limit,
+            cursor=cursor,
         )
 
         if query_string:
@@ -40,14 +52,30 @@ class MetadataWsApi(TortugaWsApi):
         except Exception as exc:
             raise TortugaException(exception=exc)
 
+    def upsertMetadata(self, metadata: List[Dict[str, str]]):
+        """
+        Create or update metadata for many instances at once.
+
+        :param metadata: list of {'instance': ..., 'key': ...,
+                         'value': ...} dicts
+        """
+        try:
+            return self.post('metadata/', {'metadata': metadata})
+        except TortugaException:
+            raise
+        except Exception as exc:
+            raise TortugaException(exception=exc)
+
     def deleteMetadata(self, *, filter_key: Optional[str] = None,
-                       filter_value: Optional[str] = None):
+                       filter_value: Optional[str] = None,
+                       filter_key_prefix: Optional[str] = None):
         url = 'metadata/'
 
         query_string = process_query_string(
-            ('filter_key', 'filter_value'),
+            ('filter_key', 'filter_value', 'filter_key_prefix'),
             filter_key=filter_key,
             filter_value=filter_value,
+            filter_key_prefix=filter_key_prefix,
         )
         if query_string:
             url += '?' + query_string
@@ -63,15 +91,12 @@ class MetadataWsApi(TortugaWsApi):
 def process_query_string(keys: Iterable[str], **kwargs) -> Optional[str]:
     qs = {}
 
-    value = kwargs.get('filter_key')
-    if value is not None:
-        qs['filter_key'] = value
-
-    value = kwargs.get('filter_value')
-    if value is not None:
-        qs['filter_value'] = value
+    for key in keys:
+        value = kwargs.get(key)
+        if value is not None:
+            qs[key] = value
 
     if not qs:
         return None
 
-    return '&'.join(['%s=%s' % (key, value) for key, value in qs.items()])
+    return urllib.parse.urlencode(qs)
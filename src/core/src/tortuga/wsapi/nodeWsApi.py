@@ -17,7 +17,7 @@
 import urllib.error
 import urllib.parse
 import urllib.request
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 import tortuga.objects.node
 import tortuga.objects.provisioningInfo
@@ -36,37 +36,32 @@ class NodeWsApi(TortugaWsApi):
 
     def getNodeList(self, nodespec: Optional[Union[str, None]] = None,
                     tags: Optional[Union[dict, None]] = None,
-                    addHostSession: Optional[Union[str, None]] = None):
+                    addHostSession: Optional[Union[str, None]] = None,
+                    *, states: Optional[List[str]] = None,
+                    exclude_states: Optional[List[str]] = None,
+                    softwareprofile: Optional[str] = None,
+                    hardwareprofile: Optional[str] = None,
+                    fields: Optional[List[str]] = None):
         """
         Get list of nodes
 
+        The state(s), software profile and hardware profile filters are
+        applied by the server and may be combined with the nodespec and
+        tags. If fields are specified, only those node attributes (using
+        dot notation for nested attributes, ie. "softwareprofile.name")
+        are returned.
+
             Returns:
                a list of nodes
             Throws:
                 TortugaException
         """
 
-        url = 'nodes/'
-
-        if nodespec:
-            url += '?name={}'.format(nodespec)
-
-        if addHostSession:
-            url += '?addHostSession={}'.format(addHostSession)
-
-        if tags:
-            params = []
-
-            for key, value in tags.items():
-                if value is None:
-                    params.append(urllib.parse.urlencode({'tag': key}))
-                else:
-                    params.append(
-                        urllib.parse.urlencode({'tag': '{0}={1}'.format(
-                            key, value)}))
-
-            if params:
-                url += '?' + '&'.join(params)
+        url = self.__get_node_list_url(
+            nodespec=nodespec, tags=tags, addHostSession=addHostSession,
+            states=states, exclude_states=exclude_states,
+            softwareprofile=softwareprofile, hardwareprofile=hardwareprofile,
+            fields=fields)
 
         try:
             responseDict = self.get(url)
@@ -90,6 +85,81 @@ class NodeWsApi(TortugaWsApi):
         except Exception as ex:
             raise TortugaException(exception=ex)
 
+    def iterNodeList(self, nodespec: Optional[str] = None,
+                     tags: Optional[dict] = None,
+                     addHostSession: Optional[str] = None,
+                     **kwargs) -> Iterator[tortuga.objects.node.Node]:
+        """
+        Iterate over list of nodes, see getNodeList() for arguments. The
+        list is streamed from the server, and nodes are returned as they
+        are received.
+
+            Returns:
+               iterator of nodes
+            Throws:
+                TortugaException
+        """
+
+        url = self.__get_node_list_url(
+            nodespec=nodespec, tags=tags, addHostSession=addHostSession,
+            **kwargs)
+
+        try:
+            for cDict in self.iter_get(url):
+                yield tortuga.objects.node.Node.getFromDict(cDict)
+
+        except TortugaException:
+            raise
+
+        except Exception as ex:
+            raise TortugaException(exception=ex)
+
+    @staticmethod
+    def __get_node_list_url(nodespec: Optional[str] = None,
+                            tags: Optional[dict] = None,
+                            addHostSession: Optional[str] = None,
+                            states: Optional[List[str]] = None,
+                            exclude_states: Optional[List[str]] = None,
+                            softwareprofile: Optional[str] = None,
+                            hardwareprofile: Optional[str] = None,
+                            fields: Optional[List[str]] = None) -> str:
+        params = []
+
+        if nodespec:
+            params.append(('name', nodespec))
+
+        if addHostSession:
+            params.append(('addHostSession', addHostSession))
+
+        if tags:
+            for key, value in tags.items():
+                if value is None:
+                    params.append(('tag', key))
+                else:
+                    params.append(('tag', '{0}={1}'.format(key, value)))
+
+        if states:
+            params.append(('state', ','.join(states)))
+
+        if exclude_states:
+            params.append(('exclude_state', ','.join(exclude_states)))
+
+        if softwareprofile:
+            params.append(('softwareprofile', softwareprofile))
+
+        if hardwareprofile:
+            params.append(('hardwareprofile', hardwareprofile))
+
+        if fields:
+            params.append(('fields', ','.join(fields)))
+
+        url = 'nodes/'
+
+        if params:
+            url += '?' + urllib.parse.urlencode(params)
+
+        return url
+
     def getNode(self, name,
                 optionDict: Optional[Union[dict, None]] = None): \
             # pylint: disable=unused-argument
@@ -18,6 +18,7 @@ import json
 from typing import Optional, Union
 
 from tortuga.exceptions.tortugaException import TortugaException
+from tortuga.utility.helper import str2bool
 
 from .tortugaWsApi import TortugaWsApi
 
@@ -75,3 +76,27 @@ class SyncWsApi(TortugaWsApi):
 
         except Exception as ex:
             raise TortugaException(exception=ex)
+
+    def getPendingUpdateStatus(self) -> dict:
+        """Return the status of the pending cluster update. Cluster update
+        requests are merged on the server side, and run once the update
+        window has elapsed.
+
+            Returns:
+                dict - with keys 'pending' (bool), 'pending_since'
+                       (ISO 8601 timestamp of the first merged request)
+                       and 'reasons' (list of merged update reasons)
+            Throws:
+                TortugaException
+        """
+
+        url = 'updates/cluster/pending'
+
+        try:
+            return self.get(url)
+
+        except TortugaException:
+            raise
+
+        except Exception as ex:
+            raise TortugaException(exception=ex)
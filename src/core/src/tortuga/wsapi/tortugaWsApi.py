@@ -13,16 +13,16 @@
 # limitations under the License.
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests
-
-from tortuga.config.configManager import ConfigManager
 from tortuga.exceptions.tortugaException import TortugaException
 from tortuga.logging import WEBSERVICE_CLIENT_NAMESPACE
 from tortuga.utility import tortugaStatus
 from .client import RestApiClient
 
+if TYPE_CHECKING:
+    import requests
+
 
 WS_API_VERSION = 'v1'
 
@@ -36,9 +36,9 @@ class TortugaWsApi(RestApiClient):
                  username: Optional[str] = None,
                  password: Optional[str] = None,
                  baseurl: Optional[str] = None,
-                 verify: bool = True):
+                 verify: bool = True,
+                 **kwargs):
 
-        self._cm = ConfigManager()
         self._logger = logging.getLogger(WEBSERVICE_CLIENT_NAMESPACE)
 
         if not baseurl:
@@ -55,15 +55,20 @@ class TortugaWsApi(RestApiClient):
                 password = self._cm.getCfmPassword()
 
         super().__init__(token=token, username=username, password=password,
-                         baseurl=baseurl, verify=verify)
+                         baseurl=baseurl, verify=verify, **kwargs)
 
         self.baseurl = '{}/{}'.format(self.baseurl, WS_API_VERSION)
 
-    def process_response(self, response: requests.Response):
+    def process_response(self, response: 'requests.Response'):
         check_status(response.headers)
 
         return super().process_response(response)
 
+    def process_response_lines(self, response: 'requests.Response'):
+        check_status(response.headers)
+
+        return super().process_response_lines(response)
+
 
 def check_status(http_headers: dict):
     """
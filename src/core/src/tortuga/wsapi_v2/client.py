@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 from tortuga.config.configManager import ConfigManager
 from tortuga.logging import WEBSERVICE_CLIENT_NAMESPACE
@@ -75,6 +75,19 @@ class TortugaWsApiClient:
 
         return self._client.get(path)
 
+    def iter_list(self, **params) -> Iterator[dict]:
+        """
+        Same as list(), except that the list is streamed from the server,
+        and objects are returned as they are received.
+
+        """
+        path = '/'
+        query_string = self._build_query_string(params)
+        if query_string:
+            path += '?{}'.format(query_string)
+
+        return self._client.iter_get(path)
+
     def get(self, id_: str) -> dict:
         path = '/{}'.format(id_)
 
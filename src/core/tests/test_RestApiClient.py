@@ -0,0 +1,164 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from tortuga.exceptions.tortugaException import TortugaException
+from tortuga.wsapi.nodeWsApi import NodeWsApi
+
+
+class ApiServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self.failures = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    #
+    # HTTP/1.1 is required for keep-alive
+    #
+    protocol_version = 'HTTP/1.1'
+    #
+    # Send the headers and body together
+    #
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        #
+        # Fail the first request of the "flaky" node, to test retries
+        #
+        if 'flaky' in self.path and self.server.failures == 0:
+            self.server.failures += 1
+            self._send(503, b'')
+            return
+
+        if self.headers.get('Accept') == 'application/x-ndjson':
+            self._send_lines()
+            return
+
+        body = json.dumps({'nodes': [{'name': 'node01'}]}).encode()
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self._send(200, gzip.compress(body),
+                       {'Content-Encoding': 'gzip'})
+        else:
+            self._send(200, body)
+
+    def _send(self, status: int, body: bytes, headers: dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_lines(self):
+        #
+        # Stream a list of nodes as newline-delimited JSON, using chunked
+        # transfer encoding; the "broken" node list fails part way through
+        #
+        lines = [{'name': 'node{:02d}'.format(n)} for n in range(1, 4)]
+        if 'broken' in self.path:
+            lines.insert(2, {'error': {'message': 'Database error'}})
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for line in lines:
+            data = json.dumps(line).encode() + b'\n'
+            self.wfile.write(
+                '{:x}\r\n'.format(len(data)).encode() + data + b'\r\n')
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def api_server():
+    server = ApiServer(('127.0.0.1', 0), ApiRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def get_client(server: ApiServer, **kwargs) -> NodeWsApi:
+    return NodeWsApi(
+        username='admin', password='password',
+        baseurl='http://127.0.0.1:{}'.format(server.server_address[1]),
+        **kwargs
+    )
+
+
+def test_connection_reuse_benchmark(api_server):
+    #
+    # All requests should be made over a single, kept-alive, connection
+    #
+    with get_client(api_server) as api:
+        for _ in range(1000):
+            assert api.getNode('node01').getName() == 'node01'
+
+    assert api_server.connections == 1
+
+
+def test_retry(api_server):
+    with get_client(api_server, backoff_factor=0) as api:
+        assert api.getNode('flaky').getName() == 'node01'
+
+    assert api_server.failures == 1
+
+
+def test_iter_node_list(api_server):
+    with get_client(api_server) as api:
+        nodes = api.iterNodeList(states=['Installed'])
+
+        assert next(nodes).getName() == 'node01'
+        assert [node.getName() for node in nodes] == ['node02', 'node03']
+
+        #
+        # The connection is re-used once the list has been received
+        #
+        assert api.getNode('node01').getName() == 'node01'
+
+    assert api_server.connections == 1
+
+
+def test_iter_node_list_error(api_server):
+    with get_client(api_server) as api:
+        nodes = api.iterNodeList(nodespec='broken')
+
+        assert next(nodes).getName() == 'node01'
+        assert next(nodes).getName() == 'node02'
+
+        with pytest.raises(TortugaException):
+            next(nodes)
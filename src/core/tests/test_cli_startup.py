@@ -0,0 +1,90 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+
+#
+# Modules that are only needed once a command actually talks to the
+# web service (or uses one of the less common code paths), and must not
+# be loaded just to start a CLI
+#
+HEAVY_MODULES = [
+    'requests',
+    'urllib3',
+    'cryptography',
+    'hvac',
+    'websockets',
+    'yaml',
+    'tortuga.kit.builder',
+    'tortuga.objects.provisioningInfo',
+]
+
+
+CLI_MODULES = [
+    'tortuga.scripts.get_node_status',
+    'tortuga.scripts.get_software_profile_list',
+    'tortuga.scripts.get_hardware_profile_list',
+    'tortuga.scripts.add_nodes',
+    'tortuga.scripts.tortuga.script',
+    'tortuga.scripts.tortuga.commands.kits',
+    'tortuga.scripts.tortuga.commands.listen',
+    'tortuga.scripts.tortuga.commands.tortuga_ws',
+]
+
+
+def get_imported_modules(module: str) -> dict:
+    """
+    Imports a module in a new interpreter, and returns the cumulative
+    import time (in microseconds) of every module that was loaded.
+
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+
+    imported = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        try:
+            imported[name.strip()] = int(cumulative)
+        except ValueError:
+            # header line
+            continue
+
+    return imported
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='-X importtime requires Python 3.7+')
+@pytest.mark.parametrize('module', CLI_MODULES)
+def test_cli_startup_imports(module):
+    imported = get_imported_modules(module)
+
+    assert module in imported
+
+    heavy = [name for name in HEAVY_MODULES if name in imported]
+
+    assert not heavy, \
+        '{} imports {} at startup'.format(module, ', '.join(heavy))
@@ -0,0 +1,109 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+
+import pytest
+
+from tortuga.kit.compression import COMPRESSIONS, DEFAULT_COMPRESSION, \
+    ParallelCompressedWriter, PipeReader, detect_compression, \
+    get_compression, open_archive_reader
+
+
+AVAILABLE_COMPRESSIONS = [
+    name for name, compression in COMPRESSIONS.items()
+    if compression.is_available()
+]
+
+
+@pytest.fixture()
+def data() -> bytes:
+    return os.urandom(64 * 1024) * 8 + b'tortuga' * 10000
+
+
+def _write(compression, path, data, block_size=16 * 1024):
+    writer = ParallelCompressedWriter(open(path, 'wb'),
+                                      compression.compress_block,
+                                      block_size=block_size,
+                                      workers=4)
+    with writer:
+        #
+        # Write in pieces that do not line up with the block size
+        #
+        for offset in range(0, len(data), 10000):
+            writer.write(data[offset:offset + 10000])
+
+
+@pytest.mark.parametrize('name', AVAILABLE_COMPRESSIONS)
+def test_round_trip(tmpdir, data, name):
+    compression = get_compression(name)
+    path = str(tmpdir.join('archive.tar.' + compression.extension))
+
+    _write(compression, path, data)
+
+    assert detect_compression(path) is compression
+
+    #
+    # The multiple compressed streams can be read back by both the
+    # python standard library and by the command line tools
+    #
+    with compression.open_stdlib_reader(path) as fp:
+        assert fp.read() == data
+
+    with open_archive_reader(path) as fp:
+        assert fp.read() == data
+
+
+def test_default_compression():
+    assert get_compression(DEFAULT_COMPRESSION).extension == 'bz2'
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        get_compression('rar')
+
+
+def test_detect_uncompressed(tmpdir, data):
+    path = str(tmpdir.join('archive.tar'))
+    with open(path, 'wb') as fp:
+        fp.write(data)
+
+    assert detect_compression(path) is None
+
+    with open_archive_reader(path) as fp:
+        assert fp.read() == data
+
+
+@pytest.mark.skipif(not shutil.which('bzip2'), reason='bzip2 not installed')
+def test_pipe_reader(tmpdir, data):
+    compression = get_compression('bzip2')
+    path = str(tmpdir.join('archive.tar.bz2'))
+    _write(compression, path, data)
+
+    #
+    # Closing the reader before the end of the data stops the command
+    #
+    with PipeReader(['bzip2', '-d', '-c'], path) as fp:
+        assert fp.read(1024) == data[:1024]
+
+    #
+    # Errors are reported once all of the data has been read
+    #
+    with open(path, 'r+b') as fp:
+        fp.truncate(os.path.getsize(path) // 2)
+
+    with pytest.raises(OSError):
+        with PipeReader(['bzip2', '-d', '-c'], path) as fp:
+            fp.read()
@@ -0,0 +1,163 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from tortuga.os_utility import osUtility
+from tortuga.os_utility.osUtility import content_addressed_copytree, \
+    copy_file, files_match
+
+
+@pytest.mark.parametrize('hardlink', [True, False])
+def test_copy_file(tmpdir, hardlink):
+    src = tmpdir.join('src')
+    src.write_binary(os.urandom(256 * 1024))
+    dst = str(tmpdir.join('dst'))
+
+    assert not files_match(str(src), dst)
+
+    assert copy_file(str(src), dst, hardlink=hardlink)
+
+    with open(dst, 'rb') as fp:
+        assert fp.read() == src.read_binary()
+
+    assert os.path.samefile(str(src), dst) == hardlink
+    assert files_match(str(src), dst)
+
+    #
+    # Already up to date
+    #
+    assert not copy_file(str(src), dst, hardlink=hardlink)
+
+    #
+    # No temporary files are left behind
+    #
+    assert sorted(os.listdir(str(tmpdir))) == ['dst', 'src']
+
+
+def _make_os_media(path, packages):
+    """
+    Generates a fake OS media tree, with fake RPM files.
+
+    """
+    path.mkdir('repodata').join('repomd.xml').write(str(sorted(packages)))
+
+    packages_dir = path.mkdir('Packages')
+    for name, content in packages.items():
+        packages_dir.join(name).write_binary(content)
+
+    path.join('RPM-GPG-KEY').write('key')
+    path.join('RPM-GPG-KEY-link').mksymlinkto('RPM-GPG-KEY')
+
+    return str(path)
+
+
+def test_content_addressed_copytree(tmpdir):
+    shared = {
+        'bash-4.2.46-1.x86_64.rpm': os.urandom(64 * 1024),
+        'glibc-2.17-1.x86_64.rpm': os.urandom(128 * 1024),
+    }
+
+    media_1 = _make_os_media(tmpdir.mkdir('media-7.5'), dict(shared, **{
+        'kernel-3.10.0-862.x86_64.rpm': os.urandom(32 * 1024),
+    }))
+    media_2 = _make_os_media(tmpdir.mkdir('media-7.6'), dict(shared, **{
+        'kernel-3.10.0-957.x86_64.rpm': os.urandom(32 * 1024),
+    }))
+
+    store = str(tmpdir.join('objects'))
+    repo_1 = str(tmpdir.join('repos', '7.5'))
+    repo_2 = str(tmpdir.join('repos', '7.6'))
+
+    assert content_addressed_copytree(media_1, repo_1, store, workers=4) == {
+        'copied': 5, 'linked': 0, 'skipped': 0,
+    }
+
+    #
+    # The shared packages (and the GPG key) are only stored once
+    #
+    assert content_addressed_copytree(media_2, repo_2, store, workers=4) == {
+        'copied': 2, 'linked': 3, 'skipped': 0,
+    }
+
+    for name, content in shared.items():
+        path_1 = os.path.join(repo_1, 'Packages', name)
+        path_2 = os.path.join(repo_2, 'Packages', name)
+
+        with open(path_2, 'rb') as fp:
+            assert fp.read() == content
+
+        assert os.path.samefile(path_1, path_2)
+
+    assert os.readlink(os.path.join(repo_2, 'RPM-GPG-KEY-link')) == \
+        'RPM-GPG-KEY'
+
+    #
+    # Copying again is incremental
+    #
+    assert content_addressed_copytree(media_1, repo_1, store) == {
+        'copied': 0, 'linked': 0, 'skipped': 5,
+    }
+
+    #
+    # ...and picks up changed files
+    #
+    repomd = os.path.join(media_1, 'repodata', 'repomd.xml')
+    os.unlink(repomd)
+    with open(repomd, 'w') as fp:
+        fp.write('updated')
+
+    assert content_addressed_copytree(media_1, repo_1, store) == {
+        'copied': 1, 'linked': 0, 'skipped': 4,
+    }
+
+    with open(os.path.join(repo_1, 'repodata', 'repomd.xml')) as fp:
+        assert fp.read() == 'updated'
+
+
+@pytest.mark.parametrize('hardlink', [True, False])
+def test_content_addressed_copytree_duplicates(tmpdir, monkeypatch,
+                                               hardlink):
+    content = os.urandom(64 * 1024)
+
+    media = tmpdir.mkdir('media')
+    media.join('a.rpm').write_binary(content)
+    media.join('b.rpm').write_binary(content)
+    os.utime(str(media.join('b.rpm')), (0, 0))
+
+    store = str(tmpdir.join('objects'))
+    repo = str(tmpdir.join('repo'))
+
+    assert content_addressed_copytree(str(media), repo, store,
+                                      hardlink=hardlink) == {
+        'copied': 1, 'linked': 1, 'skipped': 0,
+    }
+
+    #
+    # Identical files with different modification times are neither
+    # hashed nor linked again
+    #
+    hashed = []
+    monkeypatch.setattr(osUtility, 'file_sha256',
+                        lambda path: hashed.append(path))
+
+    for _ in range(2):
+        assert content_addressed_copytree(str(media), repo, store,
+                                          hardlink=hardlink) == {
+            'copied': 0, 'linked': 0, 'skipped': 2,
+        }
+
+    assert not hashed
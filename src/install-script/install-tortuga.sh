@@ -923,7 +923,7 @@ mkdir -p "${kitsdir}"
 
 echo "Copying default kits to ${kitsdir}... "
 
-find . -maxdepth 1 -type f -name 'kit-*.tar.bz2' | while read filename; do
+find . -maxdepth 1 -type f -name 'kit-*.tar.*' | while read filename; do
     echo -n "   $(basename "${filename}")... "
     cp -f "${filename}" "${kitsdir}"
     echo "done."
@@ -24,10 +24,10 @@ from sqlalchemy.orm.session import Session
 from tortuga.db.hardwareProfilesDbHandler import HardwareProfilesDbHandler
 from tortuga.db.models.nodeTag import NodeTag
 from tortuga.db.nodeDbApi import NodeDbApi
+from tortuga.db.nodesDbHandler import NodesDbHandler
 from tortuga.db.softwareProfilesDbHandler import SoftwareProfilesDbHandler
 from tortuga.db.tagsDbApiMixin import TagsDbApiMixin
 from tortuga.exceptions.notFound import NotFound
-from tortuga.exceptions.nodeNotFound import NodeNotFound
 from tortuga.exceptions.resourceAdapterNotFound import ResourceAdapterNotFound
 from tortuga.kit.actions import KitActionsManager
 from tortuga.logging import ADD_HOST_NAMESPACE
@@ -36,12 +36,18 @@ from tortuga.objects.tortugaObject import TortugaObjectList
 from tortuga.objects.tortugaObjectManager import TortugaObjectManager
 from tortuga.objectstore.manager import ObjectStoreManager
 from tortuga.resourceAdapter import resourceAdapterFactory
-from tortuga.wsapi.syncWsApi import SyncWsApi
+from tortuga.sync.manager import ClusterUpdateSchedulerManager
 
 
 class AddHostManager(TagsDbApiMixin, TortugaObjectManager):
     tag_model = NodeTag
 
+    #
+    # Number of seconds a completed add host session (and its status
+    # log) is kept around
+    #
+    COMPLETED_SESSION_EXPIRE = 3600
+
     def __init__(self):
         super(AddHostManager, self).__init__()
 
@@ -49,6 +55,7 @@ class AddHostManager(TagsDbApiMixin, TortugaObjectManager):
         self._addHostLock = threading.RLock()
         self._logger = logging.getLogger(ADD_HOST_NAMESPACE)
         self._nodeDbApi = NodeDbApi()
+        self._nodesDbHandler = NodesDbHandler()
         self._sessions = ObjectStoreManager.get(
             namespace='add-host-manager', expire=86400)
 
@@ -67,15 +74,16 @@ class AddHostManager(TagsDbApiMixin, TortugaObjectManager):
         # a node. Instead, throw an exception so that callers can deal with
         # the problem in an appropriate fashion.
         #
-        node_details = addHostRequest.get('nodeDetails', [])
-        for node_detail in node_details:
-            node_name = node_detail.get('name', '').strip()
-            if node_name:
-                try:
-                    self._nodeDbApi.getNode(session, node_name)
-                    raise Exception("Node already exists: {}".format(node_name))
-                except NodeNotFound:
-                    pass
+        node_names = [
+            node_detail.get('name', '').strip()
+            for node_detail in addHostRequest.get('nodeDetails', [])
+        ]
+
+        existing_node_names = self._nodesDbHandler.get_existing_node_names(
+            session, [node_name for node_name in node_names if node_name])
+        for node_name in node_names:
+            if node_name in existing_node_names:
+                raise Exception("Node already exists: {}".format(node_name))
 
         dbHardwareProfile = \
             HardwareProfilesDbHandler().getHardwareProfile(
@@ -168,59 +176,58 @@ class AddHostManager(TagsDbApiMixin, TortugaObjectManager):
             nodes
         )
 
-        # Always go over the web service for this call.
-        SyncWsApi().scheduleClusterUpdate(updateReason='Node(s) added')
+        ClusterUpdateSchedulerManager.get().schedule(reason='Node(s) added')
 
     def updateStatus(self, addHostSession: str, msg: str) -> None:
-        self._addHostLock.acquire()
-
-        try:
-            if not self._sessions.exists(addHostSession):
-                self._logger.warning(
-                    'updateStatus(): unknown session ID [%s]' % (
-                        addHostSession))
+        """
+        Append a status message to the add host session log. Messages are
+        appended to the session log without reading or re-writing the
+        session itself.
+        """
 
-                return
+        if not self._sessions.exists(addHostSession):
+            self._logger.warning(
+                'updateStatus(): unknown session ID [%s]' % (
+                    addHostSession))
 
-            addHostStatus = AddHostStatus.getFromDict(
-                self._sessions.get(addHostSession)['status'])
+            return
 
-            addHostStatus.getMessageList().append(msg)
-        finally:
-            self._addHostLock.release()
+        self._sessions.log_append(addHostSession, msg)
 
     def getStatus(self, db_session: Session, session: str,
-                  startMessage: int, getNodes: bool) -> AddHostStatus:
+                  since: int = 0, getNodes: bool = False) -> AddHostStatus:
         """
+        Get the status of an add host session, including the status
+        messages logged after the first 'since' messages. Clients can
+        tail the session log by passing in the number of messages
+        already received.
+
         Raises:
             NotFound
         """
-        with self._addHostLock:
-            nodeList = self._nodeDbApi.getNodesByAddHostSession(
-                db_session, session) if getNodes else TortugaObjectList()
-
-            # Lock and copy for data consistency
-            if not self._sessions.exists(session):
-                raise NotFound('Invalid add host session ID [%s]' % (session))
 
-            session = self._sessions.get(session)
+        nodeList = self._nodeDbApi.getNodesByAddHostSession(
+            db_session, session) if getNodes else TortugaObjectList()
 
-            status_copy = AddHostStatus()
+        session_dict = self._sessions.get(session)
+        if session_dict is None:
+            raise NotFound('Invalid add host session ID [%s]' % (session))
 
-            # Copy simple data
-            status = AddHostStatus.getFromDict(session['status'])
-            for key in status.getKeys():
-                status_copy.set(key, status.get(key))
+        status_copy = AddHostStatus()
 
-            # Get slice of status messages
-            messages = status.getMessageList()[startMessage:]
+        # Copy simple data
+        status = AddHostStatus.getFromDict(session_dict['status'])
+        for key in status.getKeys():
+            status_copy.set(key, status.get(key))
 
-            status_copy.setMessageList(messages)
+        # Get slice of status messages
+        status_copy.setMessageList(
+            self._sessions.log_range(session, since=since))
 
-            if nodeList:
-                status_copy.getNodeList().extend(nodeList)
+        if nodeList:
+            status_copy.getNodeList().extend(nodeList)
 
-            return status_copy
+        return status_copy
 
     def createNewSession(self) -> str:
         self._logger.debug('createNewSession()')
@@ -272,6 +279,23 @@ class AddHostManager(TagsDbApiMixin, TortugaObjectManager):
 
         with self._addHostLock:
             session = self._sessions.get(session_id)
+            if session is None:
+                self._logger.warning(
+                    'update_session(): unknown session ID [%s]', session_id)
+
+                return
+
             status = AddHostStatus.getFromDict(session['status'])
+            if running is not None:
+                status.setIsRunning(running)
             session['status'] = status.getCleanDict()
             self._sessions.set(session_id, session)
+
+            #
+            # Once the session is complete, the session and its log are
+            # only kept around long enough for clients to read the final
+            # status messages
+            #
+            if running is False:
+                self._sessions.expire(
+                    session_id, self.COMPLETED_SESSION_EXPIRE)
@@ -11,18 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import configparser
+import email.utils
 import logging
 import os
-import shutil
 import urllib.error
 import urllib.parse
 import urllib.request
-from http.client import HTTPResponse
+from http.client import HTTPException, HTTPResponse
 from typing import Optional, Dict
 
 from tortuga.helper import osHelper
+from tortuga.kit.download import download_file
 from tortuga.logging import BOOT_NAMESPACE
 from tortuga.objects import osInfo
+from tortuga.os_utility.osUtility import copy_file
 
 
 class DistributionPrimitivesBase(dict):
@@ -91,6 +94,8 @@ class DistributionBase(object):
 
         self._primitives: Optional[DistributionPrimitivesBase] = None
 
+        self._checksums: Optional[Dict[str, str]] = None
+
     @property
     def source_path(self) -> str:
         """
@@ -202,19 +207,112 @@ class DistributionBase(object):
         """
         return self._source_uri.scheme in ('http', 'https')
 
-    @staticmethod
-    def _copy_remote_uri(uri: str, file_path: str) -> None:
+    @property
+    def checksums(self) -> Dict[str, str]:
+        """
+        SHA-256 checksums of the files in the distribution, from the
+        [checksums] section of its .treeinfo file, if it has one.
+
+        :return: Dictionary of relative path to checksum
         """
+        if self._checksums is None:
+            self._checksums = self._read_treeinfo_checksums()
+
+        return self._checksums
+
+    def _read_treeinfo_checksums(self) -> Dict[str, str]:
+        """
+        :return: Dictionary of relative path to SHA-256 checksum
+        """
+        treeinfo_path: str = os.path.join(self.source_path, '.treeinfo')
+
+        try:
+            if self.is_remote:
+                with urllib.request.urlopen(treeinfo_path) as r:
+                    content: str = r.read().decode()
+            else:
+                with open(treeinfo_path) as f:
+                    content: str = f.read()
+
+            treeinfo = configparser.ConfigParser()
+            treeinfo.read_string(content)
+        except (OSError, urllib.error.URLError,
+                configparser.Error) as e:
+            self._logger.debug(
+                'No checksums for {}: {}'.format(self.source_path, e))
+            return {}
+
+        if not treeinfo.has_section('checksums'):
+            return {}
+
+        checksums: Dict[str, str] = {}
+        for path, checksum in treeinfo.items('checksums'):
+            algorithm, _, digest = checksum.partition(':')
+            if algorithm.lower() == 'sha256':
+                checksums[path] = digest
+
+        return checksums
+
+    def _copy_remote_uri(self, uri: str, file_path: str) -> None:
+        """
+        Downloads a file, unless the local copy is already up to date
+        (i.e. it has the same size and modification time as the remote
+        file). The download is resumed if interrupted, and verified
+        against the .treeinfo checksum, if there is one.
+
         :param uri: String
         :param file_path: String
         :return: None
         """
-        with urllib.request.urlopen(uri) as r:
-            with open(file_path, 'wb') as f:
-                f.write(r.read())
+        length: Optional[str] = None
+        mtime: Optional[float] = None
+
+        #
+        # If the server (or a proxy) doesn't support HEAD requests, the
+        # state of the remote file is unknown, and it is downloaded
+        #
+        request: urllib.request.Request = urllib.request.Request(
+            uri, method='HEAD')
+        try:
+            with urllib.request.urlopen(request) as r:
+                length = r.headers.get('Content-Length')
+                last_modified: Optional[str] = r.headers.get('Last-Modified')
+
+            if last_modified:
+                mtime = email.utils.parsedate_to_datetime(
+                    last_modified).timestamp()
+
+        except (OSError, HTTPException, TypeError, ValueError) as ex:
+            self._logger.debug(
+                'Unable to check {}, downloading: {}'.format(uri, ex))
+            length = None
+            mtime = None
+
+        if length is not None and mtime is not None and \
+                os.path.exists(file_path):
+            st: os.stat_result = os.stat(file_path)
+            if st.st_size == int(length) and st.st_mtime == mtime:
+                self._logger.debug(
+                    '{} is up to date, skipping download'.format(file_path))
+                return
+
+        relative_path: str = os.path.relpath(
+            urllib.parse.urlparse(uri).path,
+            self._source_uri.path or '/'
+        )
+
+        download_file(uri, file_path,
+                      sha256=self.checksums.get(relative_path))
+
+        if mtime is not None:
+            os.utime(file_path, (mtime, mtime))
 
     def _copy_uri(self, source: str, destination: str, overwrite: bool) -> None:
         """
+        Copies a file from the distribution. Copies are skipped if the
+        destination is already up to date. Local files are hard linked
+        where possible, otherwise cloned or copied in the kernel.
+
         :param source: String
         :param destination: String
         :param overwrite: Boolean
@@ -234,8 +332,9 @@ class DistributionBase(object):
 
         if self.is_remote:
             self._copy_remote_uri(source, file_path)
-        else:
-            shutil.copy(source, file_path)
+        elif not copy_file(source, file_path):
+            self._logger.debug(
+                '{} is up to date, skipping copy'.format(file_path))
 
     def copy_kernel(self, destination: str, overwrite: bool = False) -> None:
         """
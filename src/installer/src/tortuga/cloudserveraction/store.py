@@ -33,12 +33,16 @@ class CloudServerActionStore:
 
     """
 
-    def save(self, csa: CloudServerAction) -> CloudServerAction:
+    def save(self, csa: CloudServerAction,
+             expected_version: Optional[int] = None) -> CloudServerAction:
         """
         Saves the cloud server action to the store.
 
         :param CloudServerAction csa: the cloud server action 
                                                      to save
+        :param int expected_version:  if set, the cloud server action is
+                                      only saved if the version in the
+                                      store matches
 
         """
         raise NotImplementedError()
@@ -83,34 +87,30 @@ class ObjectStoreCloudServerActionStore(ObjectStoreTypeStore,
                                         CloudServerActionStore):
     type_class = CloudServerAction
 
-    def save(self, csa: CloudServerAction) -> CloudServerAction:
-        csa_old: Optional[CloudServerAction] = None
-        if csa.id:
-            csa_old = self.get(csa.id)
-        else:
+    def save(self, csa: CloudServerAction,
+             expected_version: Optional[int] = None) -> CloudServerAction:
+        if not csa.id:
             csa.id = str(uuid.uuid4())
             if not csa.status:
                 csa.stats = CloudServerAction.STATUS_CREATED
             csa.timestamp = datetime.datetime.now()
 
-        csa = super().save(csa)
-        self._fire_events(csa_old, csa)
+        saved, data, previous_data = self.save_returning_previous(
+            csa, expected_version)
+        self._fire_events(previous_data, csa, data)
 
-        return csa
+        return saved
 
-    def _fire_events(self, csa_old: Optional[CloudServerAction],
-                     csa: CloudServerAction):
-        if csa_old:
-            self._event_updated(csa_old, csa)
+    def _fire_events(self, previous_data: Optional[dict],
+                     csa: CloudServerAction, data: dict):
+        if previous_data is not None:
+            self._event_updated(previous_data, csa, data)
         else:
             self._event_created(csa)
 
-    def _event_updated(self, csa_old: Optional[CloudServerAction],
-                       csa: CloudServerAction):
-        data = self.marshall(csa)
-        previous_data = self.marshall(csa_old)
-
-        if data != previous_data:
+    def _event_updated(self, previous_data: dict, csa: CloudServerAction,
+                       data: dict):
+        if self.is_changed(data, previous_data):
             CloudServerActionUpdated.fire(
                 cloudserveraction_id=csa.id,
                 previous_cloudserveraction=previous_data
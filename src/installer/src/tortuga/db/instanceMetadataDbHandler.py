@@ -12,39 +12,141 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import text
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.session import Session
+from tortuga.db.models.instanceMapping import InstanceMapping
 from tortuga.db.models.instanceMetadata import InstanceMetadata
 from tortuga.db.tortugaDbObjectHandler import TortugaDbObjectHandler
+from tortuga.exceptions.invalidArgument import InvalidArgument
+
+
+#
+# Upsert over the (instance_id, key) unique constraint, for databases
+# supporting INSERT ... ON CONFLICT (SQLite 3.24+, PostgreSQL)
+#
+UPSERT_ON_CONFLICT = text(
+    'INSERT INTO instance_metadata (instance_id, "key", value)'
+    ' VALUES (:instance_id, :key, :value)'
+    ' ON CONFLICT (instance_id, "key") DO UPDATE SET value = excluded.value'
+)
 
 
 class InstanceMetadataDbHandler(TortugaDbObjectHandler):
     """APIs for retrieving metadata"""
 
     def list(self, session: Session, *, filter_key: Optional[str] = None,
-             filter_value: Optional[str] = None) -> List[InstanceMetadata]:
-        """Return list of all metadata."""
+             filter_value: Optional[str] = None,
+             filter_key_prefix: Optional[str] = None,
+             limit: Optional[int] = None,
+             cursor: Optional[int] = None) -> List[InstanceMetadata]:
+        """
+        Return list of metadata, ordered by id.
+
+        Results are paginated by passing the id of the last item of the
+        previous page as the cursor.
+        """
+
+        q = filter_instance_metadata(
+            session, filter_key, filter_value,
+            filter_key_prefix=filter_key_prefix
+        )
+
+        if cursor is not None:
+            q = q.filter(InstanceMetadata.id > cursor)
 
-        return filter_instance_metadata(
-            session, filter_key, filter_value
-        ).all()
+        # the instance (and its node) are included in the response
+        q = q.options(
+            joinedload(InstanceMetadata.instance)
+            .joinedload(InstanceMapping.node)
+        ).order_by(InstanceMetadata.id)
+
+        if limit is not None:
+            q = q.limit(limit)
+
+        return q.all()
 
     def delete(self, session: Session, *, filter_key: Optional[str] = None,
-               filter_value: Optional[str] = None) -> None:
+               filter_value: Optional[str] = None,
+               filter_key_prefix: Optional[str] = None) -> None:
         """Delete metadata based on query"""
         filter_instance_metadata(
-            session, filter_key, filter_value
-        ).delete()
+            session, filter_key, filter_value,
+            filter_key_prefix=filter_key_prefix
+        ).delete(synchronize_session=False)
+
+    def upsert(self, session: Session, metadata: List[Dict[str, str]]) \
+            -> None:
+        """
+        Create or update metadata for many instances in a single
+        statement.
+
+        :param metadata: list of {'instance': ..., 'key': ...,
+                         'value': ...} dicts, where instance is the
+                         instance (as in the instance mapping)
+        :raises InvalidArgument: an item is malformed or an instance
+                                 does not exist
+        """
+        if not metadata:
+            return
+
+        instances = {item.get('instance') for item in metadata}
+
+        instance_ids = dict(
+            session.query(
+                InstanceMapping.instance, InstanceMapping.id
+            ).filter(InstanceMapping.instance.in_(instances))
+        )
 
+        rows = []
 
-def filter_instance_metadata(session: Session, filter_key, filter_value):
+        for item in metadata:
+            if not item.get('key'):
+                raise InvalidArgument('Metadata key must be specified')
+
+            instance_id = instance_ids.get(item.get('instance'))
+            if instance_id is None:
+                raise InvalidArgument(
+                    'Unknown instance: {}'.format(item.get('instance')))
+
+            rows.append({
+                'instance_id': instance_id,
+                'key': item['key'],
+                'value': item.get('value'),
+            })
+
+        session.execute(_get_upsert_statement(session), rows)
+
+
+def _get_upsert_statement(session: Session):
+    if session.bind.dialect.name == 'mysql':
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(InstanceMetadata.__table__)
+
+        return stmt.on_duplicate_key_update(value=stmt.inserted.value)
+
+    return UPSERT_ON_CONFLICT
+
+
+def filter_instance_metadata(session: Session, filter_key, filter_value,
+                             filter_key_prefix: Optional[str] = None):
     q = session.query(InstanceMetadata)
 
     if filter_key is not None:
         # filter on key
         q = q.filter(InstanceMetadata.key==filter_key)  # noqa
 
+    if filter_key_prefix is not None:
+        # filter on key prefix, LIKE wildcards in the prefix are literal
+        escaped = filter_key_prefix.replace('\\', '\\\\') \
+            .replace('%', '\\%').replace('_', '\\_')
+
+        q = q.filter(
+            InstanceMetadata.key.like(escaped + '%', escape='\\'))
+
     if filter_value is not None:
         # filter on value
         q = q.filter(InstanceMetadata.value==filter_value)  # noqa
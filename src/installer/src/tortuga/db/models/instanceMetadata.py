@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from sqlalchemy import (Boolean, Column, ForeignKey, Integer, String,
+from sqlalchemy import (Boolean, Column, ForeignKey, Index, Integer, String,
                         UniqueConstraint)
 from sqlalchemy.ext.indexable import index_property
 from sqlalchemy.orm import backref, relationship
@@ -24,6 +24,12 @@ class InstanceMetadata(ModelBase):
     __tablename__ = 'instance_metadata'
     __table_args__ = (
         UniqueConstraint('instance_id', 'key'),
+        #
+        # Metadata is queried (and deleted) by key, key prefix and/or
+        # value, independently of the instance
+        #
+        Index('ix_instance_metadata_key_value', 'key', 'value'),
+        Index('ix_instance_metadata_value', 'value'),
     )
 
     id = Column(Integer, primary_key=True)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from sqlalchemy.orm.session import Session
 from tortuga.config.configManager import getfqdn
@@ -183,21 +183,31 @@ class NodeDbApi(TagsDbApiMixin, TortugaDbApi):
         nodeList = TortugaObjectList()
 
         for node in nodes:
-            self.loadRelations(node, optionDict)
+            nodeList.append(self.__convert_node(node, optionDict=optionDict))
 
-            # ensure 'resourceadapter' relation is always loaded. This one
-            # is special since it's a relationship inside of a relationship.
-            # It needs to be explicitly defined.
-            self.loadRelation(node.hardwareprofile, 'resourceadapter')
+        return nodeList
 
-            nodeList.append(Node.getFromDbDict(node.__dict__))
+    def __convert_node(self, node: NodeModel,
+                       optionDict: Optional[OptionsDict] = None) -> Node:
+        """
+        Return Node with relations populated
+        """
 
-        return nodeList
+        self.loadRelations(node, optionDict)
+
+        # ensure 'resourceadapter' relation is always loaded. This one
+        # is special since it's a relationship inside of a relationship.
+        # It needs to be explicitly defined.
+        self.loadRelation(node.hardwareprofile, 'resourceadapter')
+
+        return Node.getFromDbDict(node.__dict__)
 
     def getNodeList(self, session, tags: Optional[Tags] = None,
-                    optionDict: OptionsDict = None) -> TortugaObjectList:
+                    optionDict: OptionsDict = None,
+                    **filters) -> TortugaObjectList:
         """
-        Get list of all available nodes from the db.
+        Get list of all available nodes from the db, optionally filtered
+        (see NodesDbHandler.getNodeList()).
 
             Returns:
                 [node]
@@ -207,7 +217,8 @@ class NodeDbApi(TagsDbApiMixin, TortugaDbApi):
 
         try:
             return self.__convert_nodes_to_TortugaObjectList(
-                self._nodesDbHandler.getNodeList(session, tags=tags),
+                self._nodesDbHandler.getNodeList(session, tags=tags,
+                                                 **filters),
                 optionDict=optionDict
             )
         except TortugaException:
@@ -216,6 +227,29 @@ class NodeDbApi(TagsDbApiMixin, TortugaDbApi):
             self._logger.exception(str(ex))
             raise
 
+    def iterNodeList(self, session, tags: Optional[Tags] = None,
+                     optionDict: OptionsDict = None,
+                     **filters) -> Iterator[Node]:
+        """
+        Iterate over all available nodes from the db, optionally filtered
+        (see NodesDbHandler.iterNodeList()).
+
+            Returns:
+                iterator of nodes
+            Throws:
+                DbError
+        """
+
+        try:
+            for node in self._nodesDbHandler.iterNodeList(
+                    session, tags=tags, **filters):
+                yield self.__convert_node(node, optionDict=optionDict)
+        except TortugaException:
+            raise
+        except Exception as ex:
+            self._logger.exception(str(ex))
+            raise
+
     def getProvisioningInfo(self, session: Session, nodeName: str) \
             -> ProvisioningInfo:
         """
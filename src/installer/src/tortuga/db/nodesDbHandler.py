@@ -13,9 +13,10 @@
 # limitations under the License.
 
 # pylint: disable=not-callable,no-member,multiple-statements,no-self-use
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
 
 from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm.session import Session
 
@@ -62,6 +63,57 @@ class NodesDbHandler(TortugaDbObjectHandler):
         except NoResultFound:
             raise NodeNotFound("Node [%s] not found" % (name))
 
+    def get_existing_node_names(self, session: Session,
+                                names: Iterable[str],
+                                chunk_size: int = 500) -> Set[str]:
+        """
+        Return the subset of the specified names that match existing
+        nodes, using the same matching rules as getNode(): fully-qualified
+        names are matched exactly, short host names match either the
+        short host name or any host starting with the same host name.
+        Names are matched case-insensitively and are returned as
+        specified.
+
+        One query is issued for every 'chunk_size' names.
+
+        :param session:    a SQLAlchemy database session
+        :param names:      the node names to check
+        :param chunk_size: the maximum number of names per query
+
+        :return: the set of names that conflict with existing nodes
+
+        """
+        # map normalized names to the name(s) as specified
+        requested: Dict[str, Set[str]] = {}
+        for name in names:
+            requested.setdefault(name.lower(), set()).add(name)
+
+        normalized_names = sorted(requested.keys())
+
+        conflicts: Set[str] = set()
+
+        for idx in range(0, len(normalized_names), chunk_size):
+            chunk = normalized_names[idx:idx + chunk_size]
+
+            searchspec = [func.lower(Node.name).in_(chunk)]
+            searchspec.extend([
+                func.lower(Node.name).like(name + '.%')
+                for name in chunk if '.' not in name
+            ])
+
+            for node_name, in session.query(Node.name).filter(
+                    or_(*searchspec)):
+                node_name = node_name.lower()
+
+                # exact match on name
+                conflicts.update(requested.get(node_name, set()))
+
+                # short host name matching fully-qualified node name
+                conflicts.update(
+                    requested.get(node_name.split('.', 1)[0], set()))
+
+        return conflicts
+
     def get_installer_node(self, session: Session) -> Node:
         """
         Return installer node derived from searching for all software
@@ -153,6 +205,26 @@ class NodesDbHandler(TortugaDbObjectHandler):
         Returns a list of Node
         """
 
+        node_filter = self.__get_name_filter(filter_spec)
+
+        if not include_installer:
+            installer_fqdn = getfqdn()
+
+            return session.query(Node).filter(
+                and_(
+                    Node.name != installer_fqdn,
+                    or_(*node_filter)
+                )
+            ).all()
+
+        return session.query(Node).filter(or_(*node_filter)).all()
+
+    @staticmethod
+    def __get_name_filter(filter_spec: Union[str, list]) -> list:
+        """
+        Return list of SQL "LIKE" clauses matching the node name filter(s)
+        """
+
         filter_spec_list = [filter_spec] \
             if not isinstance(filter_spec, list) else filter_spec
 
@@ -172,17 +244,7 @@ class NodesDbHandler(TortugaDbObjectHandler):
             # (ie. "hostname-01.domain")
             node_filter.append(Node.name.like(filter_spec_item))
 
-        if not include_installer:
-            installer_fqdn = getfqdn()
-
-            return session.query(Node).filter(
-                and_(
-                    Node.name != installer_fqdn,
-                    or_(*node_filter)
-                )
-            ).all()
-
-        return session.query(Node).filter(or_(*node_filter)).all()
+        return node_filter
 
     def getNodeById(self, session: Session, _id: int) -> Node:
         """
@@ -217,23 +279,91 @@ class NodesDbHandler(TortugaDbObjectHandler):
 
     def getNodeList(self, session: Session,
                     softwareProfile: Optional[str] = None,
-                    tags: Optional[Tags] = None) -> List[Node]:
+                    tags: Optional[Tags] = None, *,
+                    nodespec: Optional[str] = None,
+                    states: Optional[List[str]] = None,
+                    exclude_states: Optional[List[str]] = None,
+                    hardwareProfile: Optional[str] = None) -> List[Node]:
         """
         Get sorted list of nodes from the db.
 
+        All of the filters provided must match. Nodes match the tags
+        filter if they have any of the tags.
+
         Raises:
             SoftwareProfileNotFound
         """
 
         self._logger.debug('getNodeList()')
 
-        if softwareProfile:
+        if softwareProfile and not (tags or nodespec or states or
+                                    exclude_states or hardwareProfile):
             dbSoftwareProfile = \
                 self._softwareProfilesDbHandler.getSoftwareProfile(
                     session, softwareProfile)
 
             return dbSoftwareProfile.nodes
 
+        return self.__get_node_list_query(
+            session, softwareProfile=softwareProfile, tags=tags,
+            nodespec=nodespec, states=states, exclude_states=exclude_states,
+            hardwareProfile=hardwareProfile).all()
+
+    def iterNodeList(self, session: Session,
+                     softwareProfile: Optional[str] = None,
+                     tags: Optional[Tags] = None, *,
+                     batch_size: int = 100,
+                     **filters) -> Iterator[Node]:
+        """
+        Iterate over sorted list of nodes from the db, loading batch_size
+        nodes at a time. Filters are the same as getNodeList().
+        """
+
+        self._logger.debug('iterNodeList()')
+
+        query = self.__get_node_list_query(
+            session, softwareProfile=softwareProfile, tags=tags, **filters
+        ).options(
+            selectinload(Node.nics),
+            selectinload(Node.tags),
+        )
+
+        #
+        # Nodes are read a page at a time, using the (unique) node name as
+        # the key for the next page. Each page is read in full before any
+        # nodes are returned, so relations can be loaded, on the same
+        # connection, as the nodes are used. This is not possible with a
+        # streamed (server-side cursor) result: on MySQL, running another
+        # query discards the rest of the streamed result.
+        #
+        last_name = None
+
+        while True:
+            page_query = query
+            if last_name is not None:
+                page_query = page_query.filter(Node.name > last_name)
+
+            nodes = page_query.limit(batch_size).all()
+
+            yield from nodes
+
+            if len(nodes) < batch_size:
+                return
+
+            last_name = nodes[-1].name
+
+    def __get_node_list_query(self, session: Session,
+                              softwareProfile: Optional[str] = None,
+                              tags: Optional[Tags] = None,
+                              nodespec: Optional[str] = None,
+                              states: Optional[List[str]] = None,
+                              exclude_states: Optional[List[str]] = None,
+                              hardwareProfile: Optional[str] = None) \
+            -> Query:
+        """
+        Return sorted node list query, see getNodeList()
+        """
+
         searchspec = []
 
         if tags:
@@ -252,8 +382,28 @@ class NodesDbHandler(TortugaDbObjectHandler):
                     #
                     searchspec.append(Node.tags.any(name=name))
 
-        return session.query(Node).filter(
-            or_(*searchspec)).order_by(Node.name).all()
+        query = session.query(Node).filter(or_(*searchspec))
+
+        if nodespec:
+            query = query.filter(or_(
+                *self.__get_name_filter(self.build_node_filterspec(nodespec))
+            ))
+
+        if states:
+            query = query.filter(Node.state.in_(states))
+
+        if exclude_states:
+            query = query.filter(~Node.state.in_(exclude_states))
+
+        if softwareProfile:
+            query = query.filter(
+                Node.softwareprofile.has(name=softwareProfile))
+
+        if hardwareProfile:
+            query = query.filter(
+                Node.hardwareprofile.has(name=hardwareProfile))
+
+        return query.order_by(Node.name)
 
     def getNodeListByNodeStateAndSoftwareProfileName(
             self, session: Session, nodeState: str,
@@ -898,8 +898,9 @@ class TortugaDeployer: \
 
         kitApi = KitApi()
 
-        # Iterate over the glob of 'kits-*.tar.bz2'
-        kitFileGlob = '%s/kits/kit-*.tar.bz2' % (self._cm.getRoot())
+        # Iterate over the glob of 'kits-*.tar.*' (kit archives may be
+        # compressed with bzip2, gzip, xz or zstd)
+        kitFileGlob = '%s/kits/kit-*.tar.*' % (self._cm.getRoot())
 
         # Split comma-separated list of kits to skip installing. Sorry, you
         # cannot skip installing the base kit.
@@ -19,3 +19,12 @@ class EventNotFoundError(Exception):
 
 class ListenerNotFoundError(Exception):
     pass
+
+
+class UnresolvableEventError(Exception):
+    """
+    Raised when a published event can no longer be loaded from the event
+    store, i.e. because it expired.
+
+    """
+    pass
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base import get_all_listener_classes, get_listnener_class, BaseListener
+from .base import (get_all_listener_classes, get_listnener_class,
+                   get_listener_classes_for_event_class, BaseListener)
 from .node import NodeProvisioningListener
 from .cloudserveraction import CloudServerActionListener
 from .tags import TagChangeListener
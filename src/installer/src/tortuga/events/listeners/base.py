@@ -23,6 +23,15 @@ from ..types import BaseEvent
 #
 EVENT_LISTENERS: Dict[str, Type['BaseListener']] = {}
 
+#
+# Dispatch table, mapping event classes to the listeners (keyed by name)
+# registered for the event class, or any of its base classes. Entries are
+# built on first use, and the table is reset whenever a listener is
+# registered.
+#
+LISTENER_DISPATCH_TABLE: Dict[Type[BaseEvent],
+                              Dict[str, Type['BaseListener']]] = {}
+
 
 def get_all_listener_classes() -> List[Type['BaseListener']]:
     """
@@ -49,6 +58,39 @@ def get_listnener_class(name: str) -> Type['BaseListener']:
         raise ListenerNotFoundError()
 
 
+def get_listener_classes_for_event_class(
+        event_class: Type[BaseEvent]) -> Dict[str, Type['BaseListener']]:
+    """
+    Gets the listeners registered for an event class, either directly,
+    through any of its base classes, or because they listen for all
+    events. This is the type-based part of BaseListener.should_run(),
+    precomputed for every event class.
+
+    :param Type[BaseEvent] event_class: the event class
+
+    :return Dict[str, Type[BaseListener]]: the listener classes, keyed by
+                                           listener name
+
+    """
+    try:
+        return LISTENER_DISPATCH_TABLE[event_class]
+    except KeyError:
+        pass
+
+    mro = set(event_class.__mro__)
+
+    listener_classes = {
+        name: listener_class
+        for name, listener_class in EVENT_LISTENERS.items()
+        if listener_class.all_events or
+        any(event_type in mro for event_type in listener_class.event_types)
+    }
+
+    LISTENER_DISPATCH_TABLE[event_class] = listener_classes
+
+    return listener_classes
+
+
 class ListenerMeta(type):
     """
     Metaclass for event listeners.
@@ -67,6 +109,7 @@ class ListenerMeta(type):
             return
 
         EVENT_LISTENERS[cls.name] = cls
+        LISTENER_DISPATCH_TABLE.clear()
 
 
 class BaseListener(metaclass=ListenerMeta):
@@ -108,14 +151,7 @@ class BaseListener(metaclass=ListenerMeta):
         :return bool: True if the listener should run, False otherwise
 
         """
-        if cls.all_events:
-            return True
-
-        for event_type in cls.event_types:
-            if isinstance(event, event_type):
-                return True
-
-        return False
+        return cls.name in get_listener_classes_for_event_class(type(event))
 
     def run_if_required(self, event: BaseEvent):
         """
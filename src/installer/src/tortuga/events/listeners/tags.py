@@ -21,7 +21,8 @@ from tortuga.db.nodesDbHandler import NodesDbHandler
 from tortuga.web_service.database import dbm
 from tortuga.events.listeners.base import BaseListener
 from tortuga.events.types.tag import BaseTagEvent
-from tortuga.events.types import TagCreated, TagUpdated, TagDeleted
+from tortuga.events.types import BaseEvent, TagCreated, TagUpdated, \
+    TagDeleted, TagsChangedBatch
 from tortuga.hardwareprofile.manager import HardwareProfileStoreManager
 from tortuga.resourceAdapter.resourceAdapter import ResourceAdapter
 from tortuga.resourceAdapter.resourceAdapterFactory import get_api
@@ -37,9 +38,44 @@ Session = sessionmaker(bind=dbm.engine)
 
 class TagChangeListener(BaseListener):
     name = 'push-tags-changes-to-resource-adapter'
-    event_types = [TagCreated, TagUpdated, TagDeleted]
+    #
+    # Tag events fired together are received as a single batch
+    #
+    event_types = [TagCreated, TagUpdated, TagDeleted, TagsChangedBatch]
 
-    def run(self, event: BaseTagEvent):
+    def run(self, event: BaseEvent):
+        if isinstance(event, TagsChangedBatch):
+            events = event.get_events()
+        else:
+            events = [event]
+
+        #
+        # A failure to push one tag change must not prevent the remaining
+        # changes in the batch from being pushed
+        #
+        failed = []
+        sess = Session()
+        try:
+            for tag_event in events:
+                try:
+                    self._run_tag_event(sess, tag_event)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception(
+                        'Error pushing tag change to resource adapter: %s',
+                        getattr(tag_event, 'tag_id', tag_event.id))
+                    sess.rollback()
+                    failed.append(tag_event)
+        finally:
+            sess.close()
+
+        if failed:
+            raise Exception(
+                'Failed to push {} of {} tag change(s): {}'.format(
+                    len(failed), len(events),
+                    ', '.join(getattr(tag_event, 'tag_id', tag_event.id)
+                              for tag_event in failed)))
+
+    def _run_tag_event(self, sess: Session, event: BaseTagEvent):
         #
         # Make sure this is the right event type, and that it is relevant
         # for this resource adapter.
@@ -67,7 +103,6 @@ class TagChangeListener(BaseListener):
         #
         # Do the actual tag update in the resource adapter
         #
-        sess = Session()
         ra = self._get_resource_adapter(sess, object_id)
         ra.session = sess
         node = NodesDbHandler().getNodeById(sess, int(object_id))
@@ -75,7 +110,6 @@ class TagChangeListener(BaseListener):
             ra.unset_node_tag(node, tag_name)
         else:
             ra.set_node_tag(node, tag_name, event.value)
-        sess.close()
 
     def _get_resource_adapter(self, sess: Session,
                               node_id: str) -> ResourceAdapter:
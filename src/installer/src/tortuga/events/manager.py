@@ -16,7 +16,8 @@ from redis import Redis
 
 from tortuga.config.configManager import ConfigManager
 from tortuga.objectstore.manager import ObjectStoreManager
-from .pubsub import EventPubSub, RedisEventPubSub
+from tortuga.redis import RedisClientManager
+from .pubsub import EventPubSub, RedisEventPubSub, RedisStreamEventPubSub
 from .store import EventStore, ObjectStoreEventStore
 
 
@@ -26,6 +27,7 @@ class EventStoreManager:
 
     """
     _event_store: EventStore = None
+    _config_manager: ConfigManager = ConfigManager()
 
     @classmethod
     def get(cls) -> EventStore:
@@ -40,7 +42,10 @@ class EventStoreManager:
             # Events only need to exist for 24 hours
             #
             object_store = ObjectStoreManager.get('events', expire=86400)
-            cls._event_store = ObjectStoreEventStore(object_store)
+            cls._event_store = ObjectStoreEventStore(
+                object_store,
+                compact=cls._config_manager.is_compact_event_storage()
+            )
         return cls._event_store
 
 
@@ -61,9 +66,12 @@ class PubSubManager:
 
         """
         if not cls._redis_client:
-            cls._redis_client = Redis(
-                password=cls._config_manager.getRedisPassword())
-        return RedisEventPubSub(
+            cls._redis_client = RedisClientManager.get()
+        if cls._config_manager.get_event_pubsub_backend() == 'streams':
+            pubsub_class = RedisStreamEventPubSub
+        else:
+            pubsub_class = RedisEventPubSub
+        return pubsub_class(
             redis_client=cls._redis_client,
             event_store=EventStoreManager.get()
         )
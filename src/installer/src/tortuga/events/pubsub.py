@@ -11,14 +11,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+import fnmatch
+import logging
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple
 
 from redis import Redis
+from redis.exceptions import ResponseError
 
+from tortuga.logging import EVENTS_NAMESPACE
+from .exceptions import UnresolvableEventError
 from .types import BaseEvent
 from .store import EventStore
 
 
+logger = logging.getLogger(EVENTS_NAMESPACE)
+
+
 class EventPubSub:
     """
     A publish/subscribe service for system events.
@@ -33,16 +42,57 @@ class EventPubSub:
         """
         raise NotImplementedError()
 
-    def subscribe(self, event_name: str = None):
+    def publish_many(self, events: List[BaseEvent]):
+        """
+        Publishes multiple events at once.
+
+        :param List[BaseEvent] events: the events to publish
+
+        """
+        for event in events:
+            self.publish(event)
+
+    def subscribe(self, event_name: str = None, since: str = None):
         """
         Subscribes to events. Once subscribed, callse to get_message will
         check for messages.
 
-        :param event_name: the event name to subscribe to, otherwise all
+        :param event_name: the event name to subscribe to, otherwise all;
+                           may be a glob-style pattern, i.e.
+                           'tag-*'
+        :param since:      resume the subscription after the event with
+                           this stream id, if supported by the back-end
 
         """
         raise NotImplementedError()
 
+    def replay(self, since: str,
+               limit: Optional[int] = None) -> Iterator[BaseEvent]:
+        """
+        Gets the events published after the event with the specified
+        stream id, if supported by the back-end.
+
+        :param str since: the stream id to start after
+        :param int limit: the maximum number of events to return
+
+        :return Iterator[BaseEvent]: the events, in the order they were
+                                     published
+
+        """
+        raise NotImplementedError(
+            'Event replay requires the streams event back-end')
+
+    def ack(self, event: BaseEvent):
+        """
+        Acknowledges that an event received through a consumer group has
+        been processed. This is a no-op for back-ends without consumer
+        groups.
+
+        :param BaseEvent event: the event to acknowledge
+
+        """
+        pass
+
     def unsubscribe(self):
         """
         Unsubscribe from the current subscription.
@@ -54,7 +104,12 @@ class EventPubSub:
         """
         Get the next event in the queue if any.
 
-        :returns Optional[BaseEvent]: the next event, or None
+        :returns Optional[BaseEvent]: the next event, or None if the queue
+                                      is empty
+
+        :raises UnresolvableEventError: if the next event in the queue can
+                                        no longer be loaded; it is removed
+                                        from the queue
 
         """
         raise NotImplementedError()
@@ -81,24 +136,54 @@ class RedisEventPubSub(EventPubSub):
 
         :param BaseEvent event:
 
+        """
+        self._publish(self._redis, event)
+
+    def publish_many(self, events: List[BaseEvent]):
+        """
+        See superclass. The events are published in a single round trip.
+
+        :param List[BaseEvent] events:
+
+        """
+        with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                self._publish(pipe, event)
+            pipe.execute()
+
+    def _publish(self, redis_client: Redis, event: BaseEvent):
+        """
+        Publishes the event using the specified redis client or pipeline.
+
+        :param Redis redis_client: the redis client or pipeline to use
+        :param BaseEvent event:    the event to publish
+
         """
         channel = '{}.{}'.format(self._namespace, event.name)
         key = '{}:{}'.format(self._namespace, event.id)
-        self._redis.publish(channel, key)
+        redis_client.publish(channel, key)
 
-    def subscribe(self, event_name: str = None):
+    def subscribe(self, event_name: str = None, since: str = None):
         """
         See superclass.
 
         :param str event_name:
+        :param str since:
 
         """
+        if since:
+            raise Exception(
+                'Resuming subscriptions requires the streams event back-end')
+
         if self._pubsub:
             raise Exception('Already subscribed')
 
         self._pubsub = self._redis.pubsub()
 
-        if event_name:
+        if event_name and '*' in event_name:
+            self._pubsub.psubscribe('{}.{}'.format(self._namespace,
+                                                   event_name))
+        elif event_name:
             self._pubsub.subscribe('{}.{}'.format(self._namespace,
                                                   event_name))
         else:
@@ -132,4 +217,307 @@ class RedisEventPubSub(EventPubSub):
         key = msg['data'].decode()
         event_id = key.replace('{}:'.format(self._namespace), '')
         event = self._store.get(event_id)
+        if event is None:
+            raise UnresolvableEventError(
+                'Event not found: {}'.format(event_id))
+
         return event
+
+
+class RedisStreamEventPubSub(EventPubSub):
+    """
+    An event pub/sub service backed by a capped Redis stream (Redis 5.0 or
+    later). Unlike Redis pub/sub, events are retained in the stream, so
+    subscribers can resume after the last event they received, and
+    consumer groups can share the work of processing events.
+
+    """
+    _namespace = 'events'
+
+    #
+    # The approximate maximum number of events retained in the stream
+    #
+    MAXLEN = 100000
+
+    #
+    # The maximum number of stream entries read per round trip
+    #
+    BATCH_SIZE = 100
+
+    def __init__(self, redis_client: Redis, event_store: EventStore):
+        """
+        Initialization.
+
+        :param Redis redis_client:     the (initialized) redis client to use
+        :param EventSTore event_store: the (initialized) event store to use
+
+        """
+        self._redis = redis_client
+        self._store = event_store
+        self._subscribed = False
+        self._event_name: Optional[str] = None
+        self._last_id: Optional[str] = None
+        self._group: Optional[str] = None
+        self._consumer: Optional[str] = None
+        self._entries: Deque[Tuple[str, dict]] = deque()
+
+    def _get_stream_key_name(self) -> str:
+        return '{}:STREAM'.format(self._namespace)
+
+    def publish(self, event: BaseEvent):
+        """
+        See superclass.
+
+        :param BaseEvent event:
+
+        """
+        stream_id = self._redis.execute_command(*self._get_xadd_args(event))
+        event.stream_id = _decode(stream_id)
+
+    def publish_many(self, events: List[BaseEvent]):
+        """
+        See superclass. The events are published in a single round trip.
+
+        :param List[BaseEvent] events:
+
+        """
+        with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.execute_command(*self._get_xadd_args(event))
+            stream_ids = pipe.execute()
+
+        for event, stream_id in zip(events, stream_ids):
+            event.stream_id = _decode(stream_id)
+
+    def _get_xadd_args(self, event: BaseEvent) -> list:
+        """
+        Gets the XADD command used to add an event to the stream.
+
+        :param BaseEvent event: the event to add
+
+        :return list: the command and its arguments
+
+        """
+        return [
+            'XADD', self._get_stream_key_name(), 'MAXLEN', '~', self.MAXLEN,
+            '*', 'name', event.name, 'id', event.id
+        ]
+
+    def subscribe(self, event_name: str = None, since: str = None,
+                  group: str = None, consumer: str = None):
+        """
+        See superclass.
+
+        :param str event_name:
+        :param str since:
+        :param str group:      the consumer group to join, events are only
+                               delivered to one consumer in the group, and
+                               should be acknowledged using ack()
+        :param str consumer:   the name of this consumer in the group
+
+        """
+        if self._subscribed:
+            raise Exception('Already subscribed')
+
+        if group:
+            if not consumer:
+                raise Exception('Consumer groups require a consumer name')
+            try:
+                self._redis.execute_command(
+                    'XGROUP', 'CREATE', self._get_stream_key_name(), group,
+                    since or '$', 'MKSTREAM'
+                )
+            except ResponseError as ex:
+                if not str(ex).startswith('BUSYGROUP'):
+                    raise
+            #
+            # Start with any events that were delivered to this consumer,
+            # but never acknowledged
+            #
+            self._last_id = '0'
+
+        elif since:
+            self._last_id = since
+
+        else:
+            self._last_id = self._get_last_stream_id()
+
+        self._event_name = event_name
+        self._group = group
+        self._consumer = consumer
+        self._subscribed = True
+
+    def _get_last_stream_id(self) -> str:
+        result = self._redis.execute_command(
+            'XREVRANGE', self._get_stream_key_name(), '+', '-', 'COUNT', 1)
+        if not result:
+            return '0'
+
+        return _decode(result[0][0])
+
+    def unsubscribe(self):
+        """
+        See superclass.
+
+        """
+        self._subscribed = False
+        self._entries.clear()
+
+    def get_message(self) -> Optional[BaseEvent]:
+        """
+        See superclass.
+
+        :return Optional[BaseEvent]:
+
+        """
+        if not self._subscribed:
+            raise Exception('No subscription')
+
+        if not self._entries:
+            self._read()
+
+        while self._entries:
+            stream_id, fields = self._entries.popleft()
+            event = self._load_event(stream_id, fields)
+            if event is not None:
+                return event
+
+        return None
+
+    def _read(self):
+        """
+        Reads the next batch of entries from the stream, without blocking.
+
+        """
+        if self._group:
+            result = self._redis.execute_command(
+                'XREADGROUP', 'GROUP', self._group, self._consumer,
+                'COUNT', self.BATCH_SIZE,
+                'STREAMS', self._get_stream_key_name(), self._last_id
+            )
+        else:
+            result = self._redis.execute_command(
+                'XREAD', 'COUNT', self.BATCH_SIZE,
+                'STREAMS', self._get_stream_key_name(), self._last_id
+            )
+
+        entries = _parse_entries(result[0][1]) if result else []
+
+        if self._group:
+            #
+            # Once there are no more pending entries for this consumer,
+            # switch to reading new entries
+            #
+            if self._last_id != '>' and not entries:
+                self._last_id = '>'
+                return self._read()
+            if self._last_id != '>':
+                self._last_id = entries[-1][0]
+        elif entries:
+            self._last_id = entries[-1][0]
+
+        self._entries.extend(entries)
+
+    def _load_event(self, stream_id: str,
+                    fields: dict) -> Optional[BaseEvent]:
+        """
+        Loads the event referenced by a stream entry, provided it matches
+        the subscription.
+
+        :param str stream_id: the stream id of the entry
+        :param dict fields:   the fields of the entry
+
+        :return Optional[BaseEvent]: the event if it matches, None
+                                     otherwise
+
+        :raises UnresolvableEventError: if the event no longer exists
+
+        """
+        if self._event_name and \
+                not fnmatch.fnmatchcase(fields.get('name', ''),
+                                        self._event_name):
+            self._ack(stream_id)
+            return None
+
+        event = self._store.get(fields.get('id'))
+        if event is None:
+            self._ack(stream_id)
+            raise UnresolvableEventError(
+                'Event in stream not found: {}'.format(fields))
+
+        event.stream_id = stream_id
+
+        return event
+
+    def ack(self, event: BaseEvent):
+        """
+        See superclass.
+
+        :param BaseEvent event:
+
+        """
+        self._ack(event.stream_id)
+
+    def _ack(self, stream_id: str):
+        if self._group and stream_id:
+            self._redis.execute_command(
+                'XACK', self._get_stream_key_name(), self._group, stream_id)
+
+    def replay(self, since: str,
+               limit: Optional[int] = None) -> Iterator[BaseEvent]:
+        """
+        See superclass.
+
+        :param str since:
+        :param int limit:
+
+        :return Iterator[BaseEvent]:
+
+        """
+        count = 0
+        last_id = since
+        while True:
+            result = self._redis.execute_command(
+                'XREAD', 'COUNT', self.BATCH_SIZE,
+                'STREAMS', self._get_stream_key_name(), last_id
+            )
+            entries = _parse_entries(result[0][1]) if result else []
+            if not entries:
+                return
+
+            for stream_id, fields in entries:
+                last_id = stream_id
+                event = self._store.get(fields.get('id'))
+                if event is None:
+                    continue
+                event.stream_id = stream_id
+                yield event
+
+                count += 1
+                if limit and count >= limit:
+                    return
+
+
+def _decode(value) -> str:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
+def _parse_entries(entries: list) -> List[Tuple[str, dict]]:
+    """
+    Parses the raw stream entries returned by XREAD/XREADGROUP.
+
+    :param list entries: the raw entries, [[id, [field, value, ...]], ...]
+
+    :return List[Tuple[str, dict]]: the parsed entries, (id, fields)
+
+    """
+    parsed = []
+    for stream_id, fields in entries:
+        fields = [_decode(f) for f in fields or []]
+        parsed.append(
+            (_decode(stream_id), dict(zip(fields[::2], fields[1::2])))
+        )
+
+    return parsed
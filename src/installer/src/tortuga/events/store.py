@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional
 
 from tortuga.logging import EVENTS_NAMESPACE
+from tortuga.objectstore.base import ObjectStore
 from tortuga.typestore.objectstore import ObjectStoreTypeStore
 from .types import BaseEvent
 from .types import get_event_class
@@ -38,6 +40,16 @@ class EventStore:
         """
         raise NotImplementedError()
 
+    def save_many(self, events: List[BaseEvent]):
+        """
+        Saves multiple events to the event store at once.
+
+        :param List[BaseEvent] events: the events to save
+
+        """
+        for event in events:
+            self.save(event)
+
     def get(self, event_id: str) -> Optional[BaseEvent]:
         """
         Gets an event from the event store.
@@ -74,14 +86,83 @@ class EventStore:
 
 class ObjectStoreEventStore(ObjectStoreTypeStore, EventStore):
     type_class = BaseEvent
+    #
+    # Events are never updated once they are fired
+    #
+    versioned = False
+    #
+    # In compact mode, the whole event is stored as a single JSON blob in
+    # this field, prefixed by the blob format version, i.e. "1:{...}"
+    #
+    BLOB_FIELD = '__event__'
+    BLOB_VERSION = 1
+    #
+    # Fields that are stored alongside the blob in compact mode, so that
+    # events can still be sorted by them
+    #
+    BLOB_INDEX_FIELDS = ['id', 'name', 'timestamp']
+
+    def __init__(self, object_store: ObjectStore, compact: bool = False):
+        """
+        Initialization.
+
+        :param ObjectStore object_store: the object store to use
+        :param bool compact:             store events as a single blob,
+                                         rather than field by field. Events
+                                         can then only be sorted by the
+                                         BLOB_INDEX_FIELDS.
+
+        """
+        super().__init__(object_store)
+        self._compact = compact
+
+    def save_many(self, events: List[BaseEvent]):
+        """
+        See superclass.
+
+        :param List[BaseEvent] events:
+
+        """
+        self._store.set_many({
+            event.id: self.encode(self.marshall(event)) for event in events
+        })
 
     def marshall(self, obj: BaseEvent) -> dict:
-        schema_class = obj.get_schema_class()
-        marshalled = schema_class().dump(obj)
-        return marshalled.data
+        data = obj.get_schema().dump(obj).data
+        #
+        # The stream id is assigned when the event is published, after it
+        # has been stored
+        #
+        data.pop('stream_id', None)
+        return data
 
     def unmarshall(self, obj_dict: dict) -> BaseEvent:
         event_class = get_event_class(obj_dict['name'])
-        schema_class = event_class.get_schema_class()
-        unmarshalled = schema_class().load(obj_dict)
+        unmarshalled = event_class.get_schema().load(obj_dict)
         return event_class(**unmarshalled.data)
+
+    def encode(self, obj_dict: dict) -> dict:
+        if not self._compact:
+            return obj_dict
+
+        stored = {k: obj_dict[k] for k in self.BLOB_INDEX_FIELDS
+                  if k in obj_dict}
+        stored[self.BLOB_FIELD] = '{}:{}'.format(
+            self.BLOB_VERSION, json.dumps(obj_dict, separators=(',', ':')))
+
+        return stored
+
+    def decode(self, stored: dict) -> dict:
+        #
+        # Events stored field by field are always loaded as-is, regardless
+        # of the current mode
+        #
+        if self.BLOB_FIELD not in stored:
+            return stored
+
+        version, _, blob = stored[self.BLOB_FIELD].partition(':')
+        if version != str(self.BLOB_VERSION):
+            raise Exception(
+                'Unsupported event format version: {}'.format(version))
+
+        return json.loads(blob)
@@ -16,7 +16,8 @@ from typing import Type
 from tortuga.events.types import BaseEvent, get_event_class
 from tortuga.tasks.celery import app
 
-from .listeners import get_listnener_class, BaseListener
+from .listeners import (get_listener_classes_for_event_class,
+                        get_listnener_class, BaseListener)
 
 
 @app.task()
@@ -28,6 +29,15 @@ def run_event_listener(listener_name: str, event_dict: dict):
     :param dict event_dict:   the event, serialized as a dict
 
     """
+    #
+    # Skip the unmarshalling of the event altogether if the listener is
+    # not registered for the event type
+    #
+    event_class = get_event_class(event_dict['name'])
+    if listener_name not in get_listener_classes_for_event_class(
+            event_class):
+        return
+
     #
     # Load the event listener
     #
@@ -37,9 +47,7 @@ def run_event_listener(listener_name: str, event_dict: dict):
     #
     # Unmarshall the event
     #
-    event_class = get_event_class(event_dict['name'])
-    schema_class = event_class.get_schema_class()
-    unmarshalled = schema_class().load(event_dict)
+    unmarshalled = event_class.get_schema().load(event_dict)
     event: BaseEvent = event_class(**unmarshalled.data)
 
     #
@@ -20,8 +20,11 @@ from .cloudserveraction import (CloudServerActionCreated,
                                 CloudServerActionDeleted)
 from .noderequest import (AddNodeRequestComplete, AddNodeRequestQueued,
                           DeleteNodeRequestComplete, DeleteNodeRequestQueued)
+from .resourceadapterconfiguration import (
+    ResourceAdapterConfigurationCreated, ResourceAdapterConfigurationUpdated,
+    ResourceAdapterConfigurationDeleted)
 from .resourcerequest import (ResourceRequestCreated, ResourceRequestUpdated,
                               ResourceRequestDeleted)
 from .software_profile import SoftwareProfileTagsChanged
-from .tag import TagCreated, TagUpdated, TagDeleted
+from .tag import TagCreated, TagUpdated, TagDeleted, TagsChangedBatch
 from .task import TaskFailed
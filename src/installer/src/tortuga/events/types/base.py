@@ -13,10 +13,10 @@
 # limitations under the License.
 
 import datetime
-from typing import Dict, Type
+from typing import Dict, List, Optional, Type
 import uuid
 
-from marshmallow import fields
+from marshmallow import fields, Schema
 
 from tortuga.types.base import BaseTypeSchema, BaseType
 from ..exceptions import EventNotFoundError
@@ -27,6 +27,12 @@ from ..exceptions import EventNotFoundError
 #
 EVENT_TYPES: Dict[str, Type['BaseEvent']] = {}
 
+#
+# Dictionary, storing schema instances for event classes, so that they
+# don't have to be re-created every time an event is (un)marshalled
+#
+EVENT_SCHEMAS: Dict[Type['BaseEvent'], Schema] = {}
+
 
 def get_event_class(name: str) -> Type['BaseEvent']:
     """
@@ -70,6 +76,7 @@ class BaseEventSchema(BaseTypeSchema):
     """
     name: fields.Field = fields.String(dump_only=True)
     timestamp: fields.Field = fields.DateTime()
+    stream_id: fields.Field = fields.String(dump_only=True)
 
 
 class BaseEvent(BaseType, metaclass=EventMeta):
@@ -86,6 +93,19 @@ class BaseEvent(BaseType, metaclass=EventMeta):
 
     name: str = 'base'
 
+    #
+    # The id of the event in the event stream, only set when the event was
+    # published to, or received from, the streams pub/sub back-end
+    #
+    stream_id: Optional[str] = None
+
+    #
+    # The name of the event type used to deliver batches of these events,
+    # fired using fire_many(), to the listeners that opt in to batches by
+    # listening for it
+    #
+    batch_event_name: Optional[str] = None
+
     def __init__(self, **kwargs):
         """
         Initialization.
@@ -97,6 +117,20 @@ class BaseEvent(BaseType, metaclass=EventMeta):
         super().__init__(**kwargs)
         self.timestamp: datetime.datetime = kwargs.get('timestamp', None)
 
+    @classmethod
+    def get_schema(cls) -> Schema:
+        """
+        Gets a (shared) schema instance for the event class.
+
+        :return Schema: the schema instance
+
+        """
+        try:
+            return EVENT_SCHEMAS[cls]
+        except KeyError:
+            schema = cls.get_schema_class()()
+            EVENT_SCHEMAS[cls] = schema
+            return schema
 
     @classmethod
     def fire(cls, **kwargs) -> 'BaseEvent':
@@ -126,6 +160,38 @@ class BaseEvent(BaseType, metaclass=EventMeta):
 
         return event
 
+    @classmethod
+    def fire_many(cls, events: List['BaseEvent']) -> List['BaseEvent']:
+        """
+        Fires multiple events at once. This is the same as firing each
+        event individually, except that:
+
+        - All of the events are stored in the event store, and published,
+          in a single round trip
+        - Listeners that listen for the batch event type of the events
+          (see batch_event_name) are run once, for a batch event containing
+          all of the events they should run for, rather than once per event
+
+        :param List[BaseEvent] events: the (new) event instances to fire,
+                                       i.e. [TagCreated(tag_id=...), ...]
+
+        :return: the fired event instances
+
+        """
+        if not events:
+            return events
+
+        timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
+        for event in events:
+            event.id = str(uuid.uuid4())
+            event.timestamp = timestamp
+
+        cls._store_events(events)
+        cls._publish_events(events)
+        cls._schedule_batch_event_listeners(events)
+
+        return events
+
     @classmethod
     def _store_event(cls, event: 'BaseEvent'):
         """
@@ -139,6 +205,19 @@ class BaseEvent(BaseType, metaclass=EventMeta):
         store = EventStoreManager.get()
         store.save(event)
 
+    @classmethod
+    def _store_events(cls, events: List['BaseEvent']):
+        """
+        Stores multiple events in the event store.
+
+        :param List[BaseEvent] events:
+
+        """
+        from ..manager import EventStoreManager
+
+        store = EventStoreManager.get()
+        store.save_many(events)
+
     @classmethod
     def _publish_event(cls, event: 'BaseEvent'):
         """
@@ -152,6 +231,19 @@ class BaseEvent(BaseType, metaclass=EventMeta):
         pubsub = PubSubManager.get()
         pubsub.publish(event)
 
+    @classmethod
+    def _publish_events(cls, events: List['BaseEvent']):
+        """
+        Publishes multiple events to the pubsub.
+
+        :param List[BaseEvent] events:
+
+        """
+        from ..manager import PubSubManager
+
+        pubsub = PubSubManager.get()
+        pubsub.publish_many(events)
+
     @classmethod
     def _schedule_event_listeners(cls, event: 'BaseEvent'):
         """
@@ -160,17 +252,90 @@ class BaseEvent(BaseType, metaclass=EventMeta):
         :param BaseEvent event:
 
         """
-        from ..listeners import get_all_listener_classes
+        from ..listeners import get_listener_classes_for_event_class
+
+        listener_classes = [
+            listener_class for listener_class in
+            get_listener_classes_for_event_class(type(event)).values()
+            if listener_class.should_run(event)
+        ]
+        if not listener_classes:
+            return
+
+        event_dict = event.get_schema().dump(event).data
+        for listener_class in listener_classes:
+            cls._schedule_event_listener(listener_class, event_dict)
+
+    @classmethod
+    def _schedule_batch_event_listeners(cls, events: List['BaseEvent']):
+        """
+        Schedules all event listeners to run for multiple events, grouping
+        the events into batches for the listeners that accept them.
+
+        :param List[BaseEvent] events:
+
+        """
+        from ..listeners import get_listener_classes_for_event_class
+
+        #
+        # The events to send to each listener in a batch, keyed by the
+        # listener and the batch event name
+        #
+        batches: Dict[tuple, List[dict]] = {}
+
+        for event in events:
+            batch_listener_classes = {}
+            if event.batch_event_name:
+                batch_listener_classes = get_listener_classes_for_event_class(
+                    get_event_class(event.batch_event_name))
+
+            event_dict = None
+            for listener_class in get_listener_classes_for_event_class(
+                    type(event)).values():
+                if not listener_class.should_run(event):
+                    continue
+                if event_dict is None:
+                    event_dict = event.get_schema().dump(event).data
+                #
+                # Listeners that run for all events still get the events
+                # one at a time
+                #
+                if listener_class.name in batch_listener_classes and \
+                        not listener_class.all_events:
+                    batches.setdefault(
+                        (listener_class, event.batch_event_name), []
+                    ).append(event_dict)
+                else:
+                    cls._schedule_event_listener(listener_class, event_dict)
+
+        for (listener_class, batch_event_name), event_dicts in \
+                batches.items():
+            batch_event_class = get_event_class(batch_event_name)
+            batch_event = batch_event_class(events=event_dicts)
+            batch_event.id = str(uuid.uuid4())
+            batch_event.timestamp = datetime.datetime.now(
+                tz=datetime.timezone.utc)
+            cls._schedule_event_listener(
+                listener_class,
+                batch_event.get_schema().dump(batch_event).data
+            )
+
+    @classmethod
+    def _schedule_event_listener(cls, listener_class: type,
+                                 event_dict: dict):
+        """
+        Schedules an event listener to run for an event.
+
+        :param Type[BaseListener] listener_class: the listener to run
+        :param dict event_dict:                   the marshalled event
+
+        """
         from ..tasks import run_event_listener
 
-        schema_class = event.get_schema_class()
-        event_dict = schema_class().dump(event).data
-        for listener_class in get_all_listener_classes():
-            if listener_class.should_run(event):
-                kwargs = {}
-                if listener_class.countdown is not None:
-                    kwargs['countdown'] = listener_class.countdown
-                run_event_listener.apply_async(
-                    args=[listener_class.name, event_dict],
-                    **kwargs
-                )
+        kwargs = {}
+        if listener_class.countdown is not None:
+            kwargs['countdown'] = listener_class.countdown
+        run_event_listener.apply_async(
+            args=[listener_class.name, event_dict],
+            **kwargs
+        )
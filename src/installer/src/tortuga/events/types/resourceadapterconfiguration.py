@@ -0,0 +1,79 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Tags 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from marshmallow import fields
+
+from .base import BaseEvent, BaseEventSchema
+
+
+class BaseResourceAdapterConfigurationSchema(BaseEventSchema):
+    """
+    Schema for resource adapter configuration profile events.
+
+    """
+    resourceadapter_name = fields.String()
+    profile_name = fields.String()
+
+
+class BaseResourceAdapterConfigurationEvent(BaseEvent):
+    """
+    Event that fires when stuff happens to resource adapter configuration
+    profiles.
+
+    """
+    schema_class = BaseResourceAdapterConfigurationSchema
+
+    def __init__(self, **kwargs):
+        """
+        Initializer.
+
+        :param str resourceadapter_name: the name of the resource adapter
+        :param str profile_name:         the name of the configuration
+                                         profile
+
+        """
+        super().__init__(**kwargs)
+        self.resourceadapter_name: str = \
+            kwargs.get('resourceadapter_name', None)
+        self.profile_name: str = kwargs.get('profile_name', None)
+
+
+class ResourceAdapterConfigurationCreated(
+        BaseResourceAdapterConfigurationEvent):
+    """
+    Event that fires when a resource adapter configuration profile is
+    created.
+
+    """
+    name = 'resource-adapter-configuration-created'
+
+
+class ResourceAdapterConfigurationUpdated(
+        BaseResourceAdapterConfigurationEvent):
+    """
+    Event that fires when a resource adapter configuration profile is
+    updated.
+
+    """
+    name = 'resource-adapter-configuration-updated'
+
+
+class ResourceAdapterConfigurationDeleted(
+        BaseResourceAdapterConfigurationEvent):
+    """
+    Event that fires when a resource adapter configuration profile is
+    deleted.
+
+    """
+    name = 'resource-adapter-configuration-deleted'
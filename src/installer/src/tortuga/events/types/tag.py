@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import List
+
 from marshmallow import fields
 
-from .base import BaseEvent, BaseEventSchema
+from .base import BaseEvent, BaseEventSchema, get_event_class
 
 
 class BaseTagSchema(BaseEventSchema):
@@ -31,6 +33,8 @@ class BaseTagEvent(BaseEvent):
     Event that fires when stuff happens to tags.
 
     """
+    batch_event_name = 'tags-changed-batch'
+
     def __init__(self, **kwargs):
         """
         Initializer.
@@ -84,3 +88,48 @@ class TagDeleted(BaseTagEvent):
     """
     name = 'tag-deleted'
     schema_class = BaseTagSchema
+
+
+class TagsChangedBatchSchema(BaseEventSchema):
+    """
+    Schema for the TagsChangedBatch events.
+
+    """
+    events = fields.List(fields.Dict())
+
+
+class TagsChangedBatch(BaseEvent):
+    """
+    A batch of tag events, fired together using BaseEvent.fire_many(). This
+    event is only sent to the listeners that listen for it, instead of the
+    individual tag events.
+
+    """
+    name = 'tags-changed-batch'
+    schema_class = TagsChangedBatchSchema
+
+    def __init__(self, **kwargs):
+        """
+        Initializer.
+
+        :param List[dict] events: the marshalled tag events in the batch
+        :param kwargs:            see superclass for additional params
+
+        """
+        super().__init__(**kwargs)
+        self.events: List[dict] = kwargs.get('events', [])
+
+    def get_events(self) -> List[BaseTagEvent]:
+        """
+        Gets the tag events in the batch, in the order they were fired.
+
+        :return List[BaseTagEvent]: the tag events
+
+        """
+        events = []
+        for event_dict in self.events:
+            event_class = get_event_class(event_dict['name'])
+            unmarshalled = event_class.get_schema().load(event_dict)
+            events.append(event_class(**unmarshalled.data))
+
+        return events
@@ -21,8 +21,8 @@ from tortuga.db.dbManager import DbManager
 from tortuga.db.models.hardwareProfile import \
     HardwareProfile as DbHardwareProfile
 from tortuga.db.models.hardwareProfileTag import HardwareProfileTag
-from tortuga.events.types import HardwareProfileTagsChanged, TagCreated, \
-    TagUpdated, TagDeleted
+from tortuga.events.types import BaseEvent, HardwareProfileTagsChanged, \
+    TagCreated, TagUpdated, TagDeleted
 from tortuga.objectstore.base import matches_filters
 from tortuga.typestore.base import TypeStore
 from .types import HardwareProfile
@@ -41,25 +41,21 @@ class SqlalchemySessionHardwareProfileStore(TypeStore):
     def __init__(self, db_manager: DbManager):
         self._Session = sessionmaker(bind=db_manager.engine)
 
-    def _to_db_hwp(
-            self,
-            hwp: HardwareProfile,
-            session: Session) -> Tuple[Optional[DbHardwareProfile], List, List, List]:
-        if hwp.id:
-            db_hwp = session.query(DbHardwareProfile).filter(
-                DbHardwareProfile.id == int(hwp.id)).first()
-            if not db_hwp:
-                return None, [], [], []
-        else:
+    def _get_db_hwp(self, hwp: HardwareProfile,
+                    session: Session) -> Optional[DbHardwareProfile]:
+        if not hwp.id:
             raise Exception('Creating hwps is currently not supported')
+
+        return session.query(DbHardwareProfile).filter(
+            DbHardwareProfile.id == int(hwp.id)).first()
+
+    def _to_db_hwp(self, hwp: HardwareProfile,
+                   db_hwp: DbHardwareProfile) -> Tuple[List, List, List]:
         db_hwp.name = hwp.name
         db_hwp.description = hwp.description
         db_hwp.name_format = hwp.name_format
         db_hwp.resourceAdapterId = hwp.resourceadapter_id
-        tag_create_events, tag_update_events, tag_delete_events = \
-            self._set_db_hwp_tags(db_hwp, hwp.tags)
-        
-        return db_hwp, tag_create_events, tag_update_events, tag_delete_events
+        return self._set_db_hwp_tags(db_hwp, hwp.tags)
 
     def _set_db_hwp_tags(self, db_hwp: DbHardwareProfile,
                          tags: Dict[str, str]) -> Tuple[List, List, List]:
@@ -122,7 +118,7 @@ class SqlalchemySessionHardwareProfileStore(TypeStore):
             # Note: currently, order_alpha is ignored for SqlAlchemy,
             #       as it is the default behavior for strings
             #
-            if desc:
+            if order_desc:
                 result = result.order_by(desc(getattr(DbHardwareProfile, order_by)))
             else:
                 result = result.order_by(getattr(DbHardwareProfile, order_by))
@@ -153,18 +149,23 @@ class SqlalchemySessionHardwareProfileStore(TypeStore):
     def save(self, obj: HardwareProfile) -> HardwareProfile:
         logger.debug('save(obj=%s) -> ...', obj)
 
-        hwp_old = None
-        if obj.id:
-            hwp_old = self.get(obj.id)
-
         session = self._Session()
-        db_hwp, tag_create_events, tag_update_events, tag_delete_events = \
-            self._to_db_hwp(obj, session)
-        if not db_hwp:
-            raise Exception('HardwareProfile ID not found: %s', obj.id)
-        session.commit()
-        hwp = self._to_hwp(db_hwp)
-        session.close()
+        try:
+            db_hwp = self._get_db_hwp(obj, session)
+            if not db_hwp:
+                raise Exception('HardwareProfile ID not found: %s', obj.id)
+            #
+            # Snapshot the previous state from the loaded row before it is
+            # modified, and the new state before the commit expires it, so
+            # that neither requires another round trip to the database
+            #
+            hwp_old = self._to_hwp(db_hwp)
+            tag_create_events, tag_update_events, tag_delete_events = \
+                self._to_db_hwp(obj, db_hwp)
+            hwp = self._to_hwp(db_hwp)
+            session.commit()
+        finally:
+            session.close()
 
         self._fire_events(hwp_old, hwp)
         self._fire_tag_events(hwp.id, tag_create_events, tag_update_events,
@@ -197,22 +198,28 @@ class SqlalchemySessionHardwareProfileStore(TypeStore):
         # delete then a create, which can have undesirable effects when the
         # create happens before the delete
         #
+        events: List[BaseEvent] = []
         for evt in deleted:
-            TagDeleted.fire(
+            events.append(TagDeleted(
                 tag_id='hardwareprofile:{}:{}'.format(
                     hardwareprofile_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in created:
-            TagCreated.fire(
+            events.append(TagCreated(
                 tag_id='hardwareprofile:{}:{}'.format(
                     hardwareprofile_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in updated:
-            TagUpdated.fire(
+            events.append(TagUpdated(
                 tag_id='hardwareprofile:{}:{}'.format(
                     hardwareprofile_id, evt['name']),
                 value=evt['value'],
                 previous_value=evt['previous_value']
-            )
+            ))
+        #
+        # Store and publish the events together, and send them as a batch
+        # to the listeners that accept batches
+        #
+        BaseEvent.fire_many(events)
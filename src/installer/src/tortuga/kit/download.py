@@ -0,0 +1,406 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Resumable, checksum verified downloads of kit archives and OS media.
+
+Files are downloaded into a hidden .<file>.part file, which is renamed
+once the download is complete and verified. If the connection is lost,
+the download is resumed from the end of the .part file using an HTTP
+Range request, both within a single call (up to the retry limit) and
+across calls (e.g. after an installer restart).
+
+"""
+
+import hashlib
+import http.client
+import logging
+import os
+import posixpath
+import socket
+import stat
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from tortuga.exceptions.checksumMismatch import ChecksumMismatch
+from tortuga.exceptions.fileNotFound import FileNotFound
+from tortuga.exceptions.operationFailed import OperationFailed
+from tortuga.exceptions.remoteCommunicationFailed import \
+    RemoteCommunicationFailed
+from tortuga.logging import KIT_NAMESPACE
+
+
+logger = logging.getLogger(KIT_NAMESPACE)
+
+
+#
+# The name of the checksum manifest that is looked for in the same
+# directory as a downloaded file. The format is the same as the output of
+# sha256sum(1).
+#
+MANIFEST_FILE_NAME = 'SHA256SUMS'
+
+PART_SUFFIX = '.part'
+
+CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_RETRIES = 5
+
+DEFAULT_TIMEOUT = 60
+
+DEFAULT_WORKERS = 4
+
+#
+# Errors that cause a download to be retried (resumed)
+#
+RETRY_EXCEPTIONS = (
+    http.client.HTTPException,
+    ConnectionError,
+    socket.timeout,
+    urllib.error.URLError,
+)
+
+
+def get_part_path(dest_path: str) -> str:
+    """
+    Gets the path of the file a download is written to until it is
+    complete. The file is hidden, so that it is not mistaken for a
+    complete file (i.e. by globs such as kit-*.tar.*).
+
+    :param str dest_path: the path the file is downloaded to
+
+    :return str: the path to the .part file
+
+    """
+    dest_dir, file_name = os.path.split(dest_path)
+
+    return os.path.join(dest_dir, '.{}{}'.format(file_name, PART_SUFFIX))
+
+
+def make_private_dir(path: str) -> str:
+    """
+    Creates a directory, accessible only by the current user, to download
+    files to. If the directory already exists, it must be owned by the
+    current user, so that partial downloads in it can't have been planted
+    or tampered with by other users.
+
+    :param str path: the path to the directory
+
+    :return str: the path to the directory
+
+    :raises OperationFailed: if the directory is not owned by the current
+                             user
+
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.geteuid():
+        raise OperationFailed(
+            'Download directory [{}] is not a directory owned by the'
+            ' current user'.format(path))
+
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        os.chmod(path, 0o700)
+
+    return path
+
+
+def _discard_foreign_part(part_path: str) -> None:
+    """
+    Removes a .part file that is not a regular file owned by the current
+    user, so that it is not resumed.
+
+    """
+    try:
+        st = os.lstat(part_path)
+    except FileNotFoundError:
+        return
+
+    if stat.S_ISREG(st.st_mode) and st.st_uid == os.geteuid():
+        return
+
+    logger.warning('Discarding partial download [{}], not a file owned by'
+                   ' the current user'.format(part_path))
+
+    os.unlink(part_path)
+
+
+class IncompleteDownload(Exception):
+    """
+    Raised when the connection is closed before the whole file has been
+    received.
+
+    """
+    pass
+
+
+def parse_manifest(content: str) -> Dict[str, str]:
+    """
+    Parses a sha256sum(1) style manifest.
+
+    :param str content: the manifest content
+
+    :return Dict[str, str]: a map of file name to SHA-256 hex digest
+
+    """
+    checksums = {}
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        try:
+            digest, file_name = line.split(None, 1)
+        except ValueError:
+            logger.warning('Invalid manifest line: {}'.format(line))
+            continue
+
+        #
+        # Binary mode entries are prefixed with '*'
+        #
+        checksums[file_name.lstrip('*')] = digest.lower()
+
+    return checksums
+
+
+def get_manifest_checksum(url: str,
+                          timeout: int = DEFAULT_TIMEOUT) -> Optional[str]:
+    """
+    Looks up the SHA-256 checksum of a file in the manifest found in the
+    same directory as the file.
+
+    :param str url:     the URL of the file
+    :param int timeout: the connection timeout, in seconds
+
+    :return str: the SHA-256 hex digest, or None if there is no manifest,
+                 or the file is not listed in it
+
+    """
+    parsed = urllib.parse.urlparse(url)
+    manifest_url = urllib.parse.urlunparse(parsed._replace(
+        path=posixpath.join(posixpath.dirname(parsed.path),
+                            MANIFEST_FILE_NAME)
+    ))
+
+    try:
+        with urllib.request.urlopen(manifest_url, timeout=timeout) as fp:
+            content = fp.read().decode()
+    except (OSError, urllib.error.URLError, http.client.HTTPException) as ex:
+        logger.debug('No checksum manifest [{}]: {}'.format(
+            manifest_url, ex))
+        return None
+
+    return parse_manifest(content).get(posixpath.basename(parsed.path))
+
+
+def _file_sha256(path: str) -> 'hashlib._Hash':
+    """
+    Returns a SHA-256 hash object, updated with the contents of a file.
+
+    """
+    sha256 = hashlib.sha256()
+
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+
+    return sha256
+
+
+def _fetch(url: str, part_path: str, timeout: int) -> 'hashlib._Hash':
+    """
+    Fetches a URL into a .part file, resuming from the end of the .part
+    file if possible.
+
+    :return: the SHA-256 hash of the complete .part file
+
+    :raises IncompleteDownload:
+    :raises FileNotFound:
+
+    """
+    offset = 0
+    if os.path.exists(part_path):
+        offset = os.path.getsize(part_path)
+
+    request = urllib.request.Request(url)
+    if offset and urllib.parse.urlparse(url).scheme in ('http', 'https'):
+        request.add_header('Range', 'bytes={}-'.format(offset))
+
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as ex:
+        if ex.code == 404:
+            raise FileNotFound('File not found at URL [{}]'.format(url))
+
+        if ex.code == 416:
+            #
+            # The .part file is not a prefix of the file (i.e. the file has
+            # changed, or the .part file is already complete). Start over,
+            # and let the checksum decide.
+            #
+            logger.debug('Range not satisfiable, restarting download'
+                         ' [{}]'.format(url))
+            os.unlink(part_path)
+            return _fetch(url, part_path, timeout)
+
+        raise
+
+    with response:
+        if getattr(response, 'status', None) == 206:
+            logger.debug('Resuming download [{}] at {} bytes'.format(
+                url, offset))
+            sha256 = _file_sha256(part_path)
+            mode = 'ab'
+        else:
+            sha256 = hashlib.sha256()
+            offset = 0
+            mode = 'wb'
+
+        length = response.headers.get('Content-Length')
+        expected_size = offset + int(length) if length else None
+
+        with open(part_path, mode) as fp:
+            for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                fp.write(chunk)
+                sha256.update(chunk)
+
+            size = fp.tell()
+
+    if expected_size is not None and size < expected_size:
+        raise IncompleteDownload(
+            'Connection closed after {} of {} bytes [{}]'.format(
+                size, expected_size, url))
+
+    return sha256
+
+
+def download_file(url: str, dest_path: str, sha256: Optional[str] = None,
+                  retries: int = DEFAULT_RETRIES,
+                  timeout: int = DEFAULT_TIMEOUT) -> str:
+    """
+    Downloads a file, resuming the download if the connection is lost,
+    and verifying its SHA-256 checksum.
+
+    :param str url:       the URL to download
+    :param str dest_path: the path to download the file to
+    :param str sha256:    the expected SHA-256 hex digest of the file. If
+                          not specified, it is looked up in the SHA256SUMS
+                          manifest next to the file, if there is one.
+    :param int retries:   the number of times to resume a failed download
+    :param int timeout:   the connection timeout, in seconds
+
+    :return str: the path to the downloaded file
+
+    :raises FileNotFound:
+    :raises ChecksumMismatch:
+    :raises RemoteCommunicationFailed:
+
+    """
+    if sha256 is None:
+        sha256 = get_manifest_checksum(url, timeout=timeout)
+
+    if sha256 and os.path.exists(dest_path) and \
+            _file_sha256(dest_path).hexdigest() == sha256.lower():
+        logger.debug('File [{}] already downloaded, skipping'.format(
+            dest_path))
+        return dest_path
+
+    part_path = get_part_path(dest_path)
+    _discard_foreign_part(part_path)
+
+    logger.debug('Downloading [{}] -> [{}]'.format(url, dest_path))
+
+    attempt = 0
+    while True:
+        try:
+            digest = _fetch(url, part_path, timeout).hexdigest()
+            break
+
+        except FileNotFound:
+            raise
+
+        except urllib.error.HTTPError as ex:
+            #
+            # Don't retry errors that won't go away
+            #
+            if ex.code < 500:
+                raise RemoteCommunicationFailed(
+                    'Error downloading [{}]: {}'.format(url, ex))
+
+            error = ex
+
+        except (IncompleteDownload, *RETRY_EXCEPTIONS) as ex:
+            error = ex
+
+        attempt += 1
+        if attempt > retries:
+            raise RemoteCommunicationFailed(
+                'Error downloading [{}]: {}'.format(url, error))
+
+        logger.warning('Download interrupted, retrying ({}/{}): {}'.format(
+            attempt, retries, error))
+
+        time.sleep(min(2 ** (attempt - 1), 30))
+
+    if sha256 and digest != sha256.lower():
+        os.unlink(part_path)
+
+        raise ChecksumMismatch(
+            'Checksum mismatch for [{}]: expected {}, got {}'.format(
+                url, sha256, digest))
+
+    os.replace(part_path, dest_path)
+
+    logger.debug('Successfully downloaded file [{}]'.format(dest_path))
+
+    return dest_path
+
+
+def download_files(urls: List[str], dest_dir: str,
+                   workers: int = DEFAULT_WORKERS, **kwargs) -> List[str]:
+    """
+    Downloads files concurrently into a directory.
+
+    :param List[str] urls: the URLs to download
+    :param str dest_dir:   the directory to download the files to
+    :param int workers:    the maximum number of concurrent downloads
+    :param kwargs:         passed to download_file()
+
+    :return List[str]: the paths to the downloaded files, in the same
+                       order as the URLs
+
+    """
+    dest_paths = [
+        os.path.join(dest_dir,
+                     posixpath.basename(urllib.parse.urlparse(url).path))
+        for url in urls
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) \
+            as executor:
+        futures = [
+            executor.submit(download_file, url, dest_path, **kwargs)
+            for url, dest_path in zip(urls, dest_paths)
+        ]
+
+        #
+        # Wait for all of the downloads, raising the first error
+        #
+        return [future.result() for future in futures]
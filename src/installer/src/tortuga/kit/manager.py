@@ -16,9 +16,7 @@ import configparser
 import logging
 import os
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from typing import Any, List
 
 from sqlalchemy.orm.session import Session
@@ -39,6 +37,7 @@ from tortuga.exceptions.softwareProfileComponentAlreadyExists import \
 from tortuga.exceptions.unrecognizedKitMedia import UnrecognizedKitMedia
 from tortuga.helper import osHelper
 from tortuga.kit import utils
+from tortuga.kit.download import download_file, make_private_dir
 from tortuga.kit.mountManager import MountManager
 from tortuga.kit.utils import format_kit_descriptor
 from tortuga.logging import KIT_NAMESPACE
@@ -102,8 +101,7 @@ class KitManager(TortugaObjectManager):
     def get_kit_url(self, name, version, iteration):
         kit = Kit(name, version, iteration)
         native_repo = repoManager.getRepo()
-        return os.path.join(
-            native_repo.getRemoteUrl(), kit.getTarBz2FileName())
+        return utils.get_kit_archive_url(native_repo.getRemoteUrl(), kit)
 
     def installKit(self, db_manager, name, version, iteration):
         """
@@ -407,12 +405,21 @@ class KitManager(TortugaObjectManager):
 
     def _retrieveOSMedia(self, url: str) -> str:
         """
-        Download the OS media.
+        Download the OS media. Interrupted downloads are resumed, and the
+        media is verified against the SHA256SUMS manifest next to it, if
+        there is one.
 
         :param url: String
         :return: String file path to download
         """
-        return urllib.request.urlretrieve(url)[0]
+        download_dir = make_private_dir(
+            os.path.join(self._config_manager.getRoot(), 'var', 'os-media'))
+
+        return download_file(
+            url,
+            os.path.join(download_dir,
+                         os.path.basename(urllib.parse.urlparse(url).path))
+        )
 
     def _processMediaspec(self, os_media_urls: List[str]) -> List[dict]:
         """
@@ -542,6 +549,8 @@ class KitManager(TortugaObjectManager):
         use_symlinks = kwargs['bUseSymlinks'] \
             if 'bUseSymlinks' in kwargs else False
 
+        use_dedup = kwargs['bDedup'] if 'bDedup' in kwargs else False
+
         # If 'mirror' is True, treat 'mediaspec' as a mirror, instead of
         # specific OS version. This affects the stored OS version.
         is_mirror = kwargs['mirror'] if 'mirror' in kwargs else False
@@ -614,7 +623,8 @@ class KitManager(TortugaObjectManager):
                     os_info.getOsFamilyInfo())
 
                 kit_ops = kit_ops_class(
-                    os_distro, bUseSymlinks=use_symlinks, mirror=is_mirror)
+                    os_distro, bUseSymlinks=use_symlinks, bDedup=use_dedup,
+                    mirror=is_mirror)
 
                 kit = kit_ops.prepareOSKit()
 
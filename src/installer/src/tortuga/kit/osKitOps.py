@@ -39,6 +39,8 @@ class OsKitOps(object):
         self._bUseSymlinks = kwargs['bUseSymlinks'] \
             if 'bUseSymlinks' in kwargs else False
 
+        self._bDedup = kwargs['bDedup'] if 'bDedup' in kwargs else False
+
         self._mirror = kwargs['mirror'] if 'mirror' in kwargs else False
 
         self._logger = logging.getLogger(KIT_NAMESPACE)
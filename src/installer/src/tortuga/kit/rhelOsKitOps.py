@@ -15,7 +15,8 @@
 import os
 from typing import List, Dict, Any
 from tortuga.os_utility.osUtility \
-    import cpio_copytree, removeFile, make_symlink_farm
+    import content_addressed_copytree, cpio_copytree, removeFile, \
+    make_symlink_farm
 from tortuga.kit.osKitOps import OsKitOps
 from tortuga.exceptions.copyError import CopyError
 from tortuga.exceptions.fileAlreadyExists import FileAlreadyExists
@@ -80,6 +81,17 @@ class KitOps(OsKitOps):
 
         if self._bUseSymlinks:
             make_symlink_farm(self.osdistro.source_path, destination_path)
+        elif self._bDedup:
+            stats = content_addressed_copytree(
+                self.osdistro.source_path,
+                destination_path,
+                os.path.join(self._cm.getDepotDir(), 'objects')
+            )
+
+            self._logger.info(
+                'OS media copied to {}: {copied} files copied, {linked}'
+                ' files already stored, {skipped} files up to date'.format(
+                    destination_path, **stats))
         else:
             cpio_copytree(self.osdistro.source_path, destination_path)
 
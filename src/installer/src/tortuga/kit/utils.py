@@ -12,32 +12,124 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import fcntl
 import filecmp
+import hashlib
+import http.client
 import json
 import logging
 import os
 import os.path
 import shutil
 import subprocess
+import sys
+import tarfile
 import urllib.error
+import urllib.parse
 import urllib.request
+from typing import Iterator, List, Optional
 
 from tortuga.config.configManager import ConfigManager
 from tortuga.exceptions.fileNotFound import FileNotFound
+from tortuga.exceptions.kitNotFound import KitNotFound
 from tortuga.exceptions.tortugaException import TortugaException
+from tortuga.kit.builder import KIT_METADATA_FILE, WHEELHOUSE_DIR
+from tortuga.kit.compression import COMPRESSIONS, DEFAULT_COMPRESSION, \
+    open_archive_reader
+from tortuga.kit.download import download_files
 from tortuga.kit.metadata import KitMetadataSchema
 from tortuga.logging import KIT_NAMESPACE
-from tortuga.os_utility.tortugaSubprocess import TortugaSubprocess
+from tortuga.objects.kit import Kit
 
 logger = logging.getLogger(KIT_NAMESPACE)
 
 
+#
+# The directory, relative to the tortuga root, in which the fingerprints of
+# installed requirements.txt files are recorded
+#
+REQUIREMENTS_STATE_DIR = os.path.join('var', 'kit-requirements')
+
+#
+# The timeout, in seconds, for checking whether or not a kit archive
+# exists in a remote repo
+#
+KIT_ARCHIVE_PROBE_TIMEOUT = 10
+
+
+def get_requirements_fingerprint(requirements_path: str) -> str:
+    """
+    Gets the fingerprint of a requirements.txt file: a hash of its contents
+    and the python interpreter the requirements are installed into. If the
+    fingerprint has not changed since the requirements were last
+    installed, they do not need to be installed again.
+
+    :param str requirements_path: the path to the requirements.txt file
+
+    :return str: the fingerprint
+
+    """
+    sha256 = hashlib.sha256()
+
+    with open(requirements_path, 'rb') as fp:
+        sha256.update(fp.read())
+
+    sha256.update(sys.version.encode())
+    sha256.update(sys.prefix.encode())
+
+    return sha256.hexdigest()
+
+
+def _get_requirements_state_path(requirements_path: str) -> str:
+    """
+    Gets the path to the file in which the fingerprint of an installed
+    requirements.txt file is recorded.
+
+    """
+    return os.path.join(
+        ConfigManager().getRoot(),
+        REQUIREMENTS_STATE_DIR,
+        hashlib.sha1(
+            os.path.abspath(requirements_path).encode()).hexdigest()
+    )
+
+
+def _read_fingerprint(state_path: str) -> Optional[str]:
+    try:
+        with open(state_path) as fp:
+            return fp.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _write_fingerprint(state_path: str, fingerprint: str) -> None:
+    tmp_path = '{}.{}.tmp'.format(state_path, os.getpid())
+
+    with open(tmp_path, 'w') as fp:
+        fp.write(fingerprint + '\n')
+
+    os.replace(tmp_path, state_path)
+
+
+def _run_pip(pip_cmd: List[str]) -> int:
+    logger.debug(' '.join(pip_cmd))
+
+    proc = subprocess.Popen(pip_cmd)
+
+    return proc.wait()
+
+
 def pip_install_requirements(requirements_path):
     """
     Installs packages specified in a requirements.txt file, using the tortuga
     package repo in addition to the standard python repos. This function
     returns nothing, and does nothing if the requirements.txt file is not
-    found.
+    found, or has not changed since it was last installed.
+
+    If the kit was built with a wheelhouse directory next to the
+    requirements.txt file, the requirements are installed from it without
+    using the package index, falling back to the package index if that
+    fails.
 
     :param requirements_path: the path to the requirements.txt file
 
@@ -52,38 +144,83 @@ def pip_install_requirements(requirements_path):
         logger.debug('Requirements empty: {}'.format(requirements_path))
         return
 
-    pip_cmd = [
-        '{}/pip'.format(cm.getBinDir()),
-        'install',
-    ]
+    fingerprint = get_requirements_fingerprint(requirements_path)
+    state_path = _get_requirements_state_path(requirements_path)
 
-    installer = cm.getInstaller()
-    int_webroot = cm.getIntWebRootUrl(installer)
-    installer_repo = '{}/python-tortuga/simple/'.format(int_webroot)
-
-    if cm.is_offline_installation():
-        # add tortuga distribution repo
-        pip_cmd.append('--index-url')
-        pip_cmd.append(installer_repo)
+    if _read_fingerprint(state_path) == fingerprint:
+        logger.debug('Requirements already installed: {}'.format(
+            requirements_path))
+        return
 
-        # add offline dependencies repo
-        pip_cmd.append('--extra-index-url')
-        pip_cmd.append('{}/offline-deps/python/simple/'.format(int_webroot))
-    else:
-        pip_cmd.append('--extra-index-url')
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
 
-        pip_cmd.append(installer_repo)
+    #
+    # Concurrent pip runs against the same environment are not safe, so
+    # installations are serialized
+    #
+    with open(os.path.join(os.path.dirname(state_path), '.lock'), 'w') \
+            as lock_fp:
+        fcntl.flock(lock_fp, fcntl.LOCK_EX)
 
-    pip_cmd.extend([
-        '--trusted-host', installer,
-        '-r', requirements_path
-    ])
+        #
+        # Another process may have installed the same requirements while
+        # waiting for the lock
+        #
+        if _read_fingerprint(state_path) == fingerprint:
+            return
+
+        pip_cmd = [
+            '{}/pip'.format(cm.getBinDir()),
+            'install',
+        ]
+
+        wheelhouse_path = os.path.join(os.path.dirname(requirements_path),
+                                       WHEELHOUSE_DIR)
+
+        if os.path.isdir(wheelhouse_path):
+            if not _run_pip(pip_cmd + [
+                    '--no-index',
+                    '--find-links', wheelhouse_path,
+                    '-r', requirements_path]):
+                _write_fingerprint(state_path, fingerprint)
+                return
+
+            logger.warning(
+                'Unable to install requirements from {}, using the package'
+                ' index'.format(wheelhouse_path))
+
+            pip_cmd.extend(['--find-links', wheelhouse_path])
+
+        installer = cm.getInstaller()
+        int_webroot = cm.getIntWebRootUrl(installer)
+        installer_repo = '{}/python-tortuga/simple/'.format(int_webroot)
+
+        if cm.is_offline_installation():
+            # add tortuga distribution repo
+            pip_cmd.append('--index-url')
+            pip_cmd.append(installer_repo)
+
+            # add offline dependencies repo
+            pip_cmd.append('--extra-index-url')
+            pip_cmd.append(
+                '{}/offline-deps/python/simple/'.format(int_webroot))
+        else:
+            pip_cmd.append('--extra-index-url')
+
+            pip_cmd.append(installer_repo)
+
+        pip_cmd.extend([
+            '--trusted-host', installer,
+            '-r', requirements_path
+        ])
+
+        returncode = _run_pip(pip_cmd)
+        if returncode:
+            raise TortugaException(
+                'Error installing requirements [{}]: pip exited with'
+                ' status {}'.format(requirements_path, returncode))
 
-    logger.debug(' '.join(pip_cmd))
-    proc = subprocess.Popen(pip_cmd)
-    proc.wait()
-    if proc.returncode:
-        raise Exception(proc.stderr)
+        _write_fingerprint(state_path, fingerprint)
 
 
 def is_requirements_empty(requirements_file_path):
@@ -140,6 +277,79 @@ def copy(srcFile, destDir):
             raise FileNotFound('Invalid kit at [%s]' % (srcFile))
 
 
+def _kit_archive_exists(url: str) -> Optional[bool]:
+    """
+    Checks whether or not a kit archive exists.
+
+    :param str url: the URL or path of the kit archive
+
+    :return Optional[bool]: True if it exists, False if it doesn't, None if
+                            it can't be determined
+
+    """
+    parsed = urllib.parse.urlparse(url)
+
+    if parsed.scheme in ('', 'file'):
+        return os.path.isfile(urllib.parse.unquote(parsed.path))
+
+    if parsed.scheme not in ('http', 'https'):
+        return None
+
+    try:
+        with urllib.request.urlopen(
+                urllib.request.Request(url, method='HEAD'),
+                timeout=KIT_ARCHIVE_PROBE_TIMEOUT):
+            return True
+    except urllib.error.HTTPError as ex:
+        if ex.code in (404, 410):
+            return False
+    except (OSError, http.client.HTTPException):
+        pass
+
+    return None
+
+
+def get_kit_archive_url(repo_url: str, kit: Kit) -> str:
+    """
+    Gets the URL of the archive for a kit in a repo. Archives compressed
+    using any of the supported compressions are looked for, starting with
+    the default compression.
+
+    :param str repo_url: the URL (or path) of the repo
+    :param Kit kit:      the kit
+
+    :return str: the URL of the kit archive. If no archive can be found,
+                 the URL of the archive using the default compression.
+
+    """
+    extensions = [COMPRESSIONS[DEFAULT_COMPRESSION].extension] + [
+        compression.extension for compression in COMPRESSIONS.values()
+        if compression.name != DEFAULT_COMPRESSION
+    ]
+
+    urls = [
+        assembleKitUrl(repo_url.rstrip('/'),
+                       kit.getArchiveFileName(extension))
+        for extension in extensions
+    ]
+
+    fallback_url = None
+
+    for url in urls:
+        exists = _kit_archive_exists(url)
+        if exists:
+            return url
+
+        #
+        # If the repo can't be asked whether or not an archive exists, the
+        # first such archive is tried
+        #
+        if exists is None and fallback_url is None:
+            fallback_url = url
+
+    return fallback_url or urls[0]
+
+
 def checkSupportedScheme(srcUrl):
     return srcUrl.startswith('http://') or srcUrl.startswith('https://') \
            or srcUrl.startswith('file://') or srcUrl.startswith('ftp://')
@@ -169,59 +379,85 @@ def retrieve(kitFileName, srcUrl, destDir):
 
 def download(urlList, dest):
     """
-    TODO: this should use a curl/wget download module
+    Downloads files into a directory. The files are downloaded
+    concurrently, resuming interrupted downloads, and verified against
+    the SHA256SUMS manifest next to them, if there is one.
 
-    """
-    for url in urlList:
-        i = url.rfind('/')
+    :param urlList: the URLs to download
+    :param dest:    the destination directory
 
-        destFile = dest + '/' + url[i + 1:]
+    :raises FileNotFound:
+    :raises TortugaException:
 
-        logger.debug(url + '->' + destFile)
+    """
+    try:
+        download_files(urlList, dest)
+    except TortugaException:
+        raise
+    except Exception as ex:
+        raise TortugaException(exception=ex)
 
-        try:
-            filein = urllib.request.urlopen(url)
-        except urllib.error.URLError as ex:
-            if ex.code == 404:
-                raise FileNotFound('File not found at URL [%s]' % (url))
 
-            raise TortugaException(exception=ex)
-        except Exception as ex:
-            raise TortugaException(exception=ex)
+def _split_member_path(name: str) -> List[str]:
+    """
+    Splits a tar member name into its path components, ignoring any
+    empty or '.' components.
 
-        fileout = open(destFile, "wb")
+    """
+    return [part for part in name.split('/') if part not in ('', '.')]
 
-        while True:
-            try:
-                buf = filein.read(1024000)
 
-                fileout.write(buf)
-            except IOError as ex:
-                raise TortugaException(exception=ex)
+def _is_kit_metadata_member(member: tarfile.TarInfo) -> bool:
+    """
+    Returns True if the tar member is the kit metadata file, i.e.
+    <kit-descriptor>/kit.json
 
-            if not bytes:
-                break
+    """
+    path = _split_member_path(member.name)
 
-        filein.close()
-        fileout.close()
-        logger.debug('Successfully dowloaded file [%s]' % (destFile))
+    return member.isfile() and len(path) == 2 and \
+        path[1] == KIT_METADATA_FILE
 
 
 def get_metadata_from_archive(kit_archive_path: str) -> dict:
     """
     Extracts and validates kit metadata from a kit archive file.
 
+    The archive compression is detected from the start of the file. The
+    archive is read as a stream, and reading stops as soon as the
+    metadata file is found. Kit archives are built with the metadata
+    file as the first member, so only the start of the archive is
+    decompressed.
+
     :param str kit_archive_path: the path to the kit archive
 
     :return dict: the validated kit metadata
 
+    :raises KitNotFound: if the archive is not a valid kit archive
+
     """
-    cmd = 'tar -xjOf {} \*/kit.json'.format(kit_archive_path)
-    p = TortugaSubprocess(cmd)
-    p.run()
+    meta_bytes = None
 
     try:
-        meta_dict: dict = json.loads(p.getStdOut().decode())
+        with open_archive_reader(kit_archive_path) as fp, \
+                tarfile.open(fileobj=fp, mode='r|') as archive:
+            for member in archive:
+                if _is_kit_metadata_member(member):
+                    meta_bytes = archive.extractfile(member).read()
+                    break
+
+    except (tarfile.TarError, EOFError, OSError) as ex:
+        raise KitNotFound(
+            'Error reading kit archive [{}]: {}'.format(
+                kit_archive_path, ex))
+
+    if meta_bytes is None:
+        raise KitNotFound(
+            'Kit metadata not found in archive [{}]'.format(
+                kit_archive_path))
+
+    try:
+        meta_dict: dict = json.loads(meta_bytes.decode())
         errors = KitMetadataSchema().validate(meta_dict)
         if errors:
             raise TortugaException(
@@ -229,11 +465,55 @@ def get_metadata_from_archive(kit_archive_path: str) -> dict:
             )
 
     except json.JSONDecodeError:
-        raise Exception('Invalid JSON for kit metadata: {}'.format(p.stdout))
+        raise Exception('Invalid JSON for kit metadata: {}'.format(
+            meta_bytes))
 
     return meta_dict
 
 
+def _iter_kit_archive_members(archive: tarfile.TarFile,
+                              dest_dir: str) -> Iterator[tarfile.TarInfo]:
+    """
+    Iterates over the members of a kit archive for extraction, stripping
+    the top-level directory from member names (the equivalent of
+    tar --strip-components 1) and removing write permissions.
+
+    :param TarFile archive: the kit archive
+    :param str dest_dir:    the destination directory
+
+    :raises KitNotFound: if a member would be extracted outside of
+                         the destination directory
+
+    """
+    dest_dir = os.path.realpath(dest_dir)
+
+    for member in archive:
+        path = _split_member_path(member.name)
+        if len(path) < 2:
+            #
+            # The top-level directory itself
+            #
+            continue
+
+        member.name = '/'.join(path[1:])
+
+        target_path = os.path.realpath(os.path.join(dest_dir, member.name))
+        if os.path.commonpath([dest_dir, target_path]) != dest_dir:
+            raise KitNotFound(
+                'Invalid path in kit archive: {}'.format(member.name))
+
+        if member.islnk():
+            member.linkname = \
+                '/'.join(_split_member_path(member.linkname)[1:])
+
+        #
+        # Remove world write permissions, if any
+        #
+        member.mode &= ~0o222
+
+        yield member
+
+
 def unpack_kit_archive(kit_archive_path: str, dest_root_dir: str) -> str:
     """
     Unpacks a kit archive into a directory.
@@ -264,17 +544,16 @@ def unpack_kit_archive(kit_archive_path: str, dest_root_dir: str) -> str:
             kit_archive_path, destdir))
 
     #
-    # Extract the file
+    # Extract the file. Permissions are set as each member is extracted
+    # (directory permissions are set once all of the members have been
+    # extracted), so there is no need for a second pass over the tree.
     #
-    cmd = 'tar --extract --bzip2 --strip-components 1 --file {} -C {}'.format(
-        kit_archive_path, destdir)
-    TortugaSubprocess(cmd).run()
+    with open_archive_reader(kit_archive_path) as fp, \
+            tarfile.open(fileobj=fp, mode='r|') as archive:
+        archive.extractall(
+            destdir, members=_iter_kit_archive_members(archive, destdir))
 
-    #
-    # Remove world write permissions, if any
-    #
-    cmd = 'chmod -R a-w {}'.format(destdir)
-    TortugaSubprocess(cmd).run()
+    os.chmod(destdir, os.stat(destdir).st_mode & ~0o222)
 
     logger.debug(
         '[utils.parse()] Unpacked [%s] into [%s]' % (
@@ -14,7 +14,7 @@
 
 # pylint: disable=no-member,too-many-public-methods,try-except-raise
 import logging
-from typing import Optional, Dict
+from typing import Dict, Iterator, Optional
 
 from sqlalchemy.orm.session import Session
 
@@ -62,9 +62,11 @@ class NodeApi(TortugaApi):
             raise TortugaException(exception=ex)
 
     def getNodeList(self, session,
-                    tags: Optional[Tags] = None) -> TortugaObjectList:
+                    tags: Optional[Tags] = None,
+                    **filters) -> TortugaObjectList:
         """
-        Get node list..
+        Get node list, optionally filtered (see
+        NodesDbHandler.getNodeList())
 
             Returns:
                 list of nodes
@@ -72,7 +74,32 @@ class NodeApi(TortugaApi):
                 TortugaException
         """
         try:
-            return self._nodeManager.getNodeList(session, tags=tags)
+            return self._nodeManager.getNodeList(session, tags=tags,
+                                                 **filters)
+
+        except TortugaException:
+            raise
+
+        except Exception as ex:
+            self._logger.exception('Fatal error retrieving node list')
+            raise TortugaException(exception=ex)
+
+    def iterNodeList(self, session,
+                     tags: Optional[Tags] = None,
+                     **filters) -> Iterator[Node]:
+        """
+        Iterate over node list, optionally filtered (see
+        NodesDbHandler.getNodeList()). Nodes are loaded from the database
+        in batches, as they are iterated.
+
+            Returns:
+                iterator of nodes
+            Throws:
+                TortugaException
+        """
+        try:
+            yield from self._nodeManager.iterNodeList(session, tags=tags,
+                                                      **filters)
 
         except TortugaException:
             raise
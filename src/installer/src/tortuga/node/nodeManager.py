@@ -19,7 +19,7 @@ import json
 import logging
 import time
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy.orm.session import Session
 
@@ -201,9 +201,11 @@ class NodeManager(TortugaObjectManager): \
                 optionDict=get_default_relations(optionDict))])[0]
 
     def getNodeList(self, session, tags=None,
-                    optionDict: Optional[OptionDict] = None) -> List[Node]:
+                    optionDict: Optional[OptionDict] = None,
+                    **filters) -> List[Node]:
         """
-        Return all nodes
+        Return all nodes, optionally filtered (see
+        NodesDbHandler.getNodeList())
 
         """
         return self.__populate_nodes(
@@ -211,10 +213,28 @@ class NodeManager(TortugaObjectManager): \
             self._nodeDbApi.getNodeList(
                 session,
                 tags=tags,
-                optionDict=get_default_relations(optionDict)
+                optionDict=get_default_relations(optionDict),
+                **filters
             )
         )
 
+    def iterNodeList(self, session, tags=None,
+                     optionDict: Optional[OptionDict] = None,
+                     **filters) -> Iterator[Node]:
+        """
+        Iterate over all nodes, optionally filtered (see
+        NodesDbHandler.getNodeList())
+
+        """
+        swprofile_map = self.__get_swprofile_metadata_cache(session)
+
+        for node in self._nodeDbApi.iterNodeList(
+                session,
+                tags=tags,
+                optionDict=get_default_relations(optionDict),
+                **filters):
+            yield self.__populate_node(node, swprofile_map)
+
     def __populate_nodes(self, session: Session, nodes: List[Node]) \
             -> List[Node]:
         """
@@ -222,6 +242,22 @@ class NodeManager(TortugaObjectManager): \
 
         """
 
+        swprofile_map = self.__get_swprofile_metadata_cache(session)
+
+        for node in nodes:
+            self.__populate_node(node, swprofile_map)
+
+        return nodes
+
+    @staticmethod
+    def __get_swprofile_metadata_cache(session: Session) \
+            -> DefaultDict[str, Dict[str, Any]]:
+        """
+        Return software profile metadata, by software profile name,
+        loaded as required
+
+        """
+
         class SoftwareProfileMetadataCache(defaultdict):
             def __missing__(self, key):
                 metadata = \
@@ -233,17 +269,23 @@ class NodeManager(TortugaObjectManager): \
 
                 return metadata
 
-        swprofile_map = SoftwareProfileMetadataCache()
+        return SoftwareProfileMetadataCache()
 
-        for node in nodes:
-            if not node.getSoftwareProfile():
-                continue
+    @staticmethod
+    def __populate_node(node: Node,
+                        swprofile_map: DefaultDict[str, Dict[str, Any]]) \
+            -> Node:
+        """
+        Expand non-database fields in Node object
+
+        """
 
+        if node.getSoftwareProfile():
             node.getSoftwareProfile().setMetadata(
                 swprofile_map[node.getSoftwareProfile().getName()]
             )
 
-        return nodes
+        return node
 
     def updateNode(self, session: Session, nodeName: str,
                    updateNodeRequest: dict) -> None:
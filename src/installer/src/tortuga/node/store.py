@@ -15,13 +15,13 @@ import logging
 from typing import Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy import desc
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, lazyload, selectinload, sessionmaker
 
 from tortuga.db.dbManager import DbManager
 from tortuga.db.models.node import Node as DbNode
 from tortuga.db.models.nodeTag import NodeTag
-from tortuga.events.types import TagCreated, TagDeleted, TagUpdated, \
-    NodeStateChanged, NodeTagsChanged
+from tortuga.events.types import BaseEvent, TagCreated, TagDeleted, \
+    TagUpdated, NodeStateChanged, NodeTagsChanged
 from tortuga.objectstore.base import matches_filters
 from tortuga.typestore.base import TypeStore
 from .types import Node, NodeStatus
@@ -37,21 +37,24 @@ class SqlalchemySessionNodeStore(TypeStore):
     """
     type_class = Node
 
+    #
+    # The number of nodes loaded from the database at a time by list()
+    #
+    BATCH_SIZE = 100
+
     def __init__(self, db_manager: DbManager):
         self._Session = sessionmaker(bind=db_manager.engine)
 
-    def _to_db_node(
-            self,
-            node: Node,
-            session: Session) -> Tuple[Optional[DbNode], List, List, List]:
-        if node.id:
-            db_node = session.query(DbNode).filter(
-                DbNode.id == int(node.id)).first()
-            if not db_node:
-                return None, [], [], []
-        else:
+    def _get_db_node(self, node: Node,
+                     session: Session) -> Optional[DbNode]:
+        if not node.id:
             raise Exception('Creating nodes is currently not supported')
 
+        return session.query(DbNode).filter(
+            DbNode.id == int(node.id)).first()
+
+    def _to_db_node(self, node: Node,
+                    db_node: DbNode) -> Tuple[List, List, List]:
         db_node.name = node.name
         db_node.public_hostname = node.public_hostname
         db_node.softwareProfileId = int(node.softwareprofile_id)
@@ -63,11 +66,7 @@ class SqlalchemySessionNodeStore(TypeStore):
         if node.last_update:
             db_node.lastUpdate = node.last_update
 
-        tag_create_events, tag_update_events, tag_delete_events = \
-            self._set_db_node_tags(db_node, node.tags)
-
-        return (db_node, tag_create_events, tag_update_events,
-                tag_delete_events)
+        return self._set_db_node_tags(db_node, node.tags)
 
     def _set_db_node_tags(self, db_node: DbNode,
                           tags: Dict[str, str]) -> Tuple[List, List, List]:
@@ -127,27 +126,53 @@ class SqlalchemySessionNodeStore(TypeStore):
             'list(order_by=%s, order_desc=%s, limit=%s, filters=%s) -> ...',
             order_by, order_desc, limit, filters)
         session = self._Session()
-        result = session.query(DbNode)
+        #
+        # The (ordered) node ids are read first, and the nodes are then
+        # loaded in batches by id, each batch being read in full. Streaming
+        # a single query (i.e. with yield_per) is not possible, as loading
+        # the tags for a batch on the same connection would, on MySQL,
+        # discard the rest of the streamed result.
+        #
+        id_query = session.query(DbNode.id)
         if order_by:
             #
             # Note: currently, order_alpha is ignored for SqlAlchemy,
             #       as it is the default behavior for strings
             #
-            if desc:
-                result = result.order_by(desc(getattr(DbNode, order_by)))
+            if order_desc:
+                id_query = id_query.order_by(desc(getattr(DbNode, order_by)))
             else:
-                result = result.order_by(getattr(DbNode, order_by))
+                id_query = id_query.order_by(getattr(DbNode, order_by))
         count = 0
-        for db_node in result:
-            node = self._to_node(db_node)
-            if matches_filters(node, filters):
-                logger.debug('list(...) -> %s', node)
-                count += 1
-                if limit and count == limit:
-                    yield node
-                    session.close()
-                    return
-                yield node
+        try:
+            node_ids = [node_id for node_id, in id_query.all()]
+
+            for offset in range(0, len(node_ids), self.BATCH_SIZE):
+                batch_ids = node_ids[offset:offset + self.BATCH_SIZE]
+                db_nodes = {
+                    db_node.id: db_node
+                    for db_node in session.query(DbNode).options(
+                        selectinload(DbNode.tags),
+                        lazyload(DbNode.nics)
+                    ).filter(DbNode.id.in_(batch_ids))
+                }
+
+                for node_id in batch_ids:
+                    #
+                    # Nodes deleted since the ids were read are skipped
+                    #
+                    db_node = db_nodes.get(node_id)
+                    if db_node is None:
+                        continue
+                    node = self._to_node(db_node)
+                    if matches_filters(node, filters):
+                        logger.debug('list(...) -> %s', node)
+                        count += 1
+                        yield node
+                        if limit and count == limit:
+                            return
+        finally:
+            session.close()
 
     def get(self, obj_id: str) -> Optional[Node]:
         logger.debug('get(obj_id=%s) -> ...', obj_id)
@@ -169,18 +194,8 @@ class SqlalchemySessionNodeStore(TypeStore):
     def save(self, obj: Node) -> Node:
         logger.debug('save(obj=%s) -> ...', obj)
 
-        node_old = None
-        if obj.id:
-            node_old = self.get(obj.id)
-
-        session = self._Session()
-        db_node, tag_create_events, tag_update_events, tag_delete_events = \
-            self._to_db_node(obj, session)
-        if not db_node:
-            raise Exception('Node ID not found: %s', obj.id)
-        session.commit()
-        node = self._to_node(db_node)
-        session.close()
+        node_old, node, tag_create_events, tag_update_events, \
+            tag_delete_events = self._save(obj)
 
         self._fire_node_events(node_old, node)
         self._fire_tag_events(node.id, tag_create_events, tag_update_events,
@@ -188,6 +203,37 @@ class SqlalchemySessionNodeStore(TypeStore):
         logger.debug('save(...) -> %s', node)
         return node
 
+    def _save(self, obj: Node) -> Tuple[Node, Node, List, List, List]:
+        """
+        Saves the node to the database in a single session.
+
+        :param Node obj: the node to save
+
+        :return Tuple[Node, Node, List, List, List]: the previous and new
+            state of the node, and the created, updated and deleted tags
+
+        """
+        session = self._Session()
+        try:
+            db_node = self._get_db_node(obj, session)
+            if not db_node:
+                raise Exception('Node ID not found: %s', obj.id)
+            #
+            # Snapshot the previous state from the loaded row before it is
+            # modified, and the new state before the commit expires it, so
+            # that neither requires another round trip to the database
+            #
+            node_old = self._to_node(db_node)
+            tag_create_events, tag_update_events, tag_delete_events = \
+                self._to_db_node(obj, db_node)
+            node = self._to_node(db_node)
+            session.commit()
+        finally:
+            session.close()
+
+        return (node_old, node, tag_create_events, tag_update_events,
+                tag_delete_events)
+
     def _marshall(self, node: Node) -> dict:
         schema_class = Node.get_schema_class()
         marshalled = schema_class().dump(node)
@@ -218,22 +264,28 @@ class SqlalchemySessionNodeStore(TypeStore):
         # delete then a create, which can have undesirable effects when the
         # create happens before the delete
         #
+        events: List[BaseEvent] = []
         for evt in deleted:
-            TagDeleted.fire(
+            events.append(TagDeleted(
                 tag_id='node:{}:{}'.format(node_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in created:
-            TagCreated.fire(
+            events.append(TagCreated(
                 tag_id='node:{}:{}'.format(node_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in updated:
-            TagUpdated.fire(
+            events.append(TagUpdated(
                 tag_id='node:{}:{}'.format(node_id, evt['name']),
                 value=evt['value'],
                 previous_value=evt['previous_value']
-            )
+            ))
+        #
+        # Store and publish the events together, and send them as a batch
+        # to the listeners that accept batches
+        #
+        BaseEvent.fire_many(events)
 
 
 class SqlalchemySessionNodeStatusStore(SqlalchemySessionNodeStore):
@@ -280,17 +332,7 @@ class SqlalchemySessionNodeStatusStore(SqlalchemySessionNodeStore):
     def save(self, obj: Node) -> Node:
         logger.debug('save(obj=%s) -> ...', obj)
 
-        node_old = None
-        if obj.id:
-            node_old = self.get(obj.id)
-
-        session = self._Session()
-        db_node, _, _, _ = self._to_db_node(obj, session)
-        if not db_node:
-            raise Exception('Node ID not found: %s', obj.id)
-        session.commit()
-        node = self._to_node(db_node)
-        session.close()
+        node_old, node, _, _, _ = self._save(obj)
 
         self._fire_node_events(node_old, node)
         logger.debug('save(...) -> %s', node)
@@ -13,7 +13,8 @@
 # limitations under the License.
 
 import logging
-from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, \
+    Union
 
 
 logger = logging.getLogger(__name__)
@@ -50,31 +51,26 @@ COMPARATORS = {
 }
 
 
-def matches_filters(obj: Union[object, dict],
-                    filters: Dict[str, Any]) -> bool:
-    """
-    Determines whether or not an object matches a list of filters. Filters
-    look like this:
+#
+# A compiled filter: the attribute path, the comparator and the value to
+# compare against
+#
+CompiledFilter = Tuple[List[str], Callable[[Any, Any], bool], Any]
 
-        attr=value
-        attr__lt=value
-        attr__attr__gt=value
 
-    Where attr is an attribute name on the object (dict), which can be
-    nested using multiple levels of "__". The last part of the filter is
-    a comparator (see COMPARATORS). If no comparator is provided, then
-    equality is assumed.
+def compile_filters(filters: Dict[str, Any]) -> List[CompiledFilter]:
+    """
+    Parses a list of filters (see matches_filters) so that they can be
+    evaluated against many objects without being re-parsed each time.
 
-    :param Union[object, dict] obj: the object or dict to test
-    :param Dict[str, Any] filters:  the list of filters to test
+    :param Dict[str, Any] filters: the list of filters to compile
 
-    :raises KeyError: if the attribute does not exist
+    :raises KeyError: if the comparator does not exist
 
-    :return bool: True if all filters match (or no filters provided),
-                  False otherwise
+    :return List[CompiledFilter]: the compiled filters
 
     """
-    result = True
+    compiled = []
 
     for k, right in filters.items():
         parts = k.split('__')
@@ -83,6 +79,25 @@ def matches_filters(obj: Union[object, dict],
         else:
             comparator = 'eq'
 
+        compiled.append((parts, COMPARATORS[comparator], right))
+
+    return compiled
+
+
+def matches_compiled_filters(obj: Union[object, dict],
+                             compiled: List[CompiledFilter]) -> bool:
+    """
+    Determines whether or not an object matches a list of compiled
+    filters, as returned by compile_filters.
+
+    :param Union[object, dict] obj:         the object or dict to test
+    :param List[CompiledFilter] compiled:   the compiled filters to test
+
+    :return bool: True if all filters match (or no filters provided),
+                  False otherwise
+
+    """
+    for parts, comparator, right in compiled:
         left = obj
         for attr in parts:
             if isinstance(left, dict):
@@ -94,10 +109,37 @@ def matches_filters(obj: Union[object, dict],
                     return False
                 left = getattr(left, attr)
 
-        if not COMPARATORS[comparator](left, right):
-            result = False
+        if not comparator(left, right):
+            return False
 
-    return result
+    return True
+
+
+def matches_filters(obj: Union[object, dict],
+                    filters: Dict[str, Any]) -> bool:
+    """
+    Determines whether or not an object matches a list of filters. Filters
+    look like this:
+
+        attr=value
+        attr__lt=value
+        attr__attr__gt=value
+
+    Where attr is an attribute name on the object (dict), which can be
+    nested using multiple levels of "__". The last part of the filter is
+    a comparator (see COMPARATORS). If no comparator is provided, then
+    equality is assumed.
+
+    :param Union[object, dict] obj: the object or dict to test
+    :param Dict[str, Any] filters:  the list of filters to test
+
+    :raises KeyError: if the attribute does not exist
+
+    :return bool: True if all filters match (or no filters provided),
+                  False otherwise
+
+    """
+    return matches_compiled_filters(obj, compile_filters(filters))
 
 
 class ObjectStore:
@@ -123,16 +165,74 @@ class ObjectStore:
         """
         return '{}:{}'.format(self._namespace, key)
 
-    def set(self, key: str, value: dict):
+    def set(self, key: str, value: dict,
+            expected_version: Optional[int] = None) -> Optional[dict]:
         """
-        Saves the object to the object store.
+        Saves the object to the object store. Every save increments the
+        version of the object, which starts at 1 when it is created.
 
-        :param str key:    the key name to use for the object
-        :param dict value: the object to store, stores {} if None
+        :param str key:              the key name to use for the object
+        :param dict value:           the object to store, stores {} if None
+        :param int expected_version: if set, the object is only saved if
+                                     its current version matches (0 for
+                                     an object that doesn't exist yet)
+
+        :raises VersionConflictError: if the current version of the object
+                                      doesn't match the expected version
+
+        :return Optional[dict]: the object that was replaced, None if the
+                                object didn't exist
+
+        """
+        return self.set_with_version(key, value, expected_version)[0]
+
+    def set_with_version(
+            self, key: str, value: dict,
+            expected_version: Optional[int] = None
+    ) -> Tuple[Optional[dict], int]:
+        """
+        Saves the object to the object store, see set(), also returning
+        the new version of the object.
+
+        :param str key:              the key name to use for the object
+        :param dict value:           the object to store, stores {} if None
+        :param int expected_version: see set()
+
+        :raises VersionConflictError: see set()
+
+        :return Tuple[Optional[dict], int]: the object that was replaced,
+                                            None if the object didn't
+                                            exist, and the new version
 
         """
         raise NotImplementedError()
 
+    def normalize(self, value: dict) -> dict:
+        """
+        Converts an object into the form get() returns it in once saved,
+        i.e. with values converted to the types the object store keeps
+        them as, so that objects can be compared without loading them.
+
+        :param dict value: the object to normalize
+
+        :return dict: the normalized object
+
+        """
+        return value
+
+    def set_many(self, values: Dict[str, dict]):
+        """
+        Saves multiple objects to the object store. Unlike set(), there
+        is no version checking, and the objects that were replaced are not
+        returned.
+
+        :param Dict[str, dict] values: the objects to store, keyed by the
+                                       key name to use for each object
+
+        """
+        for key, value in values.items():
+            self.set(key, value)
+
     def get(self, key: str) -> Optional[dict]:
         """
         Gets the object from the object store.
@@ -144,6 +244,18 @@ class ObjectStore:
         """
         raise NotImplementedError()
 
+    def get_with_version(self, key: str) -> Tuple[Optional[dict], int]:
+        """
+        Gets the object from the object store, along with its version.
+
+        :param str key: the key of the object to get
+
+        :return Tuple[Optional[dict], int]: the object, None if not found,
+                                            and its version, 0 if not found
+
+        """
+        raise NotImplementedError()
+
     def list(
             self,
             order_by: Optional[str] = None,
@@ -220,3 +332,63 @@ class ObjectStore:
 
         """
         raise NotImplementedError()
+
+    def expire(self, key: str, expire: int):
+        """
+        Sets (or resets) the expiry of an object, and its log, if any.
+
+        :param str key:    the key of the object
+        :param int expire: the object should expire after x seconds
+
+        """
+        raise NotImplementedError()
+
+    def trim_expired(self) -> int:
+        """
+        Removes the entries for expired objects from the index used to
+        list the objects in the object store.
+
+        :return int: the number of entries removed
+
+        """
+        raise NotImplementedError()
+
+    def log_append(self, key: str, *entries: str) -> int:
+        """
+        Appends one or more entries to the append-only log associated with
+        a key. The log is stored separately from the object itself, so
+        appending never requires the object to be read or re-written.
+
+        :param str key:     the key of the object the log belongs to
+        :param str entries: the entries to append
+
+        :return int: the length of the log after the append
+
+        """
+        raise NotImplementedError()
+
+    def log_range(self, key: str, since: int = 0) -> List[str]:
+        """
+        Gets the entries of the log associated with a key, starting at
+        the specified offset.
+
+        :param str key:   the key of the object the log belongs to
+        :param int since: the offset of the first entry to return
+
+        :return List[str]: the log entries, an empty list if there are none
+
+        """
+        raise NotImplementedError()
+
+    def log_pop(self, key: str) -> List[str]:
+        """
+        Atomically gets all of the entries of the log associated with a
+        key, and deletes the log, along with the object itself. An entry
+        appended concurrently is either returned, or starts a new log.
+
+        :param str key: the key of the object the log belongs to
+
+        :return List[str]: the log entries, an empty list if there are none
+
+        """
+        raise NotImplementedError()
@@ -12,20 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+from typing import Iterator
+
 from redis import Redis
-from tortuga.config.configManager import ConfigManager
+
+from tortuga.logging import OBJECT_STORE_NAMESPACE
+from tortuga.redis import RedisClientManager
 
 from .base import ObjectStore
 from .redis import RedisObjectStore
 
 
+logger = logging.getLogger(OBJECT_STORE_NAMESPACE)
+
+
 class ObjectStoreManager:
     """
     Object store manager
 
     """
     _redis_client: Redis = None
-    _config_manager: ConfigManager = ConfigManager()
 
     @classmethod
     def get(cls, namespace: str, expire: int = 0) -> ObjectStore:
@@ -38,8 +45,52 @@ class ObjectStoreManager:
         :return ObjectStore:  the object store instance
 
         """
-        if not cls._redis_client:
-            cls._redis_client = Redis(
-                password=cls._config_manager.getRedisPassword())
         return RedisObjectStore(namespace=namespace,
-                                redis_client=cls._redis_client, expire=expire)
+                                redis_client=cls._get_redis_client(),
+                                expire=expire)
+
+    @classmethod
+    def _get_redis_client(cls) -> Redis:
+        if not cls._redis_client:
+            cls._redis_client = RedisClientManager.get()
+        return cls._redis_client
+
+    @classmethod
+    def get_all(cls) -> Iterator[ObjectStore]:
+        """
+        Gets the object stores for all namespaces that have an index.
+
+        :return Iterator[ObjectStore]: the object store instances
+
+        """
+        redis_client = cls._get_redis_client()
+        namespaces = set()
+        #
+        # Namespaces that still only have the index set used by previous
+        # versions are included, the index is migrated on first use
+        #
+        for suffix in (':ZINDEX', ':INDEX'):
+            for key in redis_client.scan_iter(match='*' + suffix):
+                if isinstance(key, bytes):
+                    key = key.decode()
+                namespace = key[:-len(suffix)]
+                if namespace in namespaces:
+                    continue
+                namespaces.add(namespace)
+                yield RedisObjectStore(namespace=namespace,
+                                       redis_client=redis_client)
+
+    @classmethod
+    def trim_expired(cls) -> int:
+        """
+        Removes the index entries of expired objects in all namespaces.
+
+        :return int: the total number of index entries removed
+
+        """
+        count = 0
+        for object_store in cls.get_all():
+            count += object_store.trim_expired()
+        logger.debug('trim_expired() -> {}'.format(count))
+
+        return count
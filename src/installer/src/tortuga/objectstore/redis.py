@@ -14,12 +14,14 @@
 
 import json
 import logging
-from typing import Iterator, Optional, Tuple
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from redis.exceptions import ResponseError
+from redis.exceptions import ResponseError, WatchError
 
 from tortuga.logging import OBJECT_STORE_NAMESPACE
 from .base import ObjectStore
+from .exceptions import VersionConflictError
 
 logger = logging.getLogger(OBJECT_STORE_NAMESPACE)
 
@@ -33,7 +35,12 @@ class RedisObjectStore(ObjectStore):
     #
     # A list of reserved keys, that are required for internal use
     #
-    RESERVED_KEYS = ['INDEX']
+    RESERVED_KEYS = ['INDEX', 'ZINDEX']
+    RESERVED_PREFIXES = ['LOG:']
+    #
+    # The hash field used to store the version of an object
+    #
+    VERSION_FIELD = '__version__'
 
     def __init__(self, namespace: str, redis_client, expire: int = 0):
         """
@@ -46,38 +53,214 @@ class RedisObjectStore(ObjectStore):
         """
         super().__init__(namespace, expire)
         self._redis = redis_client
+        self._index_migrated = False
 
     def _get_index_key_name(self) -> str:
         """
-        Gets the key name for the Redis index set.
+        Gets the key name for the Redis index sorted set. Members are
+        scored by the time at which they expire (+inf if they don't), so
+        that live and expired objects can be told apart using the index
+        alone.
 
         :return str: the key name
 
         """
-        return self.get_key_name('INDEX')
+        if not self._index_migrated:
+            self._index_migrated = True
+            self._migrate_index()
+
+        return self.get_key_name('ZINDEX')
+
+    def _migrate_index(self):
+        """
+        Moves the entries of the index set used by previous versions into
+        the index sorted set, and removes the index set. This is done
+        lazily, the first time the index is used, and is a no-op once the
+        index set has been removed.
+
+        """
+        legacy_index_key = self.get_key_name('INDEX')
+
+        keys = [key.decode() if isinstance(key, bytes) else key
+                for key in self._redis.smembers(legacy_index_key)]
+        if not keys:
+            return
 
-    def set(self, key: str, value: dict):
+        logger.debug('Migrating {} index entries for namespace {}'.format(
+            len(keys), self._namespace))
+
+        with self._redis.pipeline() as pipe:
+            for key in keys:
+                pipe.exists(key)
+                pipe.ttl(key)
+            result = pipe.execute()
+
+        scores = {}
+        for key, exists, ttl in zip(keys, result[::2], result[1::2]):
+            #
+            # Objects that have already expired are not migrated
+            #
+            if not exists:
+                continue
+
+            scores[key] = self._get_expiry_score(ttl or 0)
+
+        with self._redis.pipeline() as pipe:
+            if scores:
+                pipe.zadd(self.get_key_name('ZINDEX'), **scores)
+            pipe.delete(legacy_index_key)
+            pipe.execute()
+
+    def _get_expiry_score(self, expire: int) -> float:
+        """
+        Gets the index score for an object expiring after the specified
+        number of seconds.
+
+        :param int expire: the object expires after x seconds, 0 for never
+
+        :return float: the index score
+
+        """
+        if not expire:
+            return float('inf')
+
+        return time.time() + expire
+
+    def _get_log_key_name(self, key: str) -> str:
+        """
+        Gets the key name for the Redis list used to store the log
+        associated with a key.
+
+        :param str key: the key of the object the log belongs to
+
+        :return str: the key name
+
+        """
+        return self.get_key_name('LOG:{}'.format(key))
+
+    def set_with_version(
+            self, key: str, value: dict,
+            expected_version: Optional[int] = None
+    ) -> Tuple[Optional[dict], int]:
         """
         See superclass.
 
         :param key:
         :param value:
+        :param expected_version:
+
+        :return Tuple[Optional[dict], int]:
 
         """
-        if key in self.RESERVED_KEYS:
+        self._check_key(key)
+
+        logger.debug('set({}, {})'.format(key, value))
+
+        to_store = self._serialize(value)
+        key = self.get_key_name(key)
+
+        with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    #
+                    # Read the current object and its version, the
+                    # transaction fails if it is changed by someone else
+                    # before it is executed
+                    #
+                    pipe.watch(key)
+                    previous, version = self._deserialize_with_version(
+                        pipe.hgetall(key))
+                    if expected_version is not None and \
+                            expected_version != version:
+                        raise VersionConflictError(
+                            'Version mismatch for {}: expected {}, '
+                            'found {}'.format(key, expected_version, version)
+                        )
+                    to_store[self.VERSION_FIELD] = version + 1
+
+                    pipe.multi()
+                    pipe.hmset(key, to_store)
+                    if self._expire:
+                        pipe.expire(key, self._expire)
+                    #
+                    # Add to the Redis sorted set used for the purposes of
+                    # indexing, sorting, etc.
+                    #
+                    pipe.zadd(self._get_index_key_name(),
+                              **{key: self._get_expiry_score(self._expire)})
+                    pipe.execute()
+
+                    return previous, to_store[self.VERSION_FIELD]
+
+                except WatchError:
+                    if expected_version is not None:
+                        raise VersionConflictError(
+                            'Concurrent update of {}'.format(key))
+                    #
+                    # Without an expected version, the last write wins, so
+                    # just try again
+                    #
+                    continue
+
+    def set_many(self, values: Dict[str, dict]):
+        """
+        See superclass. The objects are all saved in a single transaction,
+        in one round trip.
+
+        :param Dict[str, dict] values:
+
+        """
+        if not values:
+            return
+
+        for key in values.keys():
+            self._check_key(key)
+
+        logger.debug('set_many({})'.format(list(values.keys())))
+
+        score = self._get_expiry_score(self._expire)
+
+        with self._redis.pipeline() as pipe:
+            for key, value in values.items():
+                key = self.get_key_name(key)
+                pipe.hmset(key, self._serialize(value))
+                pipe.hincrby(key, self.VERSION_FIELD, 1)
+                if self._expire:
+                    pipe.expire(key, self._expire)
+            pipe.zadd(self._get_index_key_name(),
+                      **{self.get_key_name(key): score
+                         for key in values.keys()})
+            pipe.execute()
+
+    def _check_key(self, key: str):
+        """
+        Ensures that a key is not reserved for internal use.
+
+        :param str key: the key to check
+
+        :raises Exception: if the key is reserved
+
+        """
+        if key in self.RESERVED_KEYS or \
+                key.startswith(tuple(self.RESERVED_PREFIXES)):
             raise Exception('Key reserved for internal use: {}'.format(key))
 
-        if not value:
-            value = {}
+    def _serialize(self, value: Optional[dict]) -> dict:
+        """
+        Converts an object into a form suitable for storing as a Redis
+        hash.
 
-        logger.debug('set({}, {})'.format(key, value))
+        :param Optional[dict] value: the object to serialize, {} if None
 
+        :return dict: the serialized object
+
+        """
         #
         # If any of the keys are more complex data structures, store them
         # as serialized JSON
         #
         to_store = {}
-        for k, v in value.items():
+        for k, v in (value or {}).items():
             if isinstance(v, (dict, list, tuple)):
                 to_store[k] = 'JSON:{}'.format(json.dumps(v))
             elif v is None:
@@ -85,15 +268,21 @@ class RedisObjectStore(ObjectStore):
             else:
                 to_store[k] = v
 
-        key = self.get_key_name(key)
-        self._redis.hmset(key, to_store)
-        if self._expire:
-            self._redis.expire(key, self._expire)
+        return to_store
 
-        #
-        # Create a Redis set for the purposes of indexing, sorting, etc.
-        #
-        self._redis.sadd(self._get_index_key_name(), key)
+    def normalize(self, value: dict) -> dict:
+        """
+        See superclass. Redis keeps all hash values as strings.
+
+        :param dict value:
+
+        :return dict:
+
+        """
+        return self._deserialize({
+            k: v if isinstance(v, (str, bytes)) else str(v)
+            for k, v in self._serialize(value).items()
+        })
 
     def get(self, key: str) -> Optional[dict]:
         """
@@ -106,6 +295,17 @@ class RedisObjectStore(ObjectStore):
         """
         return self._get(self.get_key_name(key))
 
+    def get_with_version(self, key: str) -> Tuple[Optional[dict], int]:
+        """
+        See superclass.
+
+        :param key:
+
+        :return Tuple[Optional[dict], int]:
+
+        """
+        return self._get_with_version(self.get_key_name(key))
+
     def _get(self, key: str) -> Optional[dict]:
         """
         This is the same as the get() method, except it expects the key
@@ -115,15 +315,48 @@ class RedisObjectStore(ObjectStore):
 
         :return: the object, if found, None otherwise
 
+        """
+        return self._get_with_version(key)[0]
+
+    def _get_with_version(self, key: str) -> Tuple[Optional[dict], int]:
+        """
+        This is the same as the get_with_version() method, except it
+        expects the key prefix to already prepended to the key.
+
+        :param key: the key, namespace prefixed
+
+        :return: the object, if found, None otherwise, and its version
+
         """
         result = self._redis.hgetall(key)
 
         if not result:
-            self._redis.srem(self._get_index_key_name(), key)
-            return None
+            self._redis.zrem(self._get_index_key_name(), key)
+            return None, 0
 
         logger.debug('get({}) -> {}'.format(key, result))
-        return self._deserialize(result)
+        return self._deserialize_with_version(result)
+
+    def _deserialize_with_version(
+            self, hsh: Optional[dict]) -> Tuple[Optional[dict], int]:
+        """
+        Reconstitutes a Redis hash, separating the version of the object
+        from its data.
+
+        :param dict hsh: the Redis hash to deserialize
+
+        :return Tuple[Optional[dict], int]: the deserialized result, None if
+                                            the hash is empty, and the
+                                            version
+
+        """
+        if not hsh:
+            return None, 0
+
+        deserialized = self._deserialize(hsh)
+        version = int(deserialized.pop(self.VERSION_FIELD, 0))
+
+        return deserialized, version
 
     def _deserialize(self, hsh: dict) -> dict:
         """
@@ -165,10 +398,11 @@ class RedisObjectStore(ObjectStore):
 
         """
         #
-        # Un-ordered list
+        # Un-ordered list, only the live entries in the index are fetched
         #
         if not order_by:
-            for key in self._redis.smembers(self._get_index_key_name()):
+            for key in self._redis.zrangebyscore(self._get_index_key_name(),
+                                                 time.time(), '+inf'):
                 key = key.decode()
                 obj = self._get(key)
                 if obj is None:
@@ -178,15 +412,20 @@ class RedisObjectStore(ObjectStore):
             return
 
         #
-        # Ordered list
+        # Ordered list, SORT can't be restricted to a range of scores, so
+        # expired entries are trimmed from the index first
         #
+        self.trim_expired()
         try:
             sort_by = '*->{}'.format(order_by)
             for key in self._redis.sort(self._get_index_key_name(),
                                         by=sort_by, desc=order_desc,
                                         alpha=order_alpha):
                 key = key.decode()
-                yield (self._remove_namespace(key), self._get(key))
+                obj = self._get(key)
+                if obj is None:
+                    continue
+                yield (self._remove_namespace(key), obj)
 
             return
 
@@ -223,11 +462,15 @@ class RedisObjectStore(ObjectStore):
 
         """
         logger.debug('delete({})'.format(key))
+        #
+        # Delete the log, if any
+        #
+        self._redis.delete(self._get_log_key_name(key))
         key = self.get_key_name(key)
         #
-        # Remove from the Redis set
+        # Remove from the Redis index
         #
-        self._redis.srem(self._get_index_key_name(), key)
+        self._redis.zrem(self._get_index_key_name(), key)
         #
         # Delete the object
         #
@@ -243,3 +486,88 @@ class RedisObjectStore(ObjectStore):
         result = self._redis.exists(self.get_key_name(key))
         logger.debug('exists({}) -> {}'.format(key, result))
         return result
+
+    def expire(self, key: str, expire: int):
+        """
+        See superclass.
+
+        :param key:
+        :param expire:
+
+        """
+        logger.debug('expire({}, {})'.format(key, expire))
+        key_name = self.get_key_name(key)
+        self._redis.expire(key_name, expire)
+        self._redis.expire(self._get_log_key_name(key), expire)
+        self._redis.zadd(self._get_index_key_name(),
+                         **{key_name: self._get_expiry_score(expire)})
+
+    def trim_expired(self) -> int:
+        """
+        See superclass.
+
+        :return int:
+
+        """
+        count = self._redis.zremrangebyscore(self._get_index_key_name(),
+                                             '-inf', time.time())
+        logger.debug('trim_expired() -> {}'.format(count))
+
+        return count
+
+    def log_append(self, key: str, *entries: str) -> int:
+        """
+        See superclass.
+
+        :param key:
+        :param entries:
+
+        :return int:
+
+        """
+        log_key = self._get_log_key_name(key)
+        length = self._redis.rpush(log_key, *entries)
+        #
+        # Only set the expiry when the log is first created, so that it
+        # expires along with the object it belongs to
+        #
+        if self._expire and length == len(entries):
+            self._redis.expire(log_key, self._expire)
+
+        return length
+
+    def log_range(self, key: str, since: int = 0) -> List[str]:
+        """
+        See superclass.
+
+        :param key:
+        :param since:
+
+        :return List[str]:
+
+        """
+        result = self._redis.lrange(self._get_log_key_name(key), since, -1)
+
+        return [entry.decode() if isinstance(entry, bytes) else entry
+                for entry in result]
+
+    def log_pop(self, key: str) -> List[str]:
+        """
+        See superclass.
+
+        :param key:
+
+        :return List[str]:
+
+        """
+        key_name = self.get_key_name(key)
+
+        with self._redis.pipeline() as pipe:
+            pipe.lrange(self._get_log_key_name(key), 0, -1)
+            pipe.delete(self._get_log_key_name(key))
+            pipe.zrem(self._get_index_key_name(), key_name)
+            pipe.delete(key_name)
+            result = pipe.execute()[0]
+
+        return [entry.decode() if isinstance(entry, bytes) else entry
+                for entry in result]
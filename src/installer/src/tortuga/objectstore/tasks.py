@@ -0,0 +1,39 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from celery.schedules import crontab
+
+from tortuga.tasks.celery import app
+from .manager import ObjectStoreManager
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    #
+    # Trim the index entries of expired objects every 10 minutes
+    #
+    sender.add_periodic_task(
+        crontab(minute="*/10"),
+        trim_expired_objects.s(),
+    )
+
+
+@app.task()
+def trim_expired_objects():
+    """
+    A celery task that removes the index entries of expired objects from
+    all object store namespaces.
+
+    """
+    ObjectStoreManager.trim_expired()
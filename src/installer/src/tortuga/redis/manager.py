@@ -0,0 +1,87 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+
+from redis import Redis
+
+from tortuga.config.configManager import ConfigManager
+from .pool import HealthCheckingConnectionPool
+
+
+class RedisClientManager:
+    """
+    Redis client manager. All Redis clients in a process share a single,
+    bounded connection pool. Pub/sub subscriptions use dedicated
+    connections outside of the bound (see HealthCheckingConnectionPool).
+
+    """
+    #
+    # Seconds to wait for a connection when all connections in the pool
+    # are in use
+    #
+    POOL_TIMEOUT = 20
+    #
+    # Idle connections are checked before they are used after this many
+    # seconds
+    #
+    HEALTH_CHECK_INTERVAL = 30
+
+    _pool: HealthCheckingConnectionPool = None
+    _pool_lock = threading.Lock()
+    _config_manager: ConfigManager = ConfigManager()
+
+    @classmethod
+    def get_pool(cls) -> HealthCheckingConnectionPool:
+        """
+        Gets the process-wide Redis connection pool.
+
+        :return HealthCheckingConnectionPool: the connection pool
+
+        """
+        with cls._pool_lock:
+            if not cls._pool:
+                cls._pool = HealthCheckingConnectionPool(
+                    max_connections=(
+                        cls._config_manager.get_redis_max_connections()),
+                    timeout=cls.POOL_TIMEOUT,
+                    health_check_interval=cls.HEALTH_CHECK_INTERVAL,
+                    password=cls._config_manager.getRedisPassword(),
+                    socket_keepalive=True,
+                )
+        return cls._pool
+
+    @classmethod
+    def get(cls) -> Redis:
+        """
+        Gets a Redis client that uses the shared connection pool.
+
+        :return Redis: the Redis client
+
+        """
+        return Redis(connection_pool=cls.get_pool())
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Gets the connection pool statistics for this process.
+
+        :return dict: the pool statistics
+
+        """
+        stats = cls.get_pool().get_stats()
+        stats['pid'] = os.getpid()
+
+        return stats
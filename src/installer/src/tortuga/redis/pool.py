@@ -0,0 +1,132 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import time
+from typing import Dict, Set
+
+from redis.connection import BlockingConnectionPool, Connection
+from redis.exceptions import ConnectionError, TimeoutError
+
+from tortuga.logging import REDIS_NAMESPACE
+
+
+logger = logging.getLogger(REDIS_NAMESPACE)
+
+
+class HealthCheckingConnectionPool(BlockingConnectionPool):
+    """
+    A bounded connection pool that checks the health of connections that
+    have been idle for a while before handing them out. Once all
+    connections are in use, callers wait for one to be released rather
+    than opening new connections.
+
+    Pub/sub subscriptions hold on to their connection for as long as they
+    are subscribed, so they get a dedicated connection that does not
+    count towards the bound, and is closed when the subscription is
+    closed. Otherwise a few long-lived subscribers could exhaust the pool,
+    blocking every other Redis call.
+
+    """
+    #
+    # The command name used by redis-py when a pub/sub object requests a
+    # connection
+    #
+    PUBSUB_COMMAND = 'pubsub'
+
+    def __init__(self, health_check_interval: int = 30, **kwargs):
+        """
+        Initialization.
+
+        :param int health_check_interval: connections that have been idle
+                                          for longer than this (in seconds)
+                                          are checked before they are used
+        :param kwargs:                    see BlockingConnectionPool
+
+        """
+        self.health_check_interval = health_check_interval
+        super().__init__(**kwargs)
+
+    def reset(self):
+        self._released_at: Dict[Connection, float] = {}
+        self._pubsub_connections: Set[Connection] = set()
+        super().reset()
+
+    def get_connection(self, command_name, *keys, **options) -> Connection:
+        if command_name == self.PUBSUB_COMMAND:
+            self._checkpid()
+            connection = self.connection_class(**self.connection_kwargs)
+            self._pubsub_connections.add(connection)
+
+            return connection
+
+        connection = super().get_connection(command_name, *keys, **options)
+
+        released_at = self._released_at.pop(connection, None)
+        if released_at is not None and \
+                time.time() - released_at > self.health_check_interval:
+            self._check_health(connection)
+
+        return connection
+
+    def release(self, connection: Connection):
+        if connection in self._pubsub_connections:
+            self._pubsub_connections.discard(connection)
+            connection.disconnect()
+
+            return
+
+        self._released_at[connection] = time.time()
+        super().release(connection)
+
+    def disconnect(self):
+        for connection in list(self._pubsub_connections):
+            connection.disconnect()
+        super().disconnect()
+
+    def _check_health(self, connection: Connection):
+        """
+        Pings the server on an idle connection. If the ping fails, the
+        connection is disconnected, so that it is re-established when it
+        is next used.
+
+        :param Connection connection: the connection to check
+
+        """
+        try:
+            connection.send_command('PING')
+            if connection.read_response() not in (b'PONG', 'PONG'):
+                raise ConnectionError('Bad response to PING')
+
+        except (ConnectionError, TimeoutError) as ex:
+            logger.info('Reconnecting stale Redis connection: %s', ex)
+            connection.disconnect()
+
+    def get_stats(self) -> dict:
+        """
+        Gets the connection usage statistics for the pool.
+
+        :return dict: the pool statistics
+
+        """
+        created = len(self._connections)
+        idle = len([c for c in list(self.pool.queue) if c is not None])
+
+        return {
+            'max_connections': self.max_connections,
+            'created_connections': created,
+            'in_use_connections': created - idle,
+            'idle_connections': idle,
+            'pubsub_connections': len(self._pubsub_connections),
+        }
@@ -0,0 +1,220 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, \
+    wait
+from typing import Any, Callable, Dict, List, Optional
+
+from tortuga.db.models.node import Node
+from tortuga.logging import RESOURCE_ADAPTER_NAMESPACE
+
+
+logger = logging.getLogger(RESOURCE_ADAPTER_NAMESPACE)
+
+
+class RateLimiter:
+    """
+    Limits the rate at which operations are started, across threads.
+
+    """
+    def __init__(self, rate: float):
+        """
+        Initialization.
+
+        :param float rate: the maximum number of operations started per
+                           second
+
+        """
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        """
+        Blocks until the next operation is allowed to start.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class BulkNodeOperationResult:
+    """
+    The aggregated result of an operation run against a list of nodes.
+
+    """
+    def __init__(self):
+        #
+        # Operation return values, keyed by node name
+        #
+        self.results: Dict[str, Any] = {}
+
+        #
+        # Operation exceptions, keyed by node name
+        #
+        self.errors: Dict[str, Exception] = {}
+
+        #
+        # Names of the nodes whose operation ran longer than the per-node
+        # timeout. Timeouts are advisory: these operations were allowed
+        # to complete, and their outcome is in results or errors
+        #
+        self.timed_out: List[str] = []
+
+    @property
+    def succeeded(self) -> List[str]:
+        return sorted(self.results.keys())
+
+    @property
+    def failed(self) -> List[str]:
+        return sorted(self.errors.keys())
+
+    def __bool__(self):
+        return not self.errors
+
+    def __repr__(self):
+        return '<BulkNodeOperationResult succeeded={} failed={}>'.format(
+            len(self.results), len(self.errors))
+
+
+def run_bulk_node_operation(func: Callable[..., Any], nodes: List[Node],
+                            *args,
+                            max_workers: int = 1,
+                            timeout: Optional[float] = None,
+                            rate_limiter: Optional[RateLimiter] = None,
+                            **kwargs) -> BulkNodeOperationResult:
+    """
+    Runs func(node, *args, **kwargs) for every node, with at most
+    max_workers operations running concurrently.
+
+    With max_workers of 1, operations run one after the other in the
+    calling thread. Otherwise, operations run in threads, so blocking calls
+    (cloud provider SDKs, subprocesses, etc.) run concurrently without
+    requiring gevent monkey-patching; such operations must not use the
+    caller's database session or lazy-load attributes of the nodes.
+
+    A running operation can not be interrupted, so the timeout is advisory:
+    operations running longer are logged and listed in the timed_out
+    attribute of the result, but are waited for, and their actual outcome
+    is reported.
+
+    :param func:                      the per-node operation
+    :param List[Node] nodes:          the nodes to run the operation for
+    :param int max_workers:           the maximum number of concurrent
+                                      operations
+    :param float timeout:             the number of seconds an individual
+                                      operation is expected to run
+    :param RateLimiter rate_limiter:  limits the rate at which operations
+                                      are started
+
+    :return BulkNodeOperationResult: the aggregated results
+
+    """
+    result = BulkNodeOperationResult()
+
+    if not nodes:
+        return result
+
+    if max_workers <= 1:
+        for node in nodes:
+            if rate_limiter:
+                rate_limiter.acquire()
+
+            start = time.monotonic()
+
+            try:
+                result.results[node.name] = func(node, *args, **kwargs)
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.error(
+                    'Operation failed for node [%s]: %s', node.name, ex)
+                result.errors[node.name] = ex
+
+            if timeout and time.monotonic() - start > timeout:
+                logger.warning(
+                    'Operation for node [%s] took longer than %ss',
+                    node.name, timeout)
+                result.timed_out.append(node.name)
+
+        return result
+
+    #
+    # Operation start times, keyed by index of the node; operations waiting
+    # for a worker (or the rate limiter) have not started yet
+    #
+    started: Dict[int, float] = {}
+    lock = threading.Lock()
+
+    def _run(idx: int, node: Node):
+        if rate_limiter:
+            rate_limiter.acquire()
+
+        with lock:
+            started[idx] = time.monotonic()
+
+        return func(node, *args, **kwargs)
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(nodes))) as executor:
+        futures: Dict[Future, int] = {
+            executor.submit(_run, idx, node): idx
+            for idx, node in enumerate(nodes)
+        }
+
+        pending = set(futures.keys())
+
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=min(timeout, 1.0) if timeout else None,
+                return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                node = nodes[futures[future]]
+                try:
+                    result.results[node.name] = future.result()
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.error(
+                        'Operation failed for node [%s]: %s', node.name, ex)
+                    result.errors[node.name] = ex
+
+            if not timeout:
+                continue
+
+            now = time.monotonic()
+            with lock:
+                timed_out = [
+                    nodes[futures[future]] for future in pending
+                    if futures[future] in started and
+                    now - started[futures[future]] > timeout
+                ]
+
+            for node in timed_out:
+                if node.name in result.timed_out:
+                    continue
+
+                logger.warning(
+                    'Operation for node [%s] still running after %ss',
+                    node.name, timeout)
+                result.timed_out.append(node.name)
+
+    return result
@@ -19,10 +19,10 @@ import logging
 import os.path
 import re
 import sys
+import threading
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import gevent
 from sqlalchemy.orm.session import Session
 from tortuga.addhost.addHostManager import AddHostManager
 from tortuga.config.configManager import ConfigManager
@@ -45,10 +45,14 @@ from tortuga.logging import RESOURCE_ADAPTER_NAMESPACE
 from tortuga.objects.node import Node as TortugaNode
 from tortuga.parameter.parameterApi import ParameterApi
 from tortuga.resourceAdapterConfiguration import settings
+from tortuga.resourceAdapterConfiguration.cache import \
+    ResourceAdapterConfigurationCacheManager
 from tortuga.resourceAdapterConfiguration.validator import (ConfigurationValidator,
                                                             ValidationError)
 from tortuga.schema import ResourceAdapterConfigSchema
 
+from .bulk import BulkNodeOperationResult, RateLimiter, \
+    run_bulk_node_operation
 from .userDataMixin import UserDataMixin
 
 
@@ -56,6 +60,12 @@ cm = ConfigManager()
 
 DEFAULT_CONFIGURATION_PROFILE_NAME = 'Default'
 
+#
+# Rate limiters for bulk node operations, keyed by resource adapter name
+#
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
 
 class ResourceAdapter(UserDataMixin): \
         # pylint: disable=too-many-public-methods
@@ -75,6 +85,22 @@ class ResourceAdapter(UserDataMixin): \
 
     __adaptername__ = None
 
+    #
+    # Bulk node operations (see _bulk_node_operation()): the maximum
+    # number of concurrent per-node operations, the number of seconds
+    # after which a running operation is reported as timed out (None for
+    # no timeout) and the maximum number of operations started per second,
+    # across all instances of the resource adapter (None for no limit).
+    #
+    # By default, per-node operations run one at a time in the calling
+    # thread. Resource adapters whose per-node operations neither use
+    # the database session nor lazy-load node attributes may raise
+    # bulk_max_workers to run them concurrently in threads.
+    #
+    bulk_max_workers: int = 1
+    bulk_node_timeout: Optional[float] = None
+    bulk_rate_limit: Optional[float] = None
+
     def __init__(self, addHostSession: Optional[str] = None):
         if not self.__adaptername__:
             raise AttributeError(
@@ -214,21 +240,143 @@ class ResourceAdapter(UserDataMixin): \
 
         self.__trace(nodes)
 
-    def _async_delete_nodes(self, nodes):
+    def _async_delete_nodes(self, nodes: List[Node]) \
+            -> BulkNodeOperationResult:
+        """
+        Delete nodes; calls "ResourceAdapter._delete_node()" method for
+        each deleted nodes
+
+        :param nodes: list of Nodes objects
+
+        :return BulkNodeOperationResult: the aggregated results
+
+        """
+        return self._bulk_node_operation(self._delete_node, nodes)
+
+    def _async_startup_nodes(self, nodes: List[Node], *args, **kwargs) \
+            -> BulkNodeOperationResult:
+        """
+        Start nodes; calls "ResourceAdapter._startup_node()" for each
+        node, with any additional arguments
+
+        :param nodes: list of Nodes objects
+
+        :return BulkNodeOperationResult: the aggregated results
+
+        """
+        return self._bulk_node_operation(
+            self._startup_node, nodes, *args, **kwargs)
+
+    def _async_shutdown_nodes(self, nodes: List[Node], *args, **kwargs) \
+            -> BulkNodeOperationResult:
+        """
+        Shut down nodes; calls "ResourceAdapter._shutdown_node()" for
+        each node, with any additional arguments
+
+        :param nodes: list of Nodes objects
+
+        :return BulkNodeOperationResult: the aggregated results
+
+        """
+        return self._bulk_node_operation(
+            self._shutdown_node, nodes, *args, **kwargs)
+
+    def _async_reboot_nodes(self, nodes: List[Node], *args, **kwargs) \
+            -> BulkNodeOperationResult:
+        """
+        Reboot nodes; calls "ResourceAdapter._reboot_node()" for each
+        node, with any additional arguments
+
+        :param nodes: list of Nodes objects
+
+        :return BulkNodeOperationResult: the aggregated results
+
+        """
+        return self._bulk_node_operation(
+            self._reboot_node, nodes, *args, **kwargs)
+
+    def _bulk_node_operation(self, func: Callable[..., Any],
+                             nodes: List[Node], *args, **kwargs) \
+            -> BulkNodeOperationResult:
+        """
+        Runs a per-node operation for all nodes, bounded by the
+        concurrency, timeout and rate limit settings of the resource
+        adapter.
+
+        With bulk_max_workers greater than 1, per-node operations run in
+        separate threads, and must therefore not use the (shared) database
+        session.
+
+        """
+        self._logger.debug(
+            '_bulk_node_operation(): %s for %d node(s)',
+            func.__name__, len(nodes))
+
+        result = run_bulk_node_operation(
+            func, nodes, *args,
+            max_workers=self.bulk_max_workers,
+            timeout=self.bulk_node_timeout,
+            rate_limiter=self._get_rate_limiter(),
+            **kwargs
+        )
+
+        if result.errors:
+            self._logger.error(
+                '%s failed for node(s): %s',
+                func.__name__, ' '.join(result.failed))
+
+        return result
+
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
         """
-        Asynchronously delete nodes; calls "ResourceAdapter._delete_node()"
-        method for each deleted nodes
+        Gets the rate limiter shared by all instances of the resource
+        adapter, if a rate limit is configured.
 
-        :param dbNodes: list of Nodes objects
-        :return: None
         """
-        greenlets = []
+        if not self.bulk_rate_limit:
+            return None
 
-        for node in nodes:
-            greenlets.append(gevent.spawn(self._delete_node, node))
+        with _rate_limiters_lock:
+            if self.__adaptername__ not in _rate_limiters:
+                _rate_limiters[self.__adaptername__] = \
+                    RateLimiter(self.bulk_rate_limit)
 
-        # TODO: implement timeout
-        gevent.joinall(greenlets)
+            return _rate_limiters[self.__adaptername__]
+
+    def _delete_node(self, node: Node) -> None:
+        """
+        Delete a single node. Override this method to use
+        _async_delete_nodes().
+
+        """
+        raise UnsupportedOperation('Node does not support deletion')
+
+    def _startup_node(self, node: Node, *args, **kwargs) -> None: \
+            # pylint: disable=unused-argument
+        """
+        Start a single node. Override this method to use
+        _async_startup_nodes().
+
+        """
+        raise UnsupportedOperation('Node does not support starting')
+
+    def _shutdown_node(self, node: Node, *args, **kwargs) -> None: \
+            # pylint: disable=unused-argument
+        """
+        Shut down a single node. Override this method to use
+        _async_shutdown_nodes().
+
+        """
+        raise UnsupportedOperation('Node does not support shutdown')
+
+    def _reboot_node(self, node: Node, *args, **kwargs) -> None: \
+            # pylint: disable=unused-argument
+        """
+        Reboot a single node. Override this method to use
+        _async_reboot_nodes().
+
+        """
+        raise UnsupportedOperation('Node does not support rebooting')
 
     def startupNode(self, nodes: List[Node],
                     remainingNodeList: Optional[str] = None,
@@ -333,16 +481,31 @@ class ResourceAdapter(UserDataMixin): \
         """
         self._logger.debug('get_config(profile={})'.format(profile))
 
+        profile = profile or DEFAULT_CONFIGURATION_PROFILE_NAME
+
         #
-        # Validate the settings and dump the config with transformed
-        # values
+        # Resolved, validated profiles are cached until the profile is
+        # changed
         #
-        try:
-            validator = self.validate_config(profile)
-            processed_config: Dict[str, Any] = validator.dump()
-
-        except ValidationError as ex:
-            raise ConfigurationError(str(ex))
+        cache = ResourceAdapterConfigurationCacheManager.get()
+        processed_config: Optional[Dict[str, Any]] = \
+            cache.get(self.__adaptername__, profile)
+        generation = cache.generation
+
+        if processed_config is None:
+            #
+            # Validate the settings and dump the config with transformed
+            # values
+            #
+            try:
+                validator = self.validate_config(profile)
+                processed_config = validator.dump()
+
+            except ValidationError as ex:
+                raise ConfigurationError(str(ex))
+
+            cache.set(self.__adaptername__, profile, processed_config,
+                      generation=generation)
 
         #
         # Perform any required additional processing on the config
@@ -18,9 +18,13 @@ from typing import Dict, List
 
 from sqlalchemy.orm.session import Session
 
+from tortuga.events.types import (ResourceAdapterConfigurationCreated,
+                                  ResourceAdapterConfigurationDeleted,
+                                  ResourceAdapterConfigurationUpdated)
 from tortuga.exceptions.validationError import ValidationError
 from tortuga.logging import RESOURCE_ADAPTER_NAMESPACE
 from . import validator
+from .cache import ResourceAdapterConfigurationCacheManager
 from .manager import ResourceAdapterConfigurationManager
 from ..utility.tortugaApi import TortugaApi
 
@@ -65,6 +69,9 @@ class ResourceAdapterConfigurationApi(TortugaApi):
         except validator.ValidationError as ex:
             raise ValidationError(str(ex))
 
+        self._invalidate(ResourceAdapterConfigurationCreated,
+                         resadapter_name, name)
+
     def get(self, session, resadapter_name, name):
         self._logger.debug(
             'get(resadapter_name=[{}], name=[{}])'.format(
@@ -86,6 +93,9 @@ class ResourceAdapterConfigurationApi(TortugaApi):
         ResourceAdapterConfigurationManager().delete(
             session, resadapter_name, name)
 
+        self._invalidate(ResourceAdapterConfigurationDeleted,
+                         resadapter_name, name)
+
     def update(self, session: Session, resadapter_name: str, name: str,
                configuration: List[Dict[str, str]],
                force: bool = False):
@@ -119,3 +129,20 @@ class ResourceAdapterConfigurationApi(TortugaApi):
 
         except validator.ValidationError as ex:
             raise ValidationError(str(ex))
+
+        self._invalidate(ResourceAdapterConfigurationUpdated,
+                         resadapter_name, name)
+
+    def _invalidate(self, event_class, resadapter_name: str,
+                    name: str) -> None:
+        """
+        Invalidates the cached configuration profiles of a resource adapter
+        in this process, and fires the event that invalidates them in all
+        other processes.
+
+        """
+        ResourceAdapterConfigurationCacheManager.get().invalidate(
+            resadapter_name)
+
+        event_class.fire(resourceadapter_name=resadapter_name,
+                         profile_name=name)
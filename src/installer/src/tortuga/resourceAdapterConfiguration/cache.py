@@ -0,0 +1,218 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from tortuga.events.exceptions import UnresolvableEventError
+from tortuga.events.pubsub import EventPubSub
+from tortuga.logging import RESOURCE_ADAPTER_NAMESPACE
+
+
+logger = logging.getLogger(RESOURCE_ADAPTER_NAMESPACE)
+
+
+class ResourceAdapterConfigurationCache:
+    """
+    A per-process cache of resolved, validated resource adapter
+    configuration profiles, keyed by (resource adapter name, profile name).
+
+    Cached profiles are invalidated by the resource adapter configuration
+    events fired whenever a profile is created, updated or deleted. Events
+    are received through the event pub/sub service, so profiles changed in
+    another process are invalidated as well. All profiles for a resource
+    adapter are invalidated on any change, as every profile is resolved on
+    top of the 'Default' profile.
+
+    A profile resolved while another thread invalidates the cache could be
+    stale, so callers take the generation before resolving a profile and
+    pass it to set(), which only caches the profile if no invalidation
+    happened in the meantime.
+
+    """
+    EVENT_NAME_PATTERN = 'resource-adapter-configuration-*'
+
+    def __init__(self, pubsub: Optional[EventPubSub] = None):
+        """
+        Initialization.
+
+        :param EventPubSub pubsub: the event pub/sub service used to
+                                   receive invalidation events, caching
+                                   is disabled if no subscription can be
+                                   established
+
+        """
+        self._lock = threading.RLock()
+        self._configs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._generation = 0
+        self._pubsub = None
+
+        if pubsub is None:
+            return
+
+        try:
+            pubsub.subscribe(self.EVENT_NAME_PATTERN)
+            self._pubsub = pubsub
+        except Exception as ex:  # pylint: disable=broad-except
+            #
+            # Without invalidation events, cached profiles could become
+            # stale, so disable caching altogether
+            #
+            logger.warning(
+                'Unable to subscribe to resource adapter configuration'
+                ' events, caching disabled: %s', ex)
+
+    @property
+    def enabled(self) -> bool:
+        return self._pubsub is not None
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of invalidations so far.
+
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, resadapter_name: str,
+            profile: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets a cached configuration profile.
+
+        :param str resadapter_name: the name of the resource adapter
+        :param str profile:         the name of the configuration profile
+
+        :return Optional[Dict[str, Any]]: a copy of the cached
+                                          configuration, or None if not
+                                          cached
+
+        """
+        if not self.enabled:
+            return None
+
+        self._process_events()
+
+        with self._lock:
+            config = self._configs.get((resadapter_name, profile))
+
+        return copy.deepcopy(config) if config is not None else None
+
+    def set(self, resadapter_name: str, profile: str,
+            config: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """
+        Caches a configuration profile.
+
+        :param str resadapter_name:   the name of the resource adapter
+        :param str profile:           the name of the configuration profile
+        :param Dict[str, Any] config: the resolved, validated configuration
+        :param int generation:        the generation taken before the
+                                      configuration was resolved; the
+                                      configuration is not cached if the
+                                      cache was invalidated since
+
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                logger.debug(
+                    'Not caching profile [%s] for resource adapter [%s],'
+                    ' invalidated while resolving', profile, resadapter_name)
+
+                return
+
+            self._configs[(resadapter_name, profile)] = copy.deepcopy(config)
+
+    def invalidate(self, resadapter_name: Optional[str] = None) -> None:
+        """
+        Invalidates cached configuration profiles.
+
+        :param str resadapter_name: the name of the resource adapter to
+                                    invalidate profiles for, otherwise all
+
+        """
+        logger.debug('invalidate(resadapter_name=%s)', resadapter_name)
+
+        with self._lock:
+            self._generation += 1
+
+            if resadapter_name is None:
+                self._configs.clear()
+
+                return
+
+            for key in [key for key in self._configs.keys()
+                        if key[0] == resadapter_name]:
+                del self._configs[key]
+
+    def _process_events(self) -> None:
+        """
+        Processes any pending invalidation events.
+
+        """
+        while True:
+            try:
+                event = self._pubsub.get_message()
+            except UnresolvableEventError as ex:
+                #
+                # The event expired before it was received, so it is not
+                # known which resource adapter changed
+                #
+                logger.warning(
+                    'Unable to load invalidation event, invalidating all'
+                    ' profiles: %s', ex)
+                self.invalidate()
+
+                continue
+            except Exception:  # pylint: disable=broad-except
+                #
+                # Invalidation events may have been lost, so err on the
+                # side of caution
+                #
+                logger.exception('Error receiving invalidation events')
+                self.invalidate()
+
+                return
+
+            if event is None:
+                return
+
+            self.invalidate(getattr(event, 'resourceadapter_name', None))
+
+
+class ResourceAdapterConfigurationCacheManager:
+    """
+    Resource adapter configuration cache manager
+
+    """
+    _cache: ResourceAdapterConfigurationCache = None
+
+    @classmethod
+    def get(cls) -> ResourceAdapterConfigurationCache:
+        """
+        Get the (per-process) resource adapter configuration cache.
+
+        :return ResourceAdapterConfigurationCache: the cache instance
+
+        """
+        if not cls._cache:
+            from tortuga.events.manager import PubSubManager
+
+            cls._cache = ResourceAdapterConfigurationCache(
+                pubsub=PubSubManager.get())
+        return cls._cache
@@ -148,6 +148,7 @@ class ResourceAdapterConfigurationManager:
         cfg = self.get(session, resadapter_name, name)
 
         session.delete(cfg)
+        session.commit()
 
     def update(self, session: Session, resadapter_name: str, name: str,
                configuration: List[Dict[str, str]],
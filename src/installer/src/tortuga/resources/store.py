@@ -33,12 +33,16 @@ class ResourceRequestStore:
     Base class for the resource_request storage back-end.
 
     """
-    def save(self, resource_request: BaseResourceRequest) -> BaseResourceRequest:
+    def save(self, resource_request: BaseResourceRequest,
+             expected_version: Optional[int] = None) -> BaseResourceRequest:
         """
         Saves the resource_request to the resource_request store.
 
         :param BaseResourceRequest resource_request: the resource_request to
                                    save
+        :param int expected_version: if set, the resource_request is only
+                                     saved if the version in the store
+                                     matches
 
         """
         raise NotImplementedError()
@@ -95,8 +99,9 @@ class ObjectStoreResourceRequestStore(ObjectStoreTypeStore,
                                       ResourceRequestStore):
     type_class = BaseResourceRequest
 
-    def save(self, resource_request: BaseResourceRequest) -> BaseResourceRequest:
-        return super().save(resource_request)
+    def save(self, resource_request: BaseResourceRequest,
+             expected_version: Optional[int] = None) -> BaseResourceRequest:
+        return super().save(resource_request, expected_version)
 
     def rollback(self, resource_request: BaseResourceRequest) -> BaseResourceRequest:
         if not resource_request.id:
@@ -143,17 +148,16 @@ class EventGeneratingResourceRequestStore(ResourceRequestStore):
     def __init__(self, store: ObjectStoreResourceRequestStore):
         self.store = store
 
-    def save(self, resource_request: BaseResourceRequest) -> BaseResourceRequest:
-        rr_old: Optional[BaseResourceRequest] = None
-        if resource_request.id:
-            rr_old = self.store.get(resource_request.id)
-        else:
+    def save(self, resource_request: BaseResourceRequest,
+             expected_version: Optional[int] = None) -> BaseResourceRequest:
+        if not resource_request.id:
             resource_request.id = str(uuid.uuid4())
 
-        rr = self.store.save(resource_request)
-        self._fire_events(rr_old, rr)
+        saved, data, previous_data = self.store.save_returning_previous(
+            resource_request, expected_version)
+        self._fire_events(previous_data, resource_request, data)
 
-        return rr
+        return saved
 
     def rollback(self, resource_request: BaseResourceRequest) -> BaseResourceRequest:
         return self.store.rollback(resource_request)
@@ -167,19 +171,16 @@ class EventGeneratingResourceRequestStore(ResourceRequestStore):
         return self.store.list(order_by, order_desc, order_alpha, limit,
                                **filters)
 
-    def _fire_events(self, rr_old: Optional[BaseResourceRequest],
-                     rr: BaseResourceRequest):
-        if rr_old:
-            self._event_updated(rr_old, rr)
+    def _fire_events(self, previous_data: Optional[dict],
+                     rr: BaseResourceRequest, data: dict):
+        if previous_data is not None:
+            self._event_updated(previous_data, rr, data)
         else:
             self._event_created(rr)
 
-    def _event_updated(self, rr_old: Optional[BaseResourceRequest],
-                       rr: BaseResourceRequest):
-        data = self.store.marshall(rr)
-        previous_data = self.store.marshall(rr_old)
-
-        if data != previous_data:
+    def _event_updated(self, previous_data: dict, rr: BaseResourceRequest,
+                       data: dict):
+        if self.store.is_changed(data, previous_data):
             ResourceRequestUpdated.fire(
                 resourcerequest_id=rr.id,
                 previous_resourcerequest=previous_data
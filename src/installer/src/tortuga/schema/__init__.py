@@ -201,6 +201,10 @@ class NodeSchema(ModelSchema):
     # standard object serialization
     @post_dump(pass_many=True, pass_original=True)
     def fixTags(self, in_data, many, original):
+        # Tags are not included if the schema is limited to other fields
+        if self.only and 'tags' not in self.only:
+            return in_data
+
         if isinstance(in_data, list):
             for i in range(0, len(in_data)):
                 tagFunc = getattr(original[i], "getTags", None)
@@ -35,6 +35,12 @@ class InstallOsKitCli(TortugaCli):
                        help=_('Symlink media instead of copying'),
                        action='store_true', default=False)
 
+        self.addOption('--dedup', dest='dedupFlag',
+                       help=_('Store each media file once, by content, and'
+                              ' hard link it into the repository. Files'
+                              ' that are already up to date are skipped.'),
+                       action='store_true', default=False)
+
         self.addOption('--force', action='store_true', default=False,
                        help=_('Force reinstallation of existing OS kit'))
 
@@ -64,6 +70,7 @@ package-based node provisioning.
                 session,
                 os_media_urls,
                 bUseSymlinks=self.getArgs().symlinksFlag,
+                bDedup=self.getArgs().dedupFlag,
                 bInteractive=True,
                 mirror=self.getArgs().mirror
             )
@@ -21,8 +21,8 @@ from tortuga.db.dbManager import DbManager
 from tortuga.db.models.softwareProfile import \
     SoftwareProfile as DbSoftwareProfile
 from tortuga.db.models.softwareProfileTag import SoftwareProfileTag
-from tortuga.events.types import SoftwareProfileTagsChanged, TagCreated, \
-    TagUpdated, TagDeleted
+from tortuga.events.types import BaseEvent, SoftwareProfileTagsChanged, \
+    TagCreated, TagUpdated, TagDeleted
 from tortuga.objectstore.base import matches_filters
 from tortuga.typestore.base import TypeStore
 from .types import SoftwareProfile
@@ -41,18 +41,16 @@ class SqlalchemySessionSoftwareProfileStore(TypeStore):
     def __init__(self, db_manager: DbManager):
         self._Session = sessionmaker(bind=db_manager.engine)
 
-    def _to_db_swp(
-            self,
-            swp: SoftwareProfile,
-            session: Session) -> Tuple[Optional[DbSoftwareProfile], List, List, List]:
-        if swp.id:
-            db_swp = session.query(DbSoftwareProfile).filter(
-                DbSoftwareProfile.id == int(swp.id)).first()
-            if not db_swp:
-                return None, [], [], []
-        else:
+    def _get_db_swp(self, swp: SoftwareProfile,
+                    session: Session) -> Optional[DbSoftwareProfile]:
+        if not swp.id:
             raise Exception('Creating swps is currently not supported')
 
+        return session.query(DbSoftwareProfile).filter(
+            DbSoftwareProfile.id == int(swp.id)).first()
+
+    def _to_db_swp(self, swp: SoftwareProfile,
+                   db_swp: DbSoftwareProfile) -> Tuple[List, List, List]:
         db_swp.name = swp.name
         db_swp.description = swp.description
         db_swp.minNodes = swp.min_nodes
@@ -60,10 +58,7 @@ class SqlalchemySessionSoftwareProfileStore(TypeStore):
         db_swp.lockedState = swp.locked
         db_swp.dataRoot = swp.data_root
         db_swp.dataRsync = swp.data_rsync
-        tag_create_events, tag_update_events, tag_delete_events = \
-            self._set_db_swp_tags(db_swp, swp.tags)
-
-        return db_swp, tag_create_events, tag_update_events, tag_delete_events
+        return self._set_db_swp_tags(db_swp, swp.tags)
 
     def _set_db_swp_tags(self, db_swp: DbSoftwareProfile,
                          tags: Dict[str, str]) -> Tuple[List, List, List]:
@@ -129,7 +124,7 @@ class SqlalchemySessionSoftwareProfileStore(TypeStore):
             # Note: currently, order_alpha is ignored for SqlAlchemy,
             #       as it is the default behavior for strings
             #
-            if desc:
+            if order_desc:
                 result = result.order_by(
                     desc(getattr(DbSoftwareProfile, order_by))
                 )
@@ -164,18 +159,23 @@ class SqlalchemySessionSoftwareProfileStore(TypeStore):
     def save(self, obj: SoftwareProfile) -> SoftwareProfile:
         logger.debug('save(obj=%s) -> ...', obj)
 
-        swp_old = None
-        if obj.id:
-            swp_old = self.get(obj.id)
-
         session = self._Session()
-        db_swp, tag_create_events, tag_update_events, tag_delete_events = \
-            self._to_db_swp(obj, session)
-        if not db_swp:
-            raise Exception('SoftwareProfile ID not found: %s', obj.id)
-        session.commit()
-        swp = self._to_swp(db_swp)
-        session.close()
+        try:
+            db_swp = self._get_db_swp(obj, session)
+            if not db_swp:
+                raise Exception('SoftwareProfile ID not found: %s', obj.id)
+            #
+            # Snapshot the previous state from the loaded row before it is
+            # modified, and the new state before the commit expires it, so
+            # that neither requires another round trip to the database
+            #
+            swp_old = self._to_swp(db_swp)
+            tag_create_events, tag_update_events, tag_delete_events = \
+                self._to_db_swp(obj, db_swp)
+            swp = self._to_swp(db_swp)
+            session.commit()
+        finally:
+            session.close()
 
         self._fire_events(swp_old, swp)
         self._fire_tag_events(swp.id, tag_create_events, tag_update_events,
@@ -208,22 +208,28 @@ class SqlalchemySessionSoftwareProfileStore(TypeStore):
         # delete then a create, which can have undesirable effects when the
         # create happens before the delete
         #
+        events: List[BaseEvent] = []
         for evt in deleted:
-            TagDeleted.fire(
+            events.append(TagDeleted(
                 tag_id='softwareprofile:{}:{}'.format(
                     softwareprofile_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in created:
-            TagCreated.fire(
+            events.append(TagCreated(
                 tag_id='softwareprofile:{}:{}'.format(
                     softwareprofile_id, evt['name']),
                 value=evt['value']
-            )
+            ))
         for evt in updated:
-            TagUpdated.fire(
+            events.append(TagUpdated(
                 tag_id='softwareprofile:{}:{}'.format(
                     softwareprofile_id, evt['name']),
                 value=evt['value'],
                 previous_value=evt['previous_value']
-            )
+            ))
+        #
+        # Store and publish the events together, and send them as a batch
+        # to the listeners that accept batches
+        #
+        BaseEvent.fire_many(events)
@@ -0,0 +1,46 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tortuga.config.configManager import ConfigManager
+from tortuga.objectstore.manager import ObjectStoreManager
+from .scheduler import ClusterUpdateScheduler
+
+
+class ClusterUpdateSchedulerManager:
+    """
+    Cluster update scheduler manager
+
+    """
+    _scheduler: ClusterUpdateScheduler = None
+
+    @classmethod
+    def get(cls) -> ClusterUpdateScheduler:
+        """
+        Get an instance of the cluster update scheduler.
+
+        :return ClusterUpdateScheduler: the cluster update scheduler instance
+
+        """
+        if not cls._scheduler:
+            #
+            # Pending updates should never hang around for long, the expiry
+            # is only a safety net in case the update task is lost
+            #
+            object_store = ObjectStoreManager.get('cluster-update',
+                                                  expire=3600)
+            cls._scheduler = ClusterUpdateScheduler(
+                object_store,
+                window=ConfigManager().get_cluster_update_window()
+            )
+        return cls._scheduler
@@ -0,0 +1,170 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import logging
+from typing import List, Optional
+
+from tortuga.logging import SYNC_NAMESPACE
+from tortuga.objectstore.base import ObjectStore
+
+
+logger = logging.getLogger(SYNC_NAMESPACE)
+
+
+class ClusterUpdateScheduler:
+    """
+    Debounces cluster update requests.
+
+    Every cluster update request arriving within the update window is
+    merged into a single cluster update, which is run (via Celery) once
+    the window, starting with the first request, has elapsed. The reasons
+    for all merged requests are recorded, and passed along with the
+    cluster update.
+
+    The pending update is kept in the object store, so requests are merged
+    across web service and Celery worker processes.
+
+    """
+    #
+    # The key used to store the pending update in the object store
+    #
+    PENDING_KEY = 'pending'
+
+    def __init__(self, object_store: ObjectStore, window: float = 0):
+        """
+        Initialization.
+
+        :param ObjectStore object_store: the object store used to keep track
+                                         of the pending update
+        :param float window:             the number of seconds during which
+                                         update requests are merged, if 0
+                                         updates are run immediately
+
+        """
+        self._store = object_store
+        self._window = window
+
+    def schedule(self, reason: Optional[str] = None) -> None:
+        """
+        Requests a cluster update.
+
+        :param str reason: the reason for the update (optional)
+
+        """
+        logger.debug('schedule(reason=%s)', reason)
+
+        if self._window <= 0:
+            self.run_update([reason] if reason else [])
+
+            return
+
+        #
+        # The log append is atomic, so only the first request in the
+        # window gets a length of 1, and is responsible for scheduling the
+        # update
+        #
+        if self._store.log_append(self.PENDING_KEY, reason or '') > 1:
+            return
+
+        self._store.set(self.PENDING_KEY, {
+            'pending_since':
+                datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        })
+
+        from .tasks import run_cluster_update
+
+        try:
+            run_cluster_update.apply_async(countdown=self._window)
+        except Exception:
+            #
+            # Clear the pending update, otherwise all further requests
+            # would be merged into an update that is never run
+            #
+            self._store.log_pop(self.PENDING_KEY)
+
+            raise
+
+    def run_pending_update(self) -> None:
+        """
+        Runs the pending cluster update, if any. This is called once the
+        update window has elapsed.
+
+        """
+        #
+        # Remove the pending update before running it, so that any requests
+        # that arrive while the update is running schedule a new update.
+        # This is done atomically, so each request is either part of this
+        # update, or schedules a new one.
+        #
+        reasons = self._store.log_pop(self.PENDING_KEY)
+
+        if not reasons:
+            logger.debug('No pending cluster update')
+
+            return
+
+        self.run_update(reasons)
+
+    def run_update(self, reasons: List[str]) -> None:
+        """
+        Runs a cluster update.
+
+        :param List[str] reasons: the reasons for the update
+
+        """
+        update_reason = '; '.join(self._get_unique_reasons(reasons)) or None
+
+        logger.info('Running cluster update (reason: %s)', update_reason)
+
+        from tortuga.wsapi.syncWsApi import SyncWsApi
+
+        # Always go over the web service for this call.
+        SyncWsApi().scheduleClusterUpdate(updateReason=update_reason)
+
+    def get_status(self) -> dict:
+        """
+        Gets the status of the pending cluster update.
+
+        :return dict: the pending update status, with the following keys:
+                      pending (bool), pending_since (str, ISO 8601 timestamp
+                      of the first merged request) and reasons (List[str])
+
+        """
+        pending = self._store.get(self.PENDING_KEY)
+        reasons = self._store.log_range(self.PENDING_KEY)
+
+        return {
+            'pending': bool(pending or reasons),
+            'pending_since': pending.get('pending_since') if pending else None,
+            'reasons': self._get_unique_reasons(reasons),
+        }
+
+    @staticmethod
+    def _get_unique_reasons(reasons: List[str]) -> List[str]:
+        """
+        Gets the union of the reasons for all merged requests, in the order
+        they were requested.
+
+        :param List[str] reasons: the reasons for all merged requests
+
+        :return List[str]: the unique, non-empty, reasons
+
+        """
+        unique_reasons: List[str] = []
+        for reason in reasons:
+            if reason and reason not in unique_reasons:
+                unique_reasons.append(reason)
+
+        return unique_reasons
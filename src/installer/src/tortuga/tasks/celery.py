@@ -58,7 +58,9 @@ if 'TORTUGA_TEST' in os.environ:
     app = TestApp(
         include=[
             'tortuga.events.tasks',
+            'tortuga.objectstore.tasks',
             'tortuga.resourceAdapter.tasks',
+            'tortuga.sync.tasks',
         ]
     )
     app.app = Application()
@@ -128,10 +130,23 @@ else:
         backend='redis://:{}@localhost:6379/0'.format(redis_password),
         include=[
             'tortuga.events.tasks',
+            'tortuga.objectstore.tasks',
             'tortuga.resourceAdapter.tasks',
+            'tortuga.sync.tasks',
         ] + kit_task_modules + component_task_modules
     )
 
+    #
+    # Bound the number of broker and result backend connections, and keep
+    # them alive, in the same way as the shared Redis connection pool
+    #
+    redis_max_connections = config_manager.get_redis_max_connections()
+    app.conf.update(
+        broker_pool_limit=redis_max_connections,
+        broker_transport_options={'socket_keepalive': True},
+        redis_max_connections=redis_max_connections,
+    )
+
 
 if __name__ == '__main__':
     app.start()
@@ -13,12 +13,21 @@ class TypeStore:
     #
     type_class: Type[BaseType] = BaseType
 
-    def save(self, obj: BaseType) -> BaseType:
+    def save(self, obj: BaseType,
+             expected_version: Optional[int] = None) -> BaseType:
         """
         Saves the type to the store. If the object doesn't exist, it is
         created, otherwise it is updated.
 
-        :param BaseType obj: the object instance to save
+        :param BaseType obj:         the object instance to save
+        :param int expected_version: if set, the object is only saved if
+                                     the version in the store matches, use
+                                     obj.version for objects that were
+                                     loaded from the store
+
+        :raises VersionConflictError: if the version of the object in the
+                                      store doesn't match the expected
+                                      version
 
         :return BaseType: the object that was saved
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple
 
 from tortuga.objectstore.base import matches_filters, ObjectStore
 from tortuga.types.base import BaseType
@@ -14,6 +14,12 @@ class ObjectStoreTypeStore(TypeStore):
     An implementation of the type store that saves data in an object store.
 
     """
+    #
+    # Whether or not objects loaded from the store are tagged with their
+    # version, see BaseType.version
+    #
+    versioned: bool = True
+
     def __init__(self, object_store: ObjectStore):
         self._store = object_store
 
@@ -27,15 +33,91 @@ class ObjectStoreTypeStore(TypeStore):
         unmarshalled = schema_class().load(obj_dict)
         return self.type_class(**unmarshalled.data)
 
-    def save(self, obj: BaseType) -> BaseType:
+    def encode(self, obj_dict: dict) -> dict:
+        """
+        Encodes a marshalled object into the form it is kept in the object
+        store. By default, they are the same.
+
+        :param dict obj_dict: the marshalled object
+
+        :return dict: the object, as stored in the object store
+
+        """
+        return obj_dict
+
+    def decode(self, stored: dict) -> dict:
+        """
+        Decodes an object as kept in the object store into its marshalled
+        form. This is the inverse of encode().
+
+        :param dict stored: the object, as stored in the object store
+
+        :return dict: the marshalled object
+
+        """
+        return stored
+
+    def save(self, obj: BaseType,
+             expected_version: Optional[int] = None) -> BaseType:
         """
         See superclass.
 
         :param BaseType obj:
+        :param int expected_version:
 
         """
-        self._store.set(obj.id, self.marshall(obj))
-        return self.get(obj.id)
+        return self.save_returning_previous(obj, expected_version)[0]
+
+    def save_returning_previous(
+            self, obj: BaseType, expected_version: Optional[int] = None
+    ) -> Tuple[BaseType, dict, Optional[dict]]:
+        """
+        Saves the object to the store, returning the object it replaced.
+        The previous object is read in the same transaction as the write,
+        so it is exactly the object that was overwritten. The saved object
+        is built from the data written, rather than read back from the
+        store.
+
+        :param BaseType obj:         the object instance to save
+        :param int expected_version: see save()
+
+        :raises VersionConflictError: see save()
+
+        :return Tuple[BaseType, dict, Optional[dict]]: the saved object,
+                                                       the marshalled object
+                                                       that was written, and
+                                                       the previous object
+                                                       as stored (see
+                                                       is_changed()), None
+                                                       if it didn't exist
+
+        """
+        data = self.marshall(obj)
+        previous, version = self._store.set_with_version(
+            obj.id, self.encode(data), expected_version=expected_version)
+
+        saved = self.unmarshall(data)
+        if self.versioned:
+            saved.version = version
+
+        if previous is not None:
+            previous = self.decode(previous)
+
+        return saved, data, previous
+
+    def is_changed(self, data: dict, previous: dict) -> bool:
+        """
+        Whether or not a marshalled object differs from the previous
+        object returned by save_returning_previous(), which holds values as
+        they are kept in the object store.
+
+        :param dict data:     the marshalled object
+        :param dict previous: the previous object
+
+        :return bool: True if the objects differ, False otherwise
+
+        """
+        return self._store.normalize(data) != self._store.normalize(previous)
 
     def rollback(self, obj: BaseType) -> BaseType:
         """
@@ -46,7 +128,7 @@ class ObjectStoreTypeStore(TypeStore):
         """
         logger.debug('rollback({})'.format(obj.id))
 
-        self._store.set(obj.id, self.marshall(obj))
+        self._store.set(obj.id, self.encode(self.marshall(obj)))
         return self.get(obj.id)
 
     def get(self, obj_id: str) -> Optional[BaseType]:
@@ -58,10 +140,13 @@ class ObjectStoreTypeStore(TypeStore):
         :return BaseType:
 
         """
-        obj_dict = self._store.get(obj_id)
+        obj_dict, version = self._store.get_with_version(obj_id)
         if obj_dict is None:
             return None
-        return self.unmarshall(obj_dict)
+        obj = self.unmarshall(self.decode(obj_dict))
+        if self.versioned:
+            obj.version = version
+        return obj
 
     def list(
             self,
@@ -86,7 +171,7 @@ class ObjectStoreTypeStore(TypeStore):
         for _, obj_dict in self._store.list_sorted(order_by=order_by,
                                                    order_desc=order_desc,
                                                    order_alpha=order_alpha):
-            obj = self.unmarshall(obj_dict)
+            obj = self.unmarshall(self.decode(obj_dict))
             if matches_filters(obj, filters):
                 count += 1
                 if limit and count == limit:
@@ -25,10 +25,12 @@ from .metadataController import MetadataController
 from .networkController import NetworkController
 from .nodeController import NodeController
 from .parameterController import ParameterController
+from .redisController import RedisController
 from .registry import get_all_ws_controllers, register_ws_controller
 from .resourceAdapterConfigurationController import \
     ResourceAdapterConfigurationController
 from .softwareProfileController import SoftwareProfileController
+from .syncController import SyncController
 
 
 #
@@ -42,9 +44,11 @@ register_ws_controller(KitController)
 register_ws_controller(NetworkController)
 register_ws_controller(NodeController)
 register_ws_controller(ParameterController)
+register_ws_controller(RedisController)
 register_ws_controller(ResourceAdapterConfigurationController)
 register_ws_controller(SoftwareProfileController)
 register_ws_controller(MetadataController)
+register_ws_controller(SyncController)
 
 
 def setup_routes():
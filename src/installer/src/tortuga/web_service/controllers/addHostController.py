@@ -137,17 +137,20 @@ class AddHostController(TortugaController):
     def getStatus(self, session, **kwargs):
         '''
         Call the addHost manager directly
+
+        Status messages can be tailed incrementally by passing the number
+        of messages already received in 'since' (or 'startMessage').
         '''
 
-        startMessage = int(kwargs['startMessage']) \
-            if 'startMessage' in kwargs else 0
+        startMessage = int(kwargs.get('since', kwargs.get('startMessage', 0)))
 
         getNodes = kwargs['getNodes'].lower().startswith('t') \
             if 'getNodes' in kwargs else False
 
         try:
             status = AddHostManager().getStatus(
-                cherrypy.request.db, session, int(startMessage), getNodes)
+                cherrypy.request.db, session, since=startMessage,
+                getNodes=getNodes)
 
             response = {'addhoststatus': status.getCleanDict()}
         except NotFound as ex:
@@ -14,6 +14,7 @@
 
 import cherrypy
 from tortuga.db.instanceMetadataDbHandler import InstanceMetadataDbHandler
+from tortuga.exceptions.invalidArgument import InvalidArgument
 from tortuga.schema import InstanceMetadataSchema
 from tortuga.web_service.auth.decorators import authentication_required
 
@@ -33,6 +34,12 @@ class MetadataController(TortugaController):
             'action': 'list',
             'method': ['GET'],
         },
+        {
+            'name': 'upsertMetadata',
+            'path': '/v1/metadata/',
+            'action': 'upsert',
+            'method': ['POST'],
+        },
         {
             'name': 'deleteMetadata',
             'path': '/v1/metadata/',
@@ -45,11 +52,17 @@ class MetadataController(TortugaController):
     @authentication_required()
     def list(self, **kwargs):
         try:
+            limit = kwargs.get('limit')
+            cursor = kwargs.get('cursor')
+
             response = InstanceMetadataSchema().dump(
                 instanceMetadataDbHandler.list(
                     cherrypy.request.db,
                     filter_key=kwargs.get('filter_key'),
                     filter_value=kwargs.get('filter_value'),
+                    filter_key_prefix=kwargs.get('filter_key_prefix'),
+                    limit=int(limit) if limit is not None else None,
+                    cursor=int(cursor) if cursor is not None else None,
                 ),
                 many=True,
             ).data
@@ -62,6 +75,29 @@ class MetadataController(TortugaController):
 
         return self.formatResponse(response)
 
+    @cherrypy.tools.json_out()
+    @cherrypy.tools.json_in()
+    @authentication_required()
+    def upsert(self):
+        try:
+            metadata = cherrypy.request.json.get('metadata')
+            if not isinstance(metadata, list):
+                raise InvalidArgument('Malformed request')
+
+            instanceMetadataDbHandler.upsert(cherrypy.request.db, metadata)
+
+            cherrypy.request.db.commit()
+
+            response = None
+        except Exception as exc:
+            self.getLogger().exception('metadata POST exception')
+
+            self.handleException(exc)
+
+            response = self.errorResponse(str(exc))
+
+        return self.formatResponse(response)
+
     @cherrypy.tools.json_out()
     @authentication_required()
     def delete(self, **kwargs):
@@ -70,6 +106,7 @@ class MetadataController(TortugaController):
                 cherrypy.request.db,
                 filter_key=kwargs.get('filter_key'),
                 filter_value=kwargs.get('filter_value'),
+                filter_key_prefix=kwargs.get('filter_key_prefix'),
             )
 
             # commit delete request
@@ -14,6 +14,8 @@
 
 # pylint: disable=no-member
 
+from typing import Optional
+
 from marshmallow import Schema, ValidationError, fields, validates
 
 import cherrypy
@@ -26,6 +28,8 @@ from tortuga.objects.tortugaObject import TortugaObjectList
 from tortuga.schema import NodeSchema
 from tortuga.utility.helper import str2bool
 from tortuga.web_service.auth.decorators import authentication_required
+from tortuga.web_service.streaming import JsonLinesResponse, \
+    accepts_json_lines, json_stream_handler
 
 from .common import make_options_from_query_string, parse_tag_query_string
 from .tortugaController import TortugaController
@@ -106,12 +110,15 @@ class NodeController(TortugaController):
         },
     ]
 
-    @cherrypy.tools.json_out()
+    @cherrypy.tools.json_out(handler=json_stream_handler)
     @authentication_required()
     def getNodes(self, **kwargs):
         """
         Return list of all available nodes
 
+        The list is streamed as newline-delimited JSON, one node per line,
+        if requested by the client (Accept: application/x-ndjson).
+
         """
 
         tagspec = []
@@ -125,7 +132,28 @@ class NodeController(TortugaController):
                 if 'include' in kwargs else None,
                 ['softwareprofile', 'hardwareprofile'])
 
-            if 'addHostSession' in kwargs and kwargs['addHostSession']:
+            filters = make_node_filters_from_query_string(kwargs)
+
+            schema = make_node_schema(kwargs.get('fields'))
+
+            #
+            # Streamed node lists are loaded from the database in batches,
+            # as they are sent to the client
+            #
+            stream = accepts_json_lines()
+
+            get_node_list = self.app.node_api.iterNodeList \
+                if stream else self.app.node_api.getNodeList
+
+            if filters:
+                # Any combination of filters; a name is treated as a
+                # nodespec
+                if kwargs.get('name'):
+                    filters['nodespec'] = kwargs['name']
+
+                nodeList = get_node_list(
+                    cherrypy.request.db, tags=tagspec, **filters)
+            elif 'addHostSession' in kwargs and kwargs['addHostSession']:
                 nodeList = self.app.node_api.getNodesByAddHostSession(
                     cherrypy.request.db, kwargs['addHostSession'], options)
             elif 'name' in kwargs and kwargs['name']:
@@ -140,12 +168,15 @@ class NodeController(TortugaController):
                     [self.app.node_api.getNodeByIp(
                         cherrypy.request.db, kwargs['ip'])])
             else:
-                nodeList = self.app.node_api.getNodeList(
-                    cherrypy.request.db, tags=tagspec)
+                nodeList = get_node_list(cherrypy.request.db, tags=tagspec)
 
-            response = {
-                'nodes': NodeSchema().dump(nodeList, many=True).data
-            }
+            if stream:
+                response = JsonLinesResponse(
+                    nodeList, lambda node: schema.dump(node).data)
+            else:
+                response = {
+                    'nodes': schema.dump(nodeList, many=True).data
+                }
         except Exception as ex:  # noqa pylint: disable=broad-except
             self._logger.exception('node WS API getNodes() failed')
             self.handleException(ex)
@@ -429,3 +460,53 @@ class NodeController(TortugaController):
             response = self.errorResponse(str(ex))
 
         return self.formatResponse(response)
+
+
+def make_node_filters_from_query_string(query: dict) -> dict:
+    """
+    Return node list filters (see NodesDbHandler.getNodeList()) from the
+    'nodespec', 'state', 'exclude_state', 'softwareprofile' and
+    'hardwareprofile' query string parameters. Multiple states may be
+    comma-separated.
+    """
+
+    filters = {}
+
+    if query.get('nodespec'):
+        filters['nodespec'] = query['nodespec']
+
+    if query.get('state'):
+        filters['states'] = query['state'].split(',')
+
+    if query.get('exclude_state'):
+        filters['exclude_states'] = query['exclude_state'].split(',')
+
+    if query.get('softwareprofile'):
+        filters['softwareProfile'] = query['softwareprofile']
+
+    if query.get('hardwareprofile'):
+        filters['hardwareProfile'] = query['hardwareprofile']
+
+    return filters
+
+
+def make_node_schema(fields_: Optional[str]) -> NodeSchema:
+    """
+    Return NodeSchema limited to the comma-separated list of fields, if
+    any. Nested fields are specified using dot notation, ie.
+    "softwareprofile.name".
+
+    Raises:
+        InvalidArgument
+    """
+
+    if not fields_:
+        return NodeSchema()
+
+    only = fields_.split(',')
+
+    for field in only:
+        if field.split('.', 1)[0] not in NodeSchema().fields:
+            raise InvalidArgument('Invalid node field: {}'.format(field))
+
+    return NodeSchema(only=only)
@@ -0,0 +1,51 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cherrypy
+
+from tortuga.redis import RedisClientManager
+from tortuga.web_service.auth.decorators import authentication_required
+from .tortugaController import TortugaController
+
+
+class RedisController(TortugaController):
+    """
+    Redis connection monitoring controller class.
+
+    """
+    actions = [
+        {
+            'name': 'getRedisPoolStats',
+            'path': '/v1/redis/pool',
+            'action': 'getPoolStats',
+            'method': ['GET']
+        },
+    ]
+
+    @cherrypy.tools.json_out()
+    @authentication_required()
+    def getPoolStats(self):
+        """
+        Return the Redis connection pool statistics for the web service
+        process.
+
+        """
+        try:
+            response = RedisClientManager.get_stats()
+        except Exception as ex:  # pylint: disable=broad-except
+            self._logger.error(str(ex))
+            self.handleException(ex)
+            response = self.errorResponse(str(ex))
+
+        return self.formatResponse(response)
@@ -14,7 +14,7 @@
 
 import logging
 import traceback
-from typing import Any, List
+from typing import Any, Iterator, List, Union
 
 import cherrypy
 
@@ -22,6 +22,8 @@ from tortuga.logging import WEBSERVICE_NAMESPACE
 from tortuga.types.base import BaseType
 from tortuga.typestore.base import TypeStore
 from tortuga.web_service.auth.decorators import authentication_required
+from tortuga.web_service.streaming import JsonLinesResponse, \
+    accepts_json_lines, json_stream_handler
 
 
 HTTP_STATUS_NO_CONTENT = 204
@@ -164,21 +166,39 @@ class Controller(object):
         unmarshalled = schema_class().load(obj_dict)
         return self.type_store.type_class(**unmarshalled.data)
 
+    def list_objects(self, params: dict) -> Iterator[BaseType]:
+        """
+        Gets the objects to list.
+
+        :param dict params: the parameters, as returned by build_params
+
+        :return Iterator[BaseType]: an iterator of objects
+
+        """
+        return self.type_store.list(**params)
+
     @authentication_required()
-    @cherrypy.tools.json_out()
-    def list(self, **query) -> List[dict]:
+    @cherrypy.tools.json_out(handler=json_stream_handler)
+    def list(self, **query) -> Union[List[dict], JsonLinesResponse]:
         """
-        Gets a list of objects from the configured object store.
+        Gets a list of objects from the configured object store. The list
+        is streamed as newline-delimited JSON, one object per line, if
+        requested by the client (Accept: application/x-ndjson).
 
         :param query: query parameters
 
-        :return List[dict]: a list of objects, in dict form
+        :return Union[List[dict], JsonLinesResponse]: a list of objects, in
+                                                      dict form
 
         """
         try:
             params = self.build_params(query)
+            if accepts_json_lines():
+                return JsonLinesResponse(self.list_objects(params),
+                                         self.marshall)
+
             response = []
-            for obj in self.type_store.list(**params):
+            for obj in self.list_objects(params):
                 response.append(self.marshall(obj))
 
         except Exception as ex:
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tortuga.events.manager import EventStoreManager
+from typing import Iterator
+
+from tortuga.events.manager import EventStoreManager, PubSubManager
 from tortuga.events.types.base import BaseEvent
 from tortuga.events.types import get_event_class
 from .base import Controller
@@ -33,6 +35,17 @@ class EventController(Controller):
         # to lookup the class type before unmarshalling
         #
         event_class = get_event_class(obj_dict['name'])
-        scheam_class = event_class.get_schema_class()
-        unmarshalled = scheam_class().load(obj_dict)
+        unmarshalled = event_class.get_schema().load(obj_dict)
         return event_class(**unmarshalled.data)
+
+    def list_objects(self, params: dict) -> Iterator[BaseEvent]:
+        #
+        # If since is provided, only the events published after the event
+        # with that stream id are listed, in the order they were published
+        #
+        since = params.pop('since', None)
+        if since:
+            return PubSubManager.get().replay(since,
+                                              limit=params.get('limit'))
+
+        return super().list_objects(params)
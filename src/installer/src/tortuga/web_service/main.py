@@ -85,6 +85,14 @@ def prepare_server():
     config = {
         '/': {
             'tools.db.on': True,
+            #
+            # Compress responses for clients that accept it, the JSON
+            # responses of list requests compress very well
+            #
+            'tools.gzip.on': True,
+            'tools.gzip.mime_types': [
+                'application/json', 'application/x-ndjson', 'text/*'
+            ],
             'response.headers.server': 'Tortuga web service',
             'request.dispatch': rootRouteMapper.setupRoutes(),
         },
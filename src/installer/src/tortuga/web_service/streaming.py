@@ -0,0 +1,118 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+from typing import Any, Callable, Iterable, Iterator
+
+import cherrypy
+from cherrypy.lib import jsontools
+
+from tortuga.logging import WEBSERVICE_NAMESPACE
+
+
+logger = logging.getLogger(WEBSERVICE_NAMESPACE)
+
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+class JsonLinesResponse:
+    """
+    A list response that is streamed to the client as newline-delimited
+    JSON (one object per line), marshalling each object as it is
+    iterated.
+
+    """
+    #
+    # Lines are sent to the client in chunks of (at least) this many bytes
+    #
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(self, objs: Iterable[Any],
+                 marshall: Callable[[Any], dict]) -> None:
+        """
+        Initializer.
+
+        :param Iterable[Any] objs: the objects to stream
+        :param Callable marshall:  marshalls an object into a dict
+
+        """
+        self._objs = objs
+        self._marshall = marshall
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunk = []
+        chunk_size = 0
+
+        try:
+            for obj in self._objs:
+                line = json.dumps(self._marshall(obj)).encode('utf-8') + \
+                    b'\n'
+                chunk.append(line)
+                chunk_size += len(line)
+
+                if chunk_size >= self.CHUNK_SIZE:
+                    yield b''.join(chunk)
+                    chunk = []
+                    chunk_size = 0
+
+        except Exception as ex:  # pylint: disable=broad-except
+            #
+            # The response status has already been sent, so the error is
+            # reported to the client as the last line of the response
+            #
+            logger.exception('Error streaming response')
+
+            chunk.append(json.dumps({
+                'error': {
+                    'message': str(ex),
+                }
+            }).encode('utf-8') + b'\n')
+
+        if chunk:
+            yield b''.join(chunk)
+
+
+def accepts_json_lines() -> bool:
+    """
+    Returns True if the client requested a newline-delimited JSON
+    (streamed) response.
+
+    """
+    return any(
+        accept.value == NDJSON_CONTENT_TYPE
+        for accept in cherrypy.request.headers.elements('Accept')
+    )
+
+
+def json_stream_handler(*args, **kwargs):
+    """
+    A handler for the cherrypy json_out tool that streams
+    JsonLinesResponse responses, and JSON encodes any other response.
+
+    Usage: @cherrypy.tools.json_out(handler=json_stream_handler)
+
+    """
+    # pylint: disable=protected-access
+    value = cherrypy.serving.request._json_inner_handler(*args, **kwargs)
+
+    if isinstance(value, JsonLinesResponse):
+        cherrypy.serving.response.headers['Content-Type'] = \
+            NDJSON_CONTENT_TYPE
+        cherrypy.serving.response.stream = True
+
+        return iter(value)
+
+    return jsontools.json.encode(value)
@@ -26,9 +26,22 @@ class DatabaseTool(cherrypy.Tool):
     def _setup(self):
         super(DatabaseTool, self)._setup()
         cherrypy.request.hooks.attach('on_end_resource',
-                                      self.commit_transaction,
+                                      self.end_resource,
                                       priority=80)
 
+    def end_resource(self):
+        if cherrypy.response.stream:
+            #
+            # Streamed response bodies are generated (from the session)
+            # after the handler returns, so the transaction is kept open
+            # until the response has been sent
+            #
+            cherrypy.request.hooks.attach('on_end_request',
+                                          self.commit_transaction,
+                                          priority=80)
+        else:
+            self.commit_transaction()
+
     def bind_session(self):
         cherrypy.engine.publish('bind', self.session)
         cherrypy.request.db = self.session
@@ -187,6 +187,30 @@ class AuthenticateAction(BaseAction):
             self._state.enqueue_message(AuthenticationFailedMessage())
 
 
+class SubscribeActionSchema(BaseActionSchema):
+    """
+    Schema for the subscribe action.
+
+    """
+    #
+    # Resume the subscription after the event with this stream id, i.e.
+    # the stream_id of the last event received before a reconnect
+    #
+    since = fields.String()
+
+    #
+    # Only send events with this name, may be a glob-style pattern, i.e.
+    # 'node-*'
+    #
+    event_name = fields.String()
+
+    #
+    # Only send events matching these attribute filters, using the same
+    # syntax as list filters, i.e. {"node__state": "Installed"}
+    #
+    filters = fields.Dict()
+
+
 class SubscribeAction(BaseAction):
     """
     The subscribe action. The purpose of this action is to subscribe
@@ -194,7 +218,23 @@ class SubscribeAction(BaseAction):
 
     """
     action = 'subscribe'
-    schema_class = BaseActionSchema
+    schema_class = SubscribeActionSchema
+
+    def __init__(self, state: State, since: str = None,
+                 event_name: str = None, filters: dict = None):
+        """
+        Initializer.
+
+        :param State state:    the current websocket state instance
+        :param str since:      the stream id to resume the subscription after
+        :param str event_name: the event name (or pattern) to subscribe to
+        :param dict filters:   the event attribute filters
+
+        """
+        super().__init__(state)
+        self.since = since
+        self.event_name = event_name
+        self.filters = filters
 
     def do(self):
         """
@@ -211,8 +251,14 @@ class SubscribeAction(BaseAction):
         # Don't re-subscribe if they are already subscribed
         #
         if not self._state.pubsub:
-            self._state.pubsub = PubSubManager.get()
-            self._state.pubsub.subscribe()
+            #
+            # Invalid filters are reported back to the client as an error
+            # message, before subscribing
+            #
+            self._state.set_event_filters(self.filters)
+            pubsub = PubSubManager.get()
+            pubsub.subscribe(event_name=self.event_name, since=self.since)
+            self._state.pubsub = pubsub
 
         #
         # Enqueue a subscription success message
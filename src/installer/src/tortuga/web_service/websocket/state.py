@@ -12,14 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Union, Optional
+from typing import Any, Deque, Dict, List, Union, Optional
 
 from tortuga.events.types import BaseEvent
+from tortuga.events.exceptions import UnresolvableEventError
 from tortuga.events.pubsub import EventPubSub
+from tortuga.logging import WEBSERVICE_NAMESPACE
+from tortuga.objectstore.base import CompiledFilter, compile_filters, \
+    matches_compiled_filters
 from .messages import BaseMessage
 
 
+logger = logging.getLogger(WEBSERVICE_NAMESPACE)
+
+#
+# The types of values that event filters can compare against
+#
+FILTER_VALUE_TYPES = (str, int, float, bool)
+
+
 class State:
     """
     The class that represents the current state for a websocket session.
@@ -42,8 +56,9 @@ class State:
         #
         # Message queue state
         #
-        self._message_queue: List[Union[BaseMessage, BaseEvent]] = []
+        self._message_queue: Deque[Union[BaseMessage, BaseEvent]] = deque()
         self.pubsub: EventPubSub = None
+        self._event_filters: List[CompiledFilter] = []
 
         #
         # Websocket state
@@ -86,7 +101,58 @@ class State:
         :param Union[BaseMessage, BaseEvent] msg: the message to send
 
         """
-        self._message_queue.insert(0, msg)
+        self._message_queue.append(msg)
+
+    def set_event_filters(self, filters: Optional[Dict[str, Any]] = None):
+        """
+        Sets the filters that events must match to be sent to the websocket
+        client. The filters use the same syntax as
+        tortuga.objectstore.base.matches_filters, and are compiled once
+        here rather than for every event.
+
+        :param Optional[Dict[str, Any]] filters: the event attribute filters
+
+        :raises ValueError: if a filter is invalid
+
+        """
+        filters = filters or {}
+
+        for key, value in filters.items():
+            if not key or not isinstance(value, FILTER_VALUE_TYPES):
+                raise ValueError(
+                    'Invalid event filter: {}={!r}'.format(key, value))
+
+        self._event_filters = compile_filters(filters)
+
+    def _next_event(self) -> Optional[BaseEvent]:
+        """
+        Gets the next event from the pubsub that matches the event filters.
+
+        :return Optional[BaseEvent]: the next matching event if any, None
+                                     otherwise
+
+        """
+        while True:
+            try:
+                event = self.pubsub.get_message()
+            except UnresolvableEventError as ex:
+                logger.debug('Skipping event: %s', ex)
+                continue
+
+            if event is None:
+                return None
+
+            #
+            # A filter value that can't be compared with the event
+            # attribute, i.e. {"integer__gt": "abc"}, doesn't match, rather
+            # than ending the websocket session
+            #
+            try:
+                if matches_compiled_filters(event, self._event_filters):
+                    return event
+            except (ValueError, TypeError) as ex:
+                logger.debug('Event %s does not match filters: %s',
+                             event.id, ex)
 
     def next_message(self) -> Optional[Union[BaseMessage, BaseEvent]]:
         """
@@ -99,13 +165,13 @@ class State:
         # Queued messages take priority over pubsub messages
         #
         if self._message_queue:
-            return self._message_queue.pop()
+            return self._message_queue.popleft()
 
         #
         # If there are no queued messages, check for pubsub messages
         #
         if self.authenticated and self.pubsub:
-            return self.pubsub.get_message()
+            return self._next_event()
 
         return None
 
@@ -121,8 +187,9 @@ class State:
         if self.pubsub:
             self.pubsub.unsubscribe()
         self.pubsub = None
+        self._event_filters = []
 
         #
         # Clear out the message queue
         #
-        self._message_queue = []
+        self._message_queue.clear()
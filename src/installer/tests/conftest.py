@@ -14,7 +14,7 @@
 
 import pytest
 from passlib.hash import pbkdf2_sha256
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 
 import tortuga.db.dbManager
 from tortuga.config.configManager import ConfigManager, getfqdn
@@ -39,7 +39,7 @@ from tortuga.db.models.softwareProfile import SoftwareProfile
 from tortuga.db.models.softwareProfileTag import SoftwareProfileTag
 from tortuga.deployer.dbUtility import init_global_parameters, primeDb
 from tortuga.objects import osFamilyInfo, osInfo
-from tortuga.objectstore import manager as objectstore_manager
+from tortuga.redis import manager as redis_manager
 from .mocks.redis import MockRedis
 
 
@@ -50,7 +50,7 @@ def disable_DbManager(monkeypatch, dbm):
 
 @pytest.fixture(autouse=True)
 def mock_redis(monkeypatch):
-    monkeypatch.setattr(objectstore_manager, 'Redis', MockRedis)
+    monkeypatch.setattr(redis_manager, 'Redis', MockRedis)
 
 
 @pytest.fixture()
@@ -70,6 +70,33 @@ def celery_app(monkeypatch, dbm):
     return app
 
 
+@pytest.fixture()
+def queries_during_stream(dbm):
+    """
+    Records the queries run on a connection after a streamed (server-side
+    cursor) query has been started on it. On MySQL, running another query
+    discards the rest of the streamed result, which SQLite doesn't, so the
+    problem is detected here rather than by comparing results.
+
+    """
+    streaming_connections = set()
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        if conn.connection in streaming_connections:
+            queries.append(statement)
+
+        if context.execution_options.get('stream_results'):
+            streaming_connections.add(conn.connection)
+
+    event.listen(dbm.engine, 'before_cursor_execute', before_cursor_execute)
+
+    yield queries
+
+    event.remove(dbm.engine, 'before_cursor_execute', before_cursor_execute)
+
+
 @pytest.fixture(scope='session')
 def cm():
     return ConfigManager()
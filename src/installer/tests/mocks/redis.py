@@ -13,9 +13,12 @@
 # limitations under the License.
 
 import fnmatch
-from typing import Dict, List, Union
+import time
+from typing import Dict, Iterator, List, Optional, Union
 import re
 
+from redis.exceptions import ResponseError
+
 
 class MockRedis:
     def __init__(self, *args, **kwargs):
@@ -39,11 +42,25 @@ class MockRedis:
     def expire(self, key: str, timeout: int):
         pass
 
+    def ttl(self, key: str) -> Optional[int]:
+        #
+        # Keys never expire, see expire()
+        #
+        return None
+
     def hmset(self, key: str, value: dict):
         bkey = key.encode()
 
         self._data_store[bkey] = value
 
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        bkey = key.encode()
+
+        hsh = self._data_store.setdefault(bkey, {})
+        hsh[field] = int(hsh.get(field, 0)) + amount
+
+        return hsh[field]
+
     def hgetall(self, key: str) -> dict:
         bkey = key.encode()
 
@@ -71,12 +88,151 @@ class MockRedis:
         for pubsub in self._pubsubs:
             pubsub._new_message(bchannel, bvalue)
 
+    def execute_command(self, *args):
+        handler = getattr(self, '_{}'.format(args[0].lower()), None)
+        if handler is None:
+            raise Exception('Mock does not support: {}'.format(args[0]))
+
+        return handler(*args[1:])
+
+    #
+    # Streams
+    #
+    @staticmethod
+    def _parse_stream_id(stream_id: Union[bytes, str]) -> tuple:
+        if isinstance(stream_id, bytes):
+            stream_id = stream_id.decode()
+        ms, _, seq = stream_id.partition('-')
+        return int(ms), int(seq or 0)
+
+    def _get_stream(self, key: str) -> dict:
+        return self._data_store.setdefault(key.encode(), {
+            'entries': [],
+            'groups': {},
+        })
+
+    def _entries_after(self, stream: dict, stream_id: str) -> list:
+        after = self._parse_stream_id(stream_id)
+        return [entry for entry in stream['entries']
+                if self._parse_stream_id(entry[0]) > after]
+
+    def _xadd(self, key: str, *args) -> bytes:
+        args = list(args)
+        maxlen = None
+        if args[0] == 'MAXLEN':
+            maxlen = int(args[2])
+            args = args[3:]
+        args = args[1:]
+
+        stream = self._get_stream(key)
+        ms = int(time.time() * 1000)
+        seq = 0
+        if stream['entries']:
+            last_ms, last_seq = self._parse_stream_id(
+                stream['entries'][-1][0])
+            if last_ms >= ms:
+                ms, seq = last_ms, last_seq + 1
+        stream_id = '{}-{}'.format(ms, seq).encode()
+        stream['entries'].append(
+            (stream_id, [str(arg).encode() for arg in args])
+        )
+        if maxlen is not None:
+            stream['entries'] = stream['entries'][-maxlen:]
+
+        return stream_id
+
+    def _xrevrange(self, key: str, end: str, start: str, _count: str,
+                   count: int) -> list:
+        stream = self._get_stream(key)
+
+        return [list(entry) for entry in
+                reversed(stream['entries'])][:int(count)]
+
+    def _xread(self, _count: str, count: int, _streams: str, key: str,
+               stream_id: str) -> Optional[list]:
+        stream = self._get_stream(key)
+        entries = self._entries_after(stream, stream_id)[:int(count)]
+        if not entries:
+            return None
+
+        return [[key.encode(), [list(entry) for entry in entries]]]
+
+    def _xgroup(self, _create: str, key: str, group: str, stream_id: str,
+                *args):
+        stream = self._get_stream(key)
+        if group in stream['groups']:
+            raise ResponseError(
+                'BUSYGROUP Consumer Group name already exists')
+        if stream_id == '$':
+            stream_id = stream['entries'][-1][0] if stream['entries'] \
+                else '0'
+        stream['groups'][group] = {
+            'last_id': stream_id,
+            'pending': {},
+        }
+
+    def _xreadgroup(self, _group: str, group: str, consumer: str,
+                    _count: str, count: int, _streams: str, key: str,
+                    stream_id: str) -> Optional[list]:
+        stream = self._get_stream(key)
+        group = stream['groups'][group]
+        pending = group['pending'].setdefault(consumer, [])
+
+        if stream_id == '>':
+            entries = self._entries_after(
+                stream, group['last_id'])[:int(count)]
+            if entries:
+                group['last_id'] = entries[-1][0]
+                pending.extend(entry[0] for entry in entries)
+        else:
+            after = self._parse_stream_id(stream_id)
+            entries = [entry for entry in stream['entries']
+                       if entry[0] in pending and
+                       self._parse_stream_id(entry[0]) > after][:int(count)]
+
+        if not entries:
+            return None
+
+        return [[key.encode(), [list(entry) for entry in entries]]]
+
+    def _xack(self, key: str, group: str, *stream_ids: str) -> int:
+        stream = self._get_stream(key)
+        count = 0
+        for pending in stream['groups'][group]['pending'].values():
+            for stream_id in stream_ids:
+                if stream_id.encode() in pending:
+                    pending.remove(stream_id.encode())
+                    count += 1
+
+        return count
+
+    def pipeline(self, transaction: bool = True) -> 'Pipeline':
+        return Pipeline(self)
+
     def pubsub(self) -> 'PubSub':
         p = PubSub(self)
         self._pubsubs.append(p)
 
         return p
 
+    def rpush(self, key: str, *values: str) -> int:
+        bkey = key.encode()
+
+        list_ = self._data_store.get(bkey, [])
+        list_.extend(value.encode() for value in values)
+        self._data_store[bkey] = list_
+
+        return len(list_)
+
+    def lrange(self, key: str, start: int, end: int) -> List[bytes]:
+        bkey = key.encode()
+
+        list_ = self._data_store.get(bkey, [])
+        if end == -1:
+            return list_[start:]
+
+        return list_[start:end + 1]
+
     def sadd(self, key: str, value: str):
         bkey = key.encode()
 
@@ -99,9 +255,43 @@ class MockRedis:
 
         return self._data_store.get(bkey, [])
 
+    def scan_iter(self, match: str = '*') -> Iterator[bytes]:
+        yield from self.keys(match)
+
+    def zadd(self, key: str, **members: float):
+        bkey = key.encode()
+
+        zset = self._data_store.get(bkey, {})
+        for member, score in members.items():
+            zset[member.encode()] = float(score)
+        self._data_store[bkey] = zset
+
+    def zrem(self, key: str, *members: str):
+        bkey = key.encode()
+
+        zset = self._data_store.get(bkey, {})
+        for member in members:
+            zset.pop(member.encode(), None)
+
+    def zrangebyscore(self, key: str, min: Union[float, str],
+                      max: Union[float, str]) -> List[bytes]:
+        bkey = key.encode()
+
+        zset = self._data_store.get(bkey, {})
+        return [member for member, score in
+                sorted(zset.items(), key=lambda item: item[1])
+                if float(min) <= score <= float(max)]
+
+    def zremrangebyscore(self, key: str, min: Union[float, str],
+                         max: Union[float, str]) -> int:
+        members = self.zrangebyscore(key, min, max)
+        self.zrem(key, *[member.decode() for member in members])
+
+        return len(members)
+
     def sort(self, key: str, by: str = None, desc: bool = False,
              alpha: bool = False) -> List[bytes]:
-        result = self.smembers(key)
+        result = list(self.smembers(key))
 
         sort_key = None
         if by:
@@ -119,6 +309,51 @@ class MockRedis:
         return result
 
 
+class Pipeline:
+    """
+    A pipeline that buffers commands until execute() is called. After
+    watch(), commands execute immediately until multi() is called. There
+    are no concurrent clients, so watched keys never change.
+
+    """
+    def __init__(self, redis_client: MockRedis):
+        self._redis: MockRedis = redis_client
+        self._commands: Optional[List[tuple]] = []
+
+    def __enter__(self) -> 'Pipeline':
+        return self
+
+    def __exit__(self, *args):
+        self.reset()
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, name)
+        if self._commands is None:
+            return command
+
+        def buffered(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return buffered
+
+    def watch(self, *keys: str):
+        self._commands = None
+
+    def multi(self):
+        self._commands = []
+
+    def execute(self) -> list:
+        results = [command(*args, **kwargs)
+                   for command, args, kwargs in self._commands or []]
+        self.reset()
+
+        return results
+
+    def reset(self):
+        self._commands = []
+
+
 class PubSub:
     def __init__(self, redis_client: MockRedis):
         self._redis: MockRedis = redis_client
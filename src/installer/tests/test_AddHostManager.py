@@ -0,0 +1,60 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tortuga.addhost.addHostManager import AddHostManager
+from tortuga.exceptions.notFound import NotFound
+
+
+def test_get_status_since(dbm):
+    ahm = AddHostManager()
+
+    session_id = ahm.createNewSession()
+
+    for idx in range(5):
+        ahm.updateStatus(session_id, 'message {}'.format(idx))
+
+    with dbm.session() as session:
+        status = ahm.getStatus(session, session_id)
+        assert status.getMessageList() == [
+            'message {}'.format(idx) for idx in range(5)
+        ]
+
+        #
+        # Tail the log from the last offset
+        #
+        ahm.updateStatus(session_id, 'message 5')
+
+        status = ahm.getStatus(session, session_id, since=5)
+        assert status.getMessageList() == ['message 5']
+
+
+def test_update_session_running(dbm):
+    ahm = AddHostManager()
+
+    session_id = ahm.createNewSession()
+
+    with dbm.session() as session:
+        ahm.update_session(session_id, running=True)
+        assert ahm.getStatus(session, session_id).getIsRunning()
+
+        ahm.update_session(session_id, running=False)
+        assert not ahm.getStatus(session, session_id).getIsRunning()
+
+
+def test_get_status_invalid_session(dbm):
+    with dbm.session() as session:
+        with pytest.raises(NotFound):
+            AddHostManager().getStatus(session, 'does-not-exist')
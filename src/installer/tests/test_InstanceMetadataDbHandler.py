@@ -0,0 +1,104 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tortuga.db.instanceMetadataDbHandler import InstanceMetadataDbHandler
+from tortuga.db.models.instanceMapping import InstanceMapping
+from tortuga.exceptions.invalidArgument import InvalidArgument
+
+
+@pytest.fixture()
+def session(dbm):
+    session = dbm.openSession()
+
+    instances = [
+        InstanceMapping(instance='i-metadata-1'),
+        InstanceMapping(instance='i-metadata-2'),
+    ]
+    session.add_all(instances)
+    session.commit()
+
+    yield session
+
+    for instance in instances:
+        session.delete(instance)
+    session.commit()
+
+    dbm.closeSession()
+
+
+def test_upsert(session):
+    handler = InstanceMetadataDbHandler()
+
+    handler.upsert(session, [
+        {'instance': 'i-metadata-1', 'key': 'app:role', 'value': 'web'},
+        {'instance': 'i-metadata-2', 'key': 'app:role', 'value': 'db'},
+        {'instance': 'i-metadata-2', 'key': 'owner', 'value': 'ops'},
+    ])
+    session.commit()
+
+    #
+    # Upserting an existing key updates it in place
+    #
+    handler.upsert(session, [
+        {'instance': 'i-metadata-1', 'key': 'app:role', 'value': 'worker'},
+    ])
+    session.commit()
+
+    result = {
+        (md.instance.instance, md.key): md.value
+        for md in handler.list(session, filter_key_prefix='app:')
+    }
+    assert result == {
+        ('i-metadata-1', 'app:role'): 'worker',
+        ('i-metadata-2', 'app:role'): 'db',
+    }
+
+    with pytest.raises(InvalidArgument):
+        handler.upsert(session, [
+            {'instance': 'i-unknown', 'key': 'owner', 'value': 'ops'},
+        ])
+
+
+def test_list_pagination(session):
+    handler = InstanceMetadataDbHandler()
+
+    handler.upsert(session, [
+        {'instance': 'i-metadata-1', 'key': 'key{}'.format(n), 'value': 'x'}
+        for n in range(5)
+    ])
+    session.commit()
+
+    keys = []
+    cursor = None
+    while True:
+        page = handler.list(session, filter_value='x', limit=2,
+                            cursor=cursor)
+        if not page:
+            break
+        assert len(page) <= 2
+        keys.extend(md.key for md in page)
+        cursor = page[-1].id
+
+    assert keys == ['key{}'.format(n) for n in range(5)]
+
+    #
+    # Wildcards in the prefix are matched literally
+    #
+    assert handler.list(session, filter_key_prefix='key_') == []
+
+    handler.delete(session, filter_key_prefix='key')
+    session.commit()
+    assert handler.list(session, filter_value='x') == []
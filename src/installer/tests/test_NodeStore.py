@@ -0,0 +1,43 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tortuga.db.models.node import Node as DbNode
+from tortuga.node.store import SqlalchemySessionNodeStore
+
+
+def test_list(dbm, monkeypatch, queries_during_stream):
+    monkeypatch.setattr(SqlalchemySessionNodeStore, 'BATCH_SIZE', 2)
+
+    store = SqlalchemySessionNodeStore(dbm)
+
+    with dbm.session() as session:
+        expected = {
+            str(db_node.id): (db_node.name,
+                              {tag.name: tag.value for tag in db_node.tags})
+            for db_node in session.query(DbNode)
+        }
+
+    #
+    # All nodes are listed, with their tags, across several batches
+    #
+    nodes = list(store.list())
+    assert {node.id: (node.name, node.tags) for node in nodes} == expected
+
+    names = [node.name for node in store.list(order_by='name',
+                                              order_desc=True)]
+    assert names == sorted(names, reverse=True)
+
+    assert len(list(store.list(limit=3))) == 3
+
+    assert not queries_during_stream
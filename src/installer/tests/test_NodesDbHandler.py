@@ -236,6 +236,61 @@ def test_getNodesByNameFilter_default(dbm):
             installer in [node.name for node in result]
 
 
+def test_getNodeList_filters(dbm):
+    with dbm.session() as session:
+        handler = NodesDbHandler()
+
+        result = handler.getNodeList(
+            session,
+            nodespec='compute-0*',
+            states=['Installed'],
+            softwareProfile='compute',
+            hardwareProfile='localiron',
+        )
+        assert [node.name for node in result] == \
+            ['compute-{:02d}.private'.format(n) for n in range(1, 10)]
+
+        #
+        # Filters are combined with tags
+        #
+        result = handler.getNodeList(
+            session,
+            tags={'tag1': None},
+            nodespec='compute-02,compute-03,compute-05',
+        )
+        assert [node.name for node in result] == \
+            ['compute-02.private', 'compute-03.private']
+
+        assert not handler.getNodeList(
+            session, softwareProfile='compute', exclude_states=['Installed'])
+
+        assert not handler.getNodeList(
+            session, softwareProfile='compute', hardwareProfile='aws')
+
+
+def test_iterNodeList(dbm, queries_during_stream):
+    with dbm.session() as session:
+        handler = NodesDbHandler()
+
+        expected = handler.getNodeList(session, states=['Installed'])
+
+        result = handler.iterNodeList(session, states=['Installed'],
+                                      batch_size=2)
+
+        #
+        # Relations are loaded as the nodes are iterated, which must not
+        # happen while a streamed result is still being read
+        #
+        assert [(node.name, len(node.nics), len(node.tags),
+                 node.hardwareprofile.name)
+                for node in result] == \
+            [(node.name, len(node.nics), len(node.tags),
+              node.hardwareprofile.name)
+             for node in expected]
+
+        assert not queries_during_stream
+
+
 def match_all_nodes(result):
     # Match expected tags
     return not set(['compute-01.private',
@@ -275,5 +330,31 @@ def test_expand_nodespec_default(dbm):
 
 
 
+def test_get_existing_node_names(dbm):
+    names = [
+        'compute-01.private',   # exact match
+        'COMPUTE-02',           # short host name, case-insensitive
+        'compute-01.example',   # fully-qualified name, no match
+        'compute-99',           # no match
+        'compute-0',            # short host name prefix, no match
+    ]
+
+    with dbm.session() as session:
+        result = NodesDbHandler().get_existing_node_names(session, names)
+
+        assert result == {'compute-01.private', 'COMPUTE-02'}
+
+
+def test_get_existing_node_names_chunked(dbm):
+    names = ['node-{:04d}'.format(idx) for idx in range(100)]
+    names.append('compute-05')
+
+    with dbm.session() as session:
+        result = NodesDbHandler().get_existing_node_names(
+            session, names, chunk_size=7)
+
+        assert result == {'compute-05'}
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,135 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from tortuga.redis.pool import HealthCheckingConnectionPool
+
+
+class FakeConnection:
+    """
+    A connection that records the commands sent to it, without connecting
+    to a Redis server.
+
+    """
+    healthy = True
+
+    def __init__(self, **kwargs):
+        self.pid = os.getpid()
+        self.commands = []
+        self.disconnected = False
+
+    def send_command(self, *args):
+        self.commands.append(args)
+
+    def read_response(self):
+        if not self.healthy:
+            raise ConnectionError('Connection reset by peer')
+        return b'PONG'
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_pool_bounded():
+    pool = HealthCheckingConnectionPool(connection_class=FakeConnection,
+                                        max_connections=2, timeout=0.1)
+
+    conn1 = pool.get_connection('GET')
+    conn2 = pool.get_connection('GET')
+    assert pool.get_stats() == {
+        'max_connections': 2,
+        'created_connections': 2,
+        'in_use_connections': 2,
+        'idle_connections': 0,
+        'pubsub_connections': 0,
+    }
+
+    #
+    # Once all connections are in use, no new connections are made
+    #
+    with pytest.raises(ConnectionError):
+        pool.get_connection('GET')
+
+    pool.release(conn1)
+    assert pool.get_stats()['idle_connections'] == 1
+    assert pool.get_connection('GET') is conn1
+
+    pool.release(conn1)
+    pool.release(conn2)
+    assert pool.get_stats()['in_use_connections'] == 0
+
+
+def test_pool_health_check():
+    pool = HealthCheckingConnectionPool(connection_class=FakeConnection,
+                                        max_connections=1,
+                                        health_check_interval=0)
+
+    #
+    # New connections are not checked
+    #
+    conn = pool.get_connection('GET')
+    assert conn.commands == []
+
+    #
+    # Idle connections are pinged before they are reused
+    #
+    pool.release(conn)
+    conn = pool.get_connection('GET')
+    assert conn.commands == [('PING',)]
+    assert not conn.disconnected
+
+    #
+    # Stale connections are disconnected, to be re-established on use
+    #
+    pool.release(conn)
+    conn.healthy = False
+    conn = pool.get_connection('GET')
+    assert conn.disconnected
+
+
+def test_pool_pubsub():
+    pool = HealthCheckingConnectionPool(connection_class=FakeConnection,
+                                        max_connections=1, timeout=0.1)
+
+    conn = pool.get_connection('GET')
+
+    #
+    # Subscribers get dedicated connections, even when the pool is
+    # exhausted
+    #
+    pubsub_conns = [pool.get_connection('pubsub') for _ in range(3)]
+    assert len(set(pubsub_conns)) == 3
+    assert conn not in pubsub_conns
+    assert pool.get_stats()['pubsub_connections'] == 3
+
+    #
+    # ...and don't take up space in the pool
+    #
+    pool.release(conn)
+    assert pool.get_connection('GET') is conn
+
+    #
+    # Subscriber connections are closed once released, rather than being
+    # returned to the pool
+    #
+    for pubsub_conn in pubsub_conns:
+        pool.release(pubsub_conn)
+        assert pubsub_conn.disconnected
+
+    assert pool.get_stats()['pubsub_connections'] == 0
+    assert pool.get_stats()['created_connections'] == 1
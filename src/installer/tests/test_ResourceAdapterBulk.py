@@ -0,0 +1,156 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from tortuga.db.models.node import Node
+from tortuga.exceptions.unsupportedOperation import UnsupportedOperation
+from tortuga.resourceAdapter.bulk import RateLimiter
+from tortuga.resourceAdapter.default import Default
+
+
+class LatencyResourceAdapter(Default):
+    """
+    The default resource adapter, with per-node operations that inject
+    latency.
+
+    """
+    latency = 0.2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.rebooted = []
+        self.threads = set()
+
+    def _reboot_node(self, node: Node, soft: bool = False):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.threads.add(threading.current_thread())
+
+        try:
+            if node.name.startswith('fail'):
+                raise Exception('Reboot failed')
+
+            time.sleep(
+                self.latency * 5 if node.name.startswith('slow')
+                else self.latency
+            )
+
+            with self._lock:
+                self.rebooted.append(node.name)
+
+            return 'soft' if soft else 'hard'
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.fixture()
+def adapter():
+    with patch('tortuga.resourceAdapter.default.osUtility'):
+        yield LatencyResourceAdapter()
+
+
+def make_nodes(count, prefix='compute'):
+    return [Node(name='{}-{:02d}'.format(prefix, idx))
+            for idx in range(count)]
+
+
+def test_bulk_concurrency(adapter):
+    adapter.bulk_max_workers = 10
+    nodes = make_nodes(20)
+
+    start = time.monotonic()
+    result = adapter._async_reboot_nodes(nodes, soft=True)
+    duration = time.monotonic() - start
+
+    assert result
+    assert result.succeeded == sorted(node.name for node in nodes)
+    assert set(result.results.values()) == {'soft'}
+
+    #
+    # Serially, this would take 20 * 0.2 = 4s; with 10 workers this
+    # should take about 0.4s
+    #
+    assert adapter.max_running == 10
+    assert duration < 2
+
+
+def test_bulk_serial_by_default(adapter):
+    nodes = make_nodes(3)
+
+    result = adapter._async_reboot_nodes(nodes)
+
+    assert result.succeeded == ['compute-00', 'compute-01', 'compute-02']
+
+    #
+    # Without opting in to concurrency, operations run one at a time in
+    # the calling thread, which owns the database session
+    #
+    assert adapter.max_running == 1
+    assert adapter.threads == {threading.current_thread()}
+
+
+@pytest.mark.parametrize('max_workers', [1, 10])
+def test_bulk_errors_and_timeouts(adapter, max_workers):
+    adapter.bulk_max_workers = max_workers
+    adapter.bulk_node_timeout = 0.5
+    nodes = make_nodes(3) + make_nodes(1, 'fail') + make_nodes(1, 'slow')
+
+    result = adapter._async_reboot_nodes(nodes)
+
+    assert not result
+    assert result.failed == ['fail-00']
+
+    #
+    # The slow operation is reported as timed out, but it is not
+    # abandoned: the node is rebooted, and reported as such
+    #
+    assert result.timed_out == ['slow-00']
+    assert result.succeeded == \
+        ['compute-00', 'compute-01', 'compute-02', 'slow-00']
+    assert result.results['slow-00'] == 'hard'
+    assert 'slow-00' in adapter.rebooted
+    assert adapter.running == 0
+
+
+def test_bulk_rate_limit():
+    limiter = RateLimiter(rate=20)
+
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    duration = time.monotonic() - start
+
+    #
+    # 11 operations at 20 per second take at least 0.5s
+    #
+    assert duration >= 0.45
+
+
+def test_bulk_unsupported(adapter):
+    result = adapter._async_startup_nodes(make_nodes(2))
+
+    assert result.failed == ['compute-00', 'compute-01']
+    assert all(isinstance(ex, UnsupportedOperation)
+               for ex in result.errors.values())
@@ -0,0 +1,155 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tortuga.events.manager import EventStoreManager, PubSubManager
+from tortuga.events.pubsub import RedisEventPubSub
+from tortuga.events.store import ObjectStoreEventStore
+from tortuga.events.types import (ResourceAdapterConfigurationDeleted,
+                                  ResourceAdapterConfigurationUpdated)
+from tortuga.objectstore.redis import RedisObjectStore
+from tortuga.resourceAdapter.resourceAdapter import ResourceAdapter
+from tortuga.resourceAdapterConfiguration import settings
+from tortuga.resourceAdapterConfiguration.cache import (
+    ResourceAdapterConfigurationCache, ResourceAdapterConfigurationCacheManager)
+
+
+@pytest.fixture()
+def cache(monkeypatch, redis):
+    object_store = RedisObjectStore(namespace='events', redis_client=redis)
+    event_store = ObjectStoreEventStore(object_store=object_store)
+    monkeypatch.setattr(EventStoreManager, '_event_store', event_store)
+    monkeypatch.setattr(PubSubManager, '_redis_client', redis)
+
+    cache = ResourceAdapterConfigurationCache(
+        pubsub=RedisEventPubSub(redis_client=redis, event_store=event_store))
+    monkeypatch.setattr(ResourceAdapterConfigurationCacheManager, '_cache',
+                        cache)
+
+    return cache
+
+
+class CountingResourceAdapter(ResourceAdapter):
+    __adaptername__ = 'counting'
+
+    settings = {
+        'instance_type': settings.StringSetting(default='small'),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.validate_count = 0
+
+    def validate_config(self, *args, **kwargs):
+        self.validate_count += 1
+
+        return super().validate_config(*args, **kwargs)
+
+
+def test_cache_invalidation(cache):
+    cache.set('aws', 'Default', {'instance_type': 'small'})
+    cache.set('aws', 'large', {'instance_type': 'large'})
+    cache.set('azure', 'Default', {'size': 'small'})
+
+    #
+    # Assert that cached configs are returned as copies
+    #
+    config = cache.get('aws', 'Default')
+    config['instance_type'] = 'modified'
+    assert cache.get('aws', 'Default') == {'instance_type': 'small'}
+
+    #
+    # Assert that an event for a profile invalidates all profiles of the
+    # same resource adapter, and only those
+    #
+    ResourceAdapterConfigurationUpdated.fire(resourceadapter_name='aws',
+                                             profile_name='Default')
+
+    assert cache.get('aws', 'Default') is None
+    assert cache.get('aws', 'large') is None
+    assert cache.get('azure', 'Default') == {'size': 'small'}
+
+    ResourceAdapterConfigurationDeleted.fire(resourceadapter_name='azure',
+                                             profile_name='Default')
+
+    assert cache.get('azure', 'Default') is None
+
+
+def test_cache_disabled():
+    class FailingPubSub:
+        def subscribe(self, event_name=None):
+            raise ConnectionError()
+
+    cache = ResourceAdapterConfigurationCache(pubsub=FailingPubSub())
+
+    cache.set('aws', 'Default', {'instance_type': 'small'})
+    assert cache.get('aws', 'Default') is None
+
+
+def test_get_config_validates_once(cache, dbm):
+    with dbm.session() as session:
+        adapter = CountingResourceAdapter()
+        adapter.session = session
+
+        for _ in range(1000):
+            config = adapter.get_config()
+
+        assert config['instance_type'] == 'small'
+        assert adapter.validate_count == 1
+
+        #
+        # Assert that the config is validated again once changed
+        #
+        ResourceAdapterConfigurationUpdated.fire(
+            resourceadapter_name='counting', profile_name='Default')
+
+        adapter.get_config()
+        assert adapter.validate_count == 2
+
+
+def test_cache_unresolvable_event(cache, redis):
+    cache.set('aws', 'Default', {'instance_type': 'small'})
+    cache.set('azure', 'Default', {'size': 'small'})
+
+    #
+    # An event that expired before it was received can't tell which
+    # resource adapter changed, so all profiles are invalidated
+    #
+    redis.publish('events.resource-adapter-configuration-updated',
+                  'events:expired')
+
+    assert cache.get('aws', 'Default') is None
+    assert cache.get('azure', 'Default') is None
+
+
+def test_cache_set_after_invalidation(cache):
+    #
+    # A profile resolved before an invalidation, processed in the
+    # meantime, is not cached
+    #
+    generation = cache.generation
+
+    ResourceAdapterConfigurationUpdated.fire(resourceadapter_name='aws',
+                                             profile_name='Default')
+    assert cache.get('azure', 'Default') is None
+
+    cache.set('aws', 'Default', {'instance_type': 'stale'},
+              generation=generation)
+    assert cache.get('aws', 'Default') is None
+
+    cache.set('aws', 'Default', {'instance_type': 'large'},
+              generation=cache.generation)
+    assert cache.get('aws', 'Default') == {'instance_type': 'large'}
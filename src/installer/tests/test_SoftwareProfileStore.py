@@ -0,0 +1,66 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tortuga.events.manager import EventStoreManager, PubSubManager
+from tortuga.events.store import ObjectStoreEventStore
+from tortuga.objectstore.redis import RedisObjectStore
+from tortuga.softwareprofile.store import \
+    SqlalchemySessionSoftwareProfileStore
+
+
+@pytest.fixture()
+def event_store(redis):
+    object_store = RedisObjectStore(namespace='events', redis_client=redis)
+    store = ObjectStoreEventStore(object_store=object_store)
+    EventStoreManager._event_store = store
+    PubSubManager._redis_client = redis
+
+    return store
+
+
+def test_list_order(dbm):
+    store = SqlalchemySessionSoftwareProfileStore(dbm)
+
+    names = [swp.name for swp in store.list(order_by='name')]
+    assert names == sorted(names)
+
+    names = [swp.name for swp in store.list(order_by='name',
+                                            order_desc=True)]
+    assert names == sorted(names, reverse=True)
+
+
+def test_save(dbm, event_store):
+    store = SqlalchemySessionSoftwareProfileStore(dbm)
+
+    swp = next(store.list(name='compute'))
+    original_tags = dict(swp.tags)
+
+    swp.tags = dict(original_tags, store_test='value')
+    try:
+        saved = store.save(swp)
+
+        assert saved.tags == swp.tags
+        assert store.get(swp.id).tags == swp.tags
+
+        events = {evt.name: evt for evt in event_store.list()}
+        assert events['software-profile-tags-changed'].previous_tags == \
+            original_tags
+        assert events['tag-created'].tag_id == \
+            'softwareprofile:{}:store_test'.format(swp.id)
+
+    finally:
+        swp.tags = original_tags
+        store.save(swp)
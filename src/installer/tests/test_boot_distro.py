@@ -0,0 +1,197 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from tortuga.boot.distro.redhat.centos7 import CentOs7
+from tortuga.exceptions.checksumMismatch import ChecksumMismatch
+
+
+KERNEL = b'kernel' * 1000
+INITRD = b'initrd' * 1000
+
+
+@pytest.fixture()
+def distro_tree(tmpdir):
+    pxeboot_dir = tmpdir.mkdir('os').mkdir('images').mkdir('pxeboot')
+    pxeboot_dir.join('vmlinuz').write_binary(KERNEL)
+    pxeboot_dir.join('initrd.img').write_binary(INITRD)
+
+    tmpdir.join('os', '.treeinfo').write(
+        '[general]\n'
+        'family = CentOS\n'
+        '\n'
+        '[checksums]\n'
+        'images/pxeboot/vmlinuz = sha256:{}\n'
+        'images/pxeboot/initrd.img = sha256:{}\n'.format(
+            hashlib.sha256(KERNEL).hexdigest(),
+            hashlib.sha256(INITRD).hexdigest()
+        )
+    )
+
+    return str(tmpdir.join('os'))
+
+
+class TreeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, root, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.root = root
+
+        #: (method, path) of each request
+        self.requests = []
+
+        #: the error status returned for HEAD requests, if any
+        self.head_status = None
+
+
+class TreeRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        if self.server.head_status:
+            self.server.requests.append((self.command, self.path))
+            self.send_error(self.server.head_status)
+            return
+
+        super().do_HEAD()
+
+    def translate_path(self, path):
+        return os.path.join(self.server.root, path.lstrip('/'))
+
+    def send_head(self):
+        self.server.requests.append((self.command, self.path))
+
+        return super().send_head()
+
+
+@pytest.fixture()
+def tree_server(distro_tree):
+    server = TreeServer(distro_tree, ('127.0.0.1', 0), TreeRequestHandler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_copy_local(tmpdir, distro_tree):
+    distro = CentOs7(distro_tree)
+    pxeboot_dir = str(tmpdir.mkdir('pxeboot'))
+
+    distro.copy_kernel(pxeboot_dir)
+    distro.copy_initrd(pxeboot_dir)
+
+    kernel_path = os.path.join(pxeboot_dir, 'kernel-centos-7.0-x86_64')
+    initrd_path = os.path.join(pxeboot_dir, 'initrd-centos-7.0-x86_64.img')
+
+    with open(kernel_path, 'rb') as fp:
+        assert fp.read() == KERNEL
+
+    with open(initrd_path, 'rb') as fp:
+        assert fp.read() == INITRD
+
+    with pytest.raises(IOError):
+        distro.copy_kernel(pxeboot_dir)
+
+    #
+    # Copying again is a no-op, as the files are up to date
+    #
+    stat = os.stat(kernel_path)
+
+    distro.copy_kernel(pxeboot_dir, True)
+
+    assert os.stat(kernel_path).st_ino == stat.st_ino
+
+    #
+    # ...unless the source has changed
+    #
+    source_kernel = os.path.join(distro_tree, 'images', 'pxeboot',
+                                 'vmlinuz')
+    os.unlink(source_kernel)
+    with open(source_kernel, 'wb') as fp:
+        fp.write(b'new kernel')
+
+    distro.copy_kernel(pxeboot_dir, True)
+
+    with open(kernel_path, 'rb') as fp:
+        assert fp.read() == b'new kernel'
+
+
+def test_copy_remote(tmpdir, tree_server):
+    distro = CentOs7('http://127.0.0.1:{}/'.format(tree_server.server_port))
+    pxeboot_dir = str(tmpdir.mkdir('pxeboot'))
+
+    distro.copy_kernel(pxeboot_dir)
+    distro.copy_initrd(pxeboot_dir)
+
+    kernel_path = os.path.join(pxeboot_dir, 'kernel-centos-7.0-x86_64')
+
+    with open(kernel_path, 'rb') as fp:
+        assert fp.read() == KERNEL
+
+    assert distro.checksums['images/pxeboot/vmlinuz'] == \
+        hashlib.sha256(KERNEL).hexdigest()
+
+    #
+    # The files are up to date, so they are not downloaded again
+    #
+    tree_server.requests.clear()
+
+    distro.copy_kernel(pxeboot_dir, True)
+    distro.copy_initrd(pxeboot_dir, True)
+
+    assert [method for method, _ in tree_server.requests] == \
+        ['HEAD', 'HEAD']
+
+
+def test_copy_remote_no_head(tmpdir, tree_server):
+    tree_server.head_status = 405
+
+    distro = CentOs7('http://127.0.0.1:{}/'.format(tree_server.server_port))
+    pxeboot_dir = str(tmpdir.mkdir('pxeboot'))
+
+    #
+    # The file is downloaded if the server doesn't support HEAD requests
+    #
+    distro.copy_kernel(pxeboot_dir)
+
+    with open(os.path.join(pxeboot_dir, 'kernel-centos-7.0-x86_64'),
+              'rb') as fp:
+        assert fp.read() == KERNEL
+
+    assert ('GET', '/images/pxeboot/vmlinuz') in tree_server.requests
+
+
+def test_copy_remote_checksum_mismatch(tmpdir, distro_tree, tree_server):
+    with open(os.path.join(distro_tree, 'images', 'pxeboot', 'vmlinuz'),
+              'wb') as fp:
+        fp.write(b'corrupt kernel')
+
+    distro = CentOs7('http://127.0.0.1:{}/'.format(tree_server.server_port))
+
+    with pytest.raises(ChecksumMismatch):
+        distro.copy_kernel(str(tmpdir.mkdir('pxeboot')))
@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+
 from marshmallow import fields
 import pytest
 import time
 
 from tortuga.events.types.base import BaseEvent, BaseEventSchema
 from tortuga.events.manager import EventStoreManager, PubSubManager
+from tortuga.events.pubsub import RedisStreamEventPubSub
 from tortuga.events.store import ObjectStoreEventStore
 from tortuga.objectstore.redis import RedisObjectStore
 
@@ -122,6 +125,149 @@ def test_event_pubsub(event_store):
         assert evt == evt_sub
 
 
+@pytest.fixture()
+def stream_pubsub(event_store, monkeypatch):
+    monkeypatch.setattr(PubSubManager._config_manager,
+                        'get_event_pubsub_backend', lambda: 'streams')
+    pubsub = PubSubManager.get()
+    assert isinstance(pubsub, RedisStreamEventPubSub)
+
+    return pubsub
+
+
+def test_event_stream_pubsub(stream_pubsub):
+    stream_pubsub.subscribe(event_name='example-*')
+
+    events = [
+        ExampleEvent.fire(integer=3, string='testing'),
+        ExampleEvent.fire(integer=4, string='testing2'),
+        ExampleEvent.fire(integer=5, string='abc123')
+    ]
+
+    for evt in events:
+        evt_sub = stream_pubsub.get_message()
+        assert evt_sub.id == evt.id
+        assert evt_sub.stream_id == evt.stream_id
+    assert stream_pubsub.get_message() is None
+
+    #
+    # Subscriptions that don't match the event name are skipped
+    #
+    pubsub = PubSubManager.get()
+    pubsub.subscribe(event_name='other-*', since='0')
+    assert pubsub.get_message() is None
+
+
+def test_event_stream_resume(stream_pubsub):
+    events = [
+        ExampleEvent.fire(integer=3, string='testing'),
+        ExampleEvent.fire(integer=4, string='testing2'),
+        ExampleEvent.fire(integer=5, string='abc123')
+    ]
+
+    #
+    # Resuming after the first event gets the remaining events in order
+    #
+    stream_pubsub.subscribe(since=events[0].stream_id)
+    assert [stream_pubsub.get_message().id for _ in range(2)] == \
+        [evt.id for evt in events[1:]]
+
+    replayed = list(stream_pubsub.replay(events[0].stream_id, limit=1))
+    assert [evt.id for evt in replayed] == [events[1].id]
+
+
+def test_event_stream_consumer_group(stream_pubsub, monkeypatch):
+    #
+    # Read one entry at a time, so that the events are shared between the
+    # consumers
+    #
+    monkeypatch.setattr(RedisStreamEventPubSub, 'BATCH_SIZE', 1)
+
+    worker1 = stream_pubsub
+    worker1.subscribe(group='workers', consumer='worker1')
+    worker2 = PubSubManager.get()
+    worker2.subscribe(group='workers', consumer='worker2')
+
+    events = [
+        ExampleEvent.fire(integer=3, string='testing'),
+        ExampleEvent.fire(integer=4, string='testing2')
+    ]
+
+    #
+    # Each event is delivered to only one consumer in the group
+    #
+    evt1 = worker1.get_message()
+    evt2 = worker2.get_message()
+    assert {evt1.id, evt2.id} == {evt.id for evt in events}
+    assert worker2.get_message() is None
+    worker1.ack(evt1)
+
+    #
+    # Events that were not acknowledged are re-delivered to the consumer
+    # when it re-subscribes
+    #
+    worker2 = PubSubManager.get()
+    worker2.subscribe(group='workers', consumer='worker2')
+    assert worker2.get_message().id == evt2.id
+
+    worker1 = PubSubManager.get()
+    worker1.subscribe(group='workers', consumer='worker1')
+    assert worker1.get_message() is None
+
+
+def test_websocket_subscribe_filters(event_store):
+    from tortuga.web_service.websocket.actions import SubscribeAction
+    from tortuga.web_service.websocket.messages import \
+        SubscribeSucceededMessage
+    from tortuga.web_service.websocket.state import State
+
+    state = State()
+    state.authenticated = True
+    SubscribeAction(state, event_name='example-*',
+                    filters={'integer__gt': 3, 'string': 'abc123'}).do()
+    assert isinstance(state.next_message(), SubscribeSucceededMessage)
+
+    ExampleEvent.fire(integer=3, string='abc123')
+    ExampleEvent.fire(integer=4, string='testing')
+    evt = ExampleEvent.fire(integer=5, string='abc123')
+
+    #
+    # Only the event matching the filters is sent
+    #
+    assert state.next_message() == evt
+    assert state.next_message() is None
+
+
+
+def test_websocket_subscribe_invalid_filters(event_store):
+    from tortuga.web_service.websocket.actions import SubscribeAction
+    from tortuga.web_service.websocket.messages import \
+        SubscribeSucceededMessage
+    from tortuga.web_service.websocket.state import State
+
+    state = State()
+    state.authenticated = True
+
+    #
+    # Filter values must be scalars
+    #
+    with pytest.raises(ValueError):
+        SubscribeAction(state, filters={'integer__gt': [1, 2]}).do()
+    assert state.pubsub is None
+
+    #
+    # Filters that can't be evaluated against an event don't match it,
+    # rather than raising
+    #
+    SubscribeAction(state, event_name='example-*',
+                    filters={'integer__gt': 'abc'}).do()
+    assert isinstance(state.next_message(), SubscribeSucceededMessage)
+
+    ExampleEvent.fire(integer=3, string='abc123')
+
+    assert state.next_message() is None
+
+
 def test_event_listener(event_store, celery_worker):
     #
     # The purpose of this unit test is to ensure that when events fire,
@@ -176,3 +322,312 @@ def test_event_listener(event_store, celery_worker):
     assert 'example-listener' in was_run
     assert 'example-all-listener' in was_run
     assert 'example-none-listener' not in was_run
+
+
+class ExampleSubEvent(ExampleEvent):
+    name = 'example-sub-event'
+
+
+@pytest.fixture()
+def listener_registry(monkeypatch):
+    #
+    # Isolate the listener registry, so that listeners registered by a test
+    # are not run for events fired in other tests
+    #
+    from tortuga.events.listeners import base
+
+    monkeypatch.setattr(base, 'EVENT_LISTENERS', {})
+    monkeypatch.setattr(base, 'LISTENER_DISPATCH_TABLE', {})
+
+    return base
+
+
+def test_listener_dispatch_table(listener_registry):
+    from tortuga.events.listeners.base import BaseListener
+
+    class ExampleEventListener(BaseListener):
+        name = 'example-listener'
+        event_types = [ExampleEvent]
+
+    class ExampleSubEventListener(BaseListener):
+        name = 'example-sub-listener'
+        event_types = [ExampleSubEvent]
+
+    dispatch = listener_registry.get_listener_classes_for_event_class
+    assert list(dispatch(ExampleEvent)) == ['example-listener']
+    assert list(dispatch(ExampleSubEvent)) == ['example-listener',
+                                               'example-sub-listener']
+
+    #
+    # Registering a new listener invalidates the dispatch table
+    #
+    class ExampleEventAllListener(BaseListener):
+        name = 'example-all-listener'
+        all_events = True
+
+    assert list(dispatch(ExampleEvent)) == ['example-listener',
+                                            'example-all-listener']
+
+    event = ExampleSubEvent(integer=1, string='testing')
+    assert ExampleEventListener.should_run(event)
+    assert ExampleSubEventListener.should_run(event)
+    assert not ExampleSubEventListener.should_run(
+        ExampleEvent(integer=1, string='testing'))
+
+
+def test_event_fire_many(event_store, listener_registry, monkeypatch):
+    from tortuga.events.listeners.base import BaseListener
+    from tortuga.events.types import TagCreated, TagDeleted, \
+        TagsChangedBatch
+
+    class TagListener(BaseListener):
+        name = 'tag-listener'
+        event_types = [TagCreated, TagDeleted]
+
+    class TagBatchListener(BaseListener):
+        name = 'tag-batch-listener'
+        event_types = [TagCreated, TagDeleted, TagsChangedBatch]
+
+    class AllListener(BaseListener):
+        name = 'all-listener'
+        all_events = True
+
+    scheduled = []
+    monkeypatch.setattr(
+        BaseEvent, '_schedule_event_listener',
+        classmethod(lambda cls, listener_class, event_dict:
+                    scheduled.append((listener_class.name, event_dict)))
+    )
+
+    pubsub = PubSubManager.get()
+    pubsub.subscribe()
+
+    events = BaseEvent.fire_many([
+        TagDeleted(tag_id='node:1:old', value='1'),
+        TagCreated(tag_id='node:1:new', value='2'),
+    ])
+
+    #
+    # The events are stored and published
+    #
+    for evt in events:
+        assert event_store.get(evt.id).tag_id == evt.tag_id
+        assert pubsub.get_message().id == evt.id
+
+    #
+    # Listeners that accept batches get a single batch event, with the
+    # events in the order they were fired, the others get each event
+    #
+    names = [name for name, _ in scheduled]
+    assert names.count('tag-listener') == 2
+    assert names.count('all-listener') == 2
+    assert names.count('tag-batch-listener') == 1
+
+    event_dict = scheduled[names.index('tag-batch-listener')][1]
+    assert event_dict['name'] == 'tags-changed-batch'
+    batch = TagsChangedBatch(events=event_dict['events'])
+    assert [(type(evt), evt.id) for evt in batch.get_events()] == \
+        [(type(evt), evt.id) for evt in events]
+
+
+def test_tag_listener_batch_failure(monkeypatch):
+    from unittest.mock import MagicMock
+    from tortuga.events.listeners import tags
+    from tortuga.events.types import TagCreated, TagsChangedBatch
+
+    pushed = []
+
+    class FakeResourceAdapter:
+        def set_node_tag(self, node, tag_name, value):
+            if node == 2:
+                raise Exception('Resource adapter unavailable')
+            pushed.append((node, tag_name, value))
+
+    monkeypatch.setattr(tags, 'Session', MagicMock())
+    monkeypatch.setattr(
+        tags, 'NodesDbHandler',
+        lambda: MagicMock(getNodeById=lambda sess, node_id: node_id))
+    monkeypatch.setattr(tags.TagChangeListener, '_get_resource_adapter',
+                        lambda self, sess, node_id: FakeResourceAdapter())
+
+    events = [TagCreated(tag_id='node:{}:tag'.format(node_id), value='1')
+              for node_id in range(1, 4)]
+    batch = TagsChangedBatch(
+        events=[evt.get_schema().dump(evt).data for evt in events])
+
+    #
+    # The tag change that fails does not prevent the remaining changes in
+    # the batch from being pushed, but the failure is reported
+    #
+    with pytest.raises(Exception, match='1 of 3 tag change.*node:2:tag'):
+        tags.TagChangeListener(app=None).run(batch)
+
+    assert pushed == [(1, 'tag', '1'), (3, 'tag', '1')]
+
+
+def test_listener_dispatch_benchmark(event_store, listener_registry,
+                                     monkeypatch, record_property):
+    #
+    # Resolve the listeners for 100k events with 50 registered listeners,
+    # comparing the dispatch table to scanning all listeners for every
+    # event, then fire events through both.
+    #
+    from tortuga.events import listeners
+    from tortuga.events.listeners.base import BaseListener
+
+    event_classes = []
+    for i in range(10):
+        event_classes.append(type(
+            'BenchmarkEvent{}'.format(i),
+            (ExampleEvent,),
+            {'name': 'benchmark-event-{}'.format(i)}
+        ))
+
+    for i in range(50):
+        type('BenchmarkListener{}'.format(i), (BaseListener,), {
+            'name': 'benchmark-listener-{}'.format(i),
+            'event_types': [event_classes[i % len(event_classes)]]
+        })
+
+    events = [event_classes[i % len(event_classes)](integer=i, string='')
+              for i in range(100000)]
+
+    def scan(event):
+        return [
+            listener_class
+            for listener_class in listener_registry.EVENT_LISTENERS.values()
+            if any(isinstance(event, event_type)
+                   for event_type in listener_class.event_types)
+        ]
+
+    def dispatch(event):
+        return [
+            listener_class for listener_class in
+            listener_registry.get_listener_classes_for_event_class(
+                type(event)).values()
+            if listener_class.should_run(event)
+        ]
+
+    start = time.perf_counter()
+    scanned = [scan(event) for event in events]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dispatched = [dispatch(event) for event in events]
+    dispatch_time = time.perf_counter() - start
+
+    record_property('resolve_scan_seconds', round(scan_time, 3))
+    record_property('resolve_dispatch_seconds', round(dispatch_time, 3))
+
+    assert scanned == dispatched
+    assert all(len(listener_classes) == 5
+               for listener_classes in dispatched)
+    assert dispatch_time * 2 < scan_time
+
+    #
+    # Fire events, with the listeners resolved through the dispatch table
+    # and by scanning, recording the listeners that would be scheduled
+    #
+    scheduled = []
+    monkeypatch.setattr(
+        BaseEvent, '_schedule_event_listener',
+        classmethod(lambda cls, listener_class, event_dict:
+                    scheduled.append((listener_class.name, event_dict['id'])))
+    )
+
+    def fire_all():
+        del scheduled[:]
+
+        start = time.perf_counter()
+        fired = [event_classes[i % len(event_classes)].fire(
+            integer=i, string='') for i in range(1000)]
+        elapsed = time.perf_counter() - start
+
+        return fired, elapsed
+
+    fired, dispatch_fire_time = fire_all()
+    assert len(scheduled) == 5 * len(fired)
+    assert [event_id for _, event_id in scheduled[::5]] == \
+        [event.id for event in fired]
+    dispatch_scheduled = [name for name, _ in scheduled]
+
+    monkeypatch.setattr(
+        listeners, 'get_listener_classes_for_event_class',
+        lambda event_class: {
+            listener_class.name: listener_class
+            for listener_class in listener_registry.EVENT_LISTENERS.values()
+            if any(issubclass(event_class, event_type)
+                   for event_type in listener_class.event_types)
+        }
+    )
+
+    fired, scan_fire_time = fire_all()
+    assert [name for name, _ in scheduled] == dispatch_scheduled
+
+    record_property('fire_scan_seconds', round(scan_fire_time, 3))
+    record_property('fire_dispatch_seconds', round(dispatch_fire_time, 3))
+
+
+def test_event_storage_compact(redis):
+    object_store = RedisObjectStore(namespace='events', redis_client=redis)
+    store = ObjectStoreEventStore(object_store=object_store)
+    compact_store = ObjectStoreEventStore(object_store=object_store,
+                                          compact=True)
+
+    #
+    # Events are stored as a single blob, alongside the index fields
+    #
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    event = ExampleEvent(id='compact', integer=1, string='abc',
+                         timestamp=now)
+    compact_store.save(event)
+    stored = object_store.get('compact')
+    assert sorted(stored.keys()) == ['__event__', 'id', 'name', 'timestamp']
+    assert stored['__event__'].startswith('1:')
+    assert compact_store.get('compact') == event
+
+    #
+    # Events stored field by field still load, and both formats can be
+    # listed together
+    #
+    event_2 = ExampleEvent(id='fields', integer=2, string='def',
+                           timestamp=now + datetime.timedelta(seconds=1))
+    store.save(event_2)
+    assert compact_store.get('fields') == event_2
+    assert store.get('compact') == event
+    assert [evt.id for evt in compact_store.list(order_by='timestamp')] == \
+        ['compact', 'fields']
+
+
+def test_event_benchmark(redis, monkeypatch, record_property):
+    #
+    # Measure fire -> store -> load throughput, for both storage formats
+    #
+    object_store = RedisObjectStore(namespace='events', redis_client=redis)
+    monkeypatch.setattr(PubSubManager, '_redis_client', redis)
+
+    count = 500
+    elapsed = {}
+
+    for compact in (False, True):
+        store = ObjectStoreEventStore(object_store=object_store,
+                                      compact=compact)
+        monkeypatch.setattr(EventStoreManager, '_event_store', store)
+
+        start = time.perf_counter()
+        events = [ExampleEvent.fire(integer=i, string='benchmark')
+                  for i in range(count)]
+        loaded = [store.get(event.id) for event in events]
+        elapsed[compact] = time.perf_counter() - start
+
+        assert loaded == events
+
+        record_property(
+            'events_per_second_{}'.format('compact' if compact else 'hash'),
+            round(count / elapsed[compact]))
+
+    #
+    # Storing each event as a single blob is not slower than storing it
+    # field by field
+    #
+    assert elapsed[True] < elapsed[False] * 1.2
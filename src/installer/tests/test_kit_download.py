@@ -0,0 +1,330 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from tortuga.exceptions.checksumMismatch import ChecksumMismatch
+from tortuga.exceptions.fileNotFound import FileNotFound
+from tortuga.exceptions.remoteCommunicationFailed import \
+    RemoteCommunicationFailed
+from tortuga.kit import download as kit_download
+from tortuga.exceptions.operationFailed import OperationFailed
+from tortuga.kit.download import download_file, download_files, \
+    get_part_path, make_private_dir, parse_manifest
+
+
+class FileServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        #: file name -> content
+        self.files = {}
+
+        #: the number of requests to disconnect, per file name
+        self.disconnects = {}
+
+        #: the number of bytes to send before disconnecting
+        self.disconnect_after = 0
+
+        #: whether or not Range requests are supported
+        self.ranges = True
+
+        #: (path, Range header) of each request
+        self.requests = []
+
+
+class FileRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        name = self.path.lstrip('/')
+        range_header = self.headers.get('Range')
+
+        self.server.requests.append((name, range_header))
+
+        if name not in self.server.files:
+            self.send_error(404)
+            return
+
+        content = self.server.files[name]
+        start = 0
+
+        if range_header and self.server.ranges:
+            start = int(re.match(r'bytes=(\d+)-', range_header).group(1))
+            if start >= len(content):
+                self.send_error(416)
+                return
+
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                start, len(content) - 1, len(content)))
+        else:
+            self.send_response(200)
+
+        body = content[start:]
+
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if self.server.disconnects.get(name):
+            #
+            # Drop the connection part way through the response
+            #
+            self.server.disconnects[name] -= 1
+            self.wfile.write(body[:self.server.disconnect_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def file_server():
+    server = FileServer(('127.0.0.1', 0), FileRequestHandler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(kit_download.time, 'sleep', lambda seconds: None)
+
+
+def _url(server: FileServer, name: str) -> str:
+    return 'http://127.0.0.1:{}/{}'.format(server.server_port, name)
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_parse_manifest():
+    assert parse_manifest(
+        '# comment\n'
+        'ABCDEF  kit-a-1.0-0.tar.bz2\n'
+        '012345 *CentOS-7-x86_64-DVD.iso\n'
+    ) == {
+        'kit-a-1.0-0.tar.bz2': 'abcdef',
+        'CentOS-7-x86_64-DVD.iso': '012345',
+    }
+
+
+def test_download_resume(tmpdir, file_server):
+    content = os.urandom(512 * 1024)
+    file_server.files['kit.tar.bz2'] = content
+    file_server.disconnects['kit.tar.bz2'] = 3
+    file_server.disconnect_after = 100 * 1024
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path,
+                  sha256=_sha256(content))
+
+    with open(dest_path, 'rb') as fp:
+        assert fp.read() == content
+
+    assert not os.path.exists(get_part_path(dest_path))
+
+    #
+    # Each retry resumes from where the previous attempt was
+    # disconnected
+    #
+    assert [range_header for _, range_header in file_server.requests] == [
+        None,
+        'bytes=102400-',
+        'bytes=204800-',
+        'bytes=307200-',
+    ]
+
+
+def test_download_resume_existing_part(tmpdir, file_server):
+    content = os.urandom(64 * 1024)
+    file_server.files['kit.tar.bz2'] = content
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+    with open(get_part_path(dest_path), 'wb') as fp:
+        fp.write(content[:1000])
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path,
+                  sha256=_sha256(content))
+
+    with open(dest_path, 'rb') as fp:
+        assert fp.read() == content
+
+    assert file_server.requests[-1] == ('kit.tar.bz2', 'bytes=1000-')
+
+
+def test_download_no_range_support(tmpdir, file_server):
+    content = os.urandom(64 * 1024)
+    file_server.files['kit.tar.bz2'] = content
+    file_server.disconnects['kit.tar.bz2'] = 1
+    file_server.disconnect_after = 1000
+    file_server.ranges = False
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path,
+                  sha256=_sha256(content))
+
+    with open(dest_path, 'rb') as fp:
+        assert fp.read() == content
+
+
+def test_download_too_many_disconnects(tmpdir, file_server):
+    file_server.files['kit.tar.bz2'] = os.urandom(64 * 1024)
+    file_server.disconnects['kit.tar.bz2'] = 10
+    file_server.disconnect_after = 1000
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+
+    with pytest.raises(RemoteCommunicationFailed):
+        download_file(_url(file_server, 'kit.tar.bz2'), dest_path,
+                      retries=2)
+
+    assert not os.path.exists(dest_path)
+
+    #
+    # The partial download is kept, so that it can be resumed later
+    #
+    assert os.path.getsize(get_part_path(dest_path)) == 3000
+
+
+def test_download_manifest(tmpdir, file_server):
+    content = os.urandom(64 * 1024)
+    file_server.files['kit.tar.bz2'] = content
+    file_server.files['SHA256SUMS'] = '{}  kit.tar.bz2\n'.format(
+        _sha256(b'something else')).encode()
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+
+    with pytest.raises(ChecksumMismatch):
+        download_file(_url(file_server, 'kit.tar.bz2'), dest_path)
+
+    assert not os.path.exists(dest_path)
+    assert not os.path.exists(get_part_path(dest_path))
+
+    file_server.files['SHA256SUMS'] = '{}  kit.tar.bz2\n'.format(
+        _sha256(content)).encode()
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path)
+
+    with open(dest_path, 'rb') as fp:
+        assert fp.read() == content
+
+    #
+    # Already downloaded and verified files are not downloaded again
+    #
+    file_server.requests.clear()
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path)
+
+    assert file_server.requests == [('SHA256SUMS', None)]
+
+
+def test_download_not_found(tmpdir, file_server):
+    with pytest.raises(FileNotFound):
+        download_file(_url(file_server, 'missing.tar.bz2'),
+                      str(tmpdir.join('missing.tar.bz2')))
+
+
+def test_download_files(tmpdir, file_server):
+    contents = {
+        'kit-{}.tar.bz2'.format(idx): os.urandom(32 * 1024)
+        for idx in range(6)
+    }
+    file_server.files.update(contents)
+    file_server.disconnects['kit-2.tar.bz2'] = 1
+    file_server.disconnect_after = 1000
+
+    names = sorted(contents)
+
+    paths = download_files([_url(file_server, name) for name in names],
+                           str(tmpdir))
+
+    assert paths == [str(tmpdir.join(name)) for name in names]
+
+    for name, path in zip(names, paths):
+        with open(path, 'rb') as fp:
+            assert fp.read() == contents[name]
+
+
+def test_part_path():
+    #
+    # Partial downloads don't match the kit archive glob
+    #
+    assert get_part_path('/opt/tortuga/kits/kit-a-1.0-0.tar.bz2') == \
+        '/opt/tortuga/kits/.kit-a-1.0-0.tar.bz2.part'
+
+
+def test_download_discard_foreign_part(tmpdir, file_server):
+    content = os.urandom(64 * 1024)
+    file_server.files['kit.tar.bz2'] = content
+
+    #
+    # A .part file that is a symlink is not resumed (or written through)
+    #
+    target = tmpdir.join('target')
+    target.write_binary(content[:1000])
+
+    dest_path = str(tmpdir.join('kit.tar.bz2'))
+    os.symlink(str(target), get_part_path(dest_path))
+
+    download_file(_url(file_server, 'kit.tar.bz2'), dest_path,
+                  sha256=_sha256(content))
+
+    with open(dest_path, 'rb') as fp:
+        assert fp.read() == content
+
+    assert file_server.requests == [('kit.tar.bz2', None)]
+    assert target.read_binary() == content[:1000]
+
+
+def test_make_private_dir(tmpdir):
+    path = str(tmpdir.join('os-media'))
+
+    assert make_private_dir(path) == path
+    assert os.stat(path).st_mode & 0o777 == 0o700
+
+    #
+    # Existing directories are made private
+    #
+    os.chmod(path, 0o777)
+    make_private_dir(path)
+    assert os.stat(path).st_mode & 0o777 == 0o700
+
+    #
+    # Symlinks (i.e. planted by another user) are rejected
+    #
+    link_path = str(tmpdir.join('link'))
+    os.symlink(path, link_path)
+
+    with pytest.raises(OperationFailed):
+        make_private_dir(link_path)
@@ -12,11 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import json
 import os
+import stat
+import tarfile
 
 import pytest
-from tortuga.kit.builder import KitBuilder
-from tortuga.kit.utils import get_metadata_from_archive
+from tortuga.config.configManager import ConfigManager
+from tortuga.exceptions.kitNotFound import KitNotFound
+from tortuga.exceptions.tortugaException import TortugaException
+from tortuga.kit import utils as kit_utils
+from tortuga.kit.builder import WHEELHOUSE_DIR, KitBuilder
+from tortuga.kit.utils import get_kit_archive_url, \
+    get_metadata_from_archive, pip_install_requirements, unpack_kit_archive
+from tortuga.objects.kit import Kit
+
+
+KIT_META = {
+    'name': 'test',
+    'version': '1.0.0',
+    'iteration': '0',
+    'description': 'A test kit.',
+}
 
 
 @pytest.fixture()
@@ -44,3 +62,235 @@ def test_get_metadata_from_archive(test_kit_archive):
     # Make sure there are no exceptions in this process
     #
     get_metadata_from_archive(test_kit_archive)
+
+
+def _add_file(archive: tarfile.TarFile, name: str, data: bytes,
+              mode: int = 0o666):
+    tarinfo = tarfile.TarInfo(name)
+    tarinfo.size = len(data)
+    tarinfo.mode = mode
+    archive.addfile(tarinfo, io.BytesIO(data))
+
+
+def _make_kit_archive(path: str, members: list,
+                      compression: str = 'bz2') -> str:
+    with tarfile.open(path, 'w:' + compression) as archive:
+        for name, data in members:
+            _add_file(archive, name, data)
+
+    return path
+
+
+def test_get_metadata_from_archive_first_member(tmpdir):
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/kit.json', json.dumps(KIT_META).encode()),
+            ('kit-test-1.0.0-0/README.md', b'readme'),
+        ]
+    )
+
+    assert get_metadata_from_archive(archive_path) == KIT_META
+
+
+def test_get_metadata_from_archive_not_first_member(tmpdir):
+    #
+    # Archives built with tar(1) do not necessarily have kit.json as
+    # the first member
+    #
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/README.md', b'readme'),
+            ('kit-test-1.0.0-0/doc/kit.json', b'not the metadata'),
+            ('kit-test-1.0.0-0/kit.json', json.dumps(KIT_META).encode()),
+        ]
+    )
+
+    assert get_metadata_from_archive(archive_path) == KIT_META
+
+
+@pytest.mark.parametrize('compression', ['', 'gz', 'xz'])
+def test_unpack_kit_archive_compression(tmpdir, compression):
+    #
+    # The compression is detected from the archive contents, not the
+    # file name
+    #
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/kit.json', json.dumps(KIT_META).encode()),
+            ('kit-test-1.0.0-0/README.md', b'readme'),
+        ],
+        compression=compression
+    )
+
+    assert get_metadata_from_archive(archive_path) == KIT_META
+
+    kit_dir = unpack_kit_archive(archive_path, str(tmpdir.mkdir('kits')))
+
+    assert os.path.exists(os.path.join(kit_dir, 'README.md'))
+
+
+def test_get_metadata_from_archive_missing(tmpdir):
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/README.md', b'readme'),
+        ]
+    )
+
+    with pytest.raises(KitNotFound):
+        get_metadata_from_archive(archive_path)
+
+    not_an_archive = tmpdir.join('kit-bad-1.0.0-0.tar.bz2')
+    not_an_archive.write('garbage')
+
+    with pytest.raises(KitNotFound):
+        get_metadata_from_archive(str(not_an_archive))
+
+
+def test_unpack_kit_archive(tmpdir):
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/kit.json', json.dumps(KIT_META).encode()),
+            ('kit-test-1.0.0-0/doc/EULA.txt', b'eula'),
+        ]
+    )
+    kits_root = tmpdir.mkdir('kits')
+
+    kit_dir = unpack_kit_archive(archive_path, str(kits_root))
+
+    assert kit_dir == os.path.join(str(kits_root), 'kit-test-1.0.0-0')
+
+    eula_path = os.path.join(kit_dir, 'doc', 'EULA.txt')
+    with open(eula_path) as fp:
+        assert fp.read() == 'eula'
+
+    #
+    # Write permissions are removed as the files are extracted
+    #
+    for path in (kit_dir, os.path.join(kit_dir, 'kit.json'), eula_path):
+        assert not os.stat(path).st_mode & \
+            (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def test_unpack_kit_archive_invalid_path(tmpdir):
+    archive_path = _make_kit_archive(
+        str(tmpdir.join('kit-test-1.0.0-0.tar.bz2')), [
+            ('kit-test-1.0.0-0/kit.json', json.dumps(KIT_META).encode()),
+            ('kit-test-1.0.0-0/../../evil', b'evil'),
+        ]
+    )
+    kits_root = tmpdir.mkdir('kits')
+
+    with pytest.raises(KitNotFound):
+        unpack_kit_archive(archive_path, str(kits_root))
+
+    assert not tmpdir.join('evil').exists()
+
+
+
+def test_get_kit_archive_url(tmpdir):
+    kit = Kit('test', '1.0.0', '0')
+    repo_path = str(tmpdir)
+
+    #
+    # The default compression is assumed if there is no archive
+    #
+    assert get_kit_archive_url(repo_path, kit) == \
+        os.path.join(repo_path, 'kit-test-1.0.0-0.tar.bz2')
+
+    tmpdir.join('kit-test-1.0.0-0.tar.xz').write('')
+
+    assert get_kit_archive_url(repo_path, kit) == \
+        os.path.join(repo_path, 'kit-test-1.0.0-0.tar.xz')
+    assert get_kit_archive_url('file://' + repo_path + '/', kit) == \
+        'file://' + os.path.join(repo_path, 'kit-test-1.0.0-0.tar.xz')
+
+    #
+    # Archives using the default compression are preferred
+    #
+    tmpdir.join('kit-test-1.0.0-0.tar.bz2').write('')
+
+    assert get_kit_archive_url(repo_path, kit) == \
+        os.path.join(repo_path, 'kit-test-1.0.0-0.tar.bz2')
+
+
+@pytest.fixture()
+def pip_calls(monkeypatch, tmpdir):
+    """
+    Records pip commands run by pip_install_requirements(), rather than
+    running them.
+
+    """
+    calls = []
+    root = str(tmpdir.mkdir('root'))
+
+    monkeypatch.setattr(ConfigManager, 'getRoot', lambda self, *args: root)
+    monkeypatch.setattr(ConfigManager, 'getInstaller',
+                        lambda self: 'installer')
+    monkeypatch.setattr(ConfigManager, 'getIntWebRootUrl',
+                        lambda self, installer: 'http://installer:8008')
+    monkeypatch.setattr(ConfigManager, 'is_offline_installation',
+                        lambda self: False)
+
+    def _run_pip(pip_cmd):
+        calls.append(pip_cmd)
+        return 0
+
+    monkeypatch.setattr(kit_utils, '_run_pip', _run_pip)
+
+    return calls
+
+
+def test_pip_install_requirements_unchanged(tmpdir, pip_calls):
+    requirements_path = tmpdir.join('requirements.txt')
+    requirements_path.write('requests\n')
+
+    pip_install_requirements(str(requirements_path))
+
+    assert len(pip_calls) == 1
+    assert '--no-index' not in pip_calls[0]
+
+    #
+    # The requirements have not changed, so pip is not run again
+    #
+    pip_install_requirements(str(requirements_path))
+
+    assert len(pip_calls) == 1
+
+    requirements_path.write('requests\nsix\n')
+
+    pip_install_requirements(str(requirements_path))
+
+    assert len(pip_calls) == 2
+
+
+def test_pip_install_requirements_wheelhouse(tmpdir, pip_calls):
+    requirements_path = tmpdir.join('requirements.txt')
+    requirements_path.write('requests\n')
+    wheelhouse_path = tmpdir.mkdir(WHEELHOUSE_DIR)
+
+    pip_install_requirements(str(requirements_path))
+
+    assert len(pip_calls) == 1
+    assert '--no-index' in pip_calls[0]
+    assert pip_calls[0][pip_calls[0].index('--find-links') + 1] == \
+        str(wheelhouse_path)
+
+
+def test_pip_install_requirements_error(tmpdir, monkeypatch, pip_calls):
+    requirements_path = tmpdir.join('requirements.txt')
+    requirements_path.write('requests\n')
+
+    monkeypatch.setattr(kit_utils, '_run_pip', lambda pip_cmd: 1)
+
+    with pytest.raises(TortugaException):
+        pip_install_requirements(str(requirements_path))
+
+    #
+    # Failed installs are retried
+    #
+    monkeypatch.setattr(kit_utils, '_run_pip',
+                        lambda pip_cmd: pip_calls.append(pip_cmd) or 0)
+
+    pip_install_requirements(str(requirements_path))
+
+    assert len(pip_calls) == 1
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
 import types
 
 from tortuga.objectstore.base import matches_filters
@@ -106,6 +107,38 @@ def test_list(redis):
     assert to_store == from_store
 
 
+
+def test_list_legacy_index(redis, monkeypatch):
+    from tortuga.objectstore.manager import ObjectStoreManager
+
+    #
+    # Objects stored by previous versions are indexed in a set
+    #
+    redis.hmset('test:my_key1', {'id': 'my_key1'})
+    redis.hmset('test:my_key2', {'id': 'my_key2'})
+    redis.sadd('test:INDEX', 'test:my_key1')
+    redis.sadd('test:INDEX', 'test:my_key2')
+    redis.sadd('test:INDEX', 'test:expired')
+
+    monkeypatch.setattr(ObjectStoreManager, '_redis_client', redis)
+    assert [store._namespace for store in ObjectStoreManager.get_all()] == \
+        ['test']
+
+    store = RedisObjectStore(namespace='test', redis_client=redis)
+    store.set('my_key3', {'id': 'my_key3'})
+
+    assert sorted(k for k, _ in store.list()) == \
+        ['my_key1', 'my_key2', 'my_key3']
+
+    #
+    # The index set is removed once migrated
+    #
+    assert not redis.exists('test:INDEX')
+    assert sorted(k for k, _ in RedisObjectStore(
+        namespace='test', redis_client=redis).list()) == \
+        ['my_key1', 'my_key2', 'my_key3']
+
+
 def test_list_limit(redis):
     store = RedisObjectStore(namespace='test', redis_client=redis)
 
@@ -277,3 +310,148 @@ def test_list_filter(redis):
     for k, v in store.list(order_by='number', age__gt=40):
         numbers.append(v['number'])
     assert numbers == [1, 4]
+
+
+def test_log_append_range(redis):
+    store = RedisObjectStore(namespace='test', redis_client=redis)
+    store.set('my_key', data_2)
+
+    assert store.log_range('my_key') == []
+
+    assert store.log_append('my_key', 'one') == 1
+    assert store.log_append('my_key', 'two', 'three') == 3
+
+    #
+    # Assert that the log can be read incrementally
+    #
+    assert store.log_range('my_key') == ['one', 'two', 'three']
+    assert store.log_range('my_key', since=2) == ['three']
+    assert store.log_range('my_key', since=3) == []
+
+    #
+    # Assert that the log does not modify the object itself, and does not
+    # show up as an object in the namespace
+    #
+    assert store.get('my_key') == data_2
+    assert [k for k, _ in store.list()] == ['my_key']
+
+    #
+    # Assert that deleting the object also deletes the log
+    #
+    store.delete('my_key')
+    assert store.log_range('my_key') == []
+
+
+def test_trim_expired(redis, monkeypatch):
+    import time
+    from tortuga.objectstore import redis as redis_module
+
+    store = RedisObjectStore(namespace='test', redis_client=redis,
+                             expire=60)
+    persistent_store = RedisObjectStore(namespace='test',
+                                        redis_client=redis)
+
+    store.set('expiring_1', data_2)
+    store.set('expiring_2', data_2)
+    persistent_store.set('persistent', data_2)
+
+    assert sorted(k for k, _ in store.list()) == \
+        ['expiring_1', 'expiring_2', 'persistent']
+
+    #
+    # Once the objects have expired, they are no longer listed, even before
+    # the index is trimmed
+    #
+    now = time.time() + 120
+    monkeypatch.setattr(redis_module.time, 'time', lambda: now)
+
+    assert [k for k, _ in store.list()] == ['persistent']
+
+    assert store.trim_expired() == 2
+    assert store.trim_expired() == 0
+    assert [k for k, _ in store.list(order_by='id')] == ['persistent']
+
+
+def test_set_version(redis):
+    from tortuga.objectstore.exceptions import VersionConflictError
+
+    store = RedisObjectStore(namespace='test', redis_client=redis)
+
+    #
+    # Creating an object returns no previous value, and sets the version
+    # to 1
+    #
+    assert store.set('my_key', data_2, expected_version=0) is None
+    assert store.get_with_version('my_key') == (data_2, 1)
+
+    #
+    # Updating returns the previous value, and increments the version
+    #
+    data_2_updated = dict(data_2, foo='baz')
+    assert store.set('my_key', data_2_updated,
+                     expected_version=1) == data_2
+    assert store.get_with_version('my_key') == (data_2_updated, 2)
+
+    #
+    # Updates based on a stale version fail, and don't change the object
+    #
+    with pytest.raises(VersionConflictError):
+        store.set('my_key', data_2, expected_version=1)
+    assert store.get_with_version('my_key') == (data_2_updated, 2)
+
+    #
+    # Without an expected version, the last write wins
+    #
+    assert store.set('my_key', data_2) == data_2_updated
+    assert store.get('my_key') == data_2
+
+    assert store.get_with_version('missing') == (None, 0)
+
+
+def test_type_store_save(redis, monkeypatch):
+    from tortuga.cloudserveraction.store import \
+        ObjectStoreCloudServerActionStore
+    from tortuga.cloudserveraction.types import CloudServerAction
+    from tortuga.events.types import (CloudServerActionCreated,
+                                      CloudServerActionUpdated)
+
+    fired = []
+    for event_class in (CloudServerActionCreated, CloudServerActionUpdated):
+        monkeypatch.setattr(
+            event_class, 'fire',
+            classmethod(lambda cls, **kwargs: fired.append((cls, kwargs))))
+
+    store = ObjectStoreCloudServerActionStore(
+        RedisObjectStore(namespace='test', redis_client=redis))
+
+    #
+    # The saved object is built from the data written, with the new
+    # version, rather than read back from the store
+    #
+    monkeypatch.setattr(store, 'get', None)
+
+    csa = store.save(CloudServerAction(action='start', cloudserver_id='1',
+                                       action_params={'count': 1}))
+    assert csa.version == 1
+    assert csa.action_params == {'count': 1}
+    assert [cls for cls, _ in fired] == [CloudServerActionCreated]
+
+    #
+    # Saving an unchanged object doesn't fire an update event
+    #
+    csa = store.save(csa, expected_version=csa.version)
+    assert csa.version == 2
+    assert len(fired) == 1
+
+    #
+    # Saving a changed object fires an update event, with the previous
+    # object as stored
+    #
+    csa.status = CloudServerAction.STATUS_COMPLETE
+    csa = store.save(csa, expected_version=csa.version)
+    assert csa.version == 3
+    assert csa.status == CloudServerAction.STATUS_COMPLETE
+    cls, kwargs = fired[-1]
+    assert cls is CloudServerActionUpdated
+    assert kwargs['previous_cloudserveraction']['status'] == \
+        CloudServerAction.STATUS_CREATED
@@ -0,0 +1,49 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from tortuga.web_service.streaming import JsonLinesResponse
+
+
+def generate_objs(count: int, fail: bool = False):
+    for n in range(count):
+        yield {'name': 'node{:04d}'.format(n)}
+
+    if fail:
+        raise Exception('Database error')
+
+
+def test_json_lines_response():
+    chunks = list(JsonLinesResponse(generate_objs(1000), dict))
+
+    #
+    # Lines are sent in chunks, rather than individually
+    #
+    assert 1 < len(chunks) < 1000
+
+    lines = b''.join(chunks).splitlines()
+
+    assert [json.loads(line) for line in lines] == list(generate_objs(1000))
+
+
+def test_json_lines_response_error():
+    lines = b''.join(
+        JsonLinesResponse(generate_objs(2, fail=True), dict)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {'name': 'node0000'},
+        {'name': 'node0001'},
+        {'error': {'message': 'Database error'}},
+    ]
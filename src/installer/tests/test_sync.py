@@ -0,0 +1,158 @@
+# Copyright 2008-2018 Univa Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from tortuga.objectstore.redis import RedisObjectStore
+from tortuga.sync import tasks
+from tortuga.sync.scheduler import ClusterUpdateScheduler
+from tortuga.wsapi.syncWsApi import SyncWsApi
+
+
+@pytest.fixture()
+def cluster_updates(monkeypatch):
+    updates = []
+
+    def scheduleClusterUpdate(self, updateReason=None, opts={}):
+        updates.append(updateReason)
+
+    monkeypatch.setattr(SyncWsApi, 'scheduleClusterUpdate',
+                        scheduleClusterUpdate)
+
+    return updates
+
+
+@pytest.fixture()
+def scheduled_tasks(monkeypatch):
+    scheduled = []
+
+    def apply_async(*args, **kwargs):
+        scheduled.append(kwargs)
+
+    monkeypatch.setattr(tasks.run_cluster_update, 'apply_async', apply_async)
+
+    return scheduled
+
+
+def test_debounce(redis, cluster_updates, scheduled_tasks):
+    store = RedisObjectStore(namespace='cluster-update', redis_client=redis)
+    scheduler = ClusterUpdateScheduler(store, window=10)
+
+    #
+    # Assert that 100 back-to-back requests only schedule one update
+    #
+    for idx in range(100):
+        scheduler.schedule(reason='reason {}'.format(idx % 2))
+
+    assert scheduled_tasks == [{'countdown': 10}]
+    assert not cluster_updates
+
+    status = scheduler.get_status()
+    assert status['pending']
+    assert status['pending_since']
+    assert status['reasons'] == ['reason 0', 'reason 1']
+
+    #
+    # Assert that when the window elapses, one update is run with the
+    # union of reasons
+    #
+    scheduler.run_pending_update()
+
+    assert cluster_updates == ['reason 0; reason 1']
+    assert not scheduler.get_status()['pending']
+
+    #
+    # Assert that the next request starts a new window
+    #
+    scheduler.schedule()
+
+    assert len(scheduled_tasks) == 2
+
+    scheduler.run_pending_update()
+
+    assert cluster_updates == ['reason 0; reason 1', None]
+
+
+def test_no_pending_update(redis, cluster_updates):
+    store = RedisObjectStore(namespace='cluster-update', redis_client=redis)
+    scheduler = ClusterUpdateScheduler(store, window=10)
+
+    scheduler.run_pending_update()
+
+    assert not cluster_updates
+
+
+def test_no_window(redis, cluster_updates, scheduled_tasks):
+    store = RedisObjectStore(namespace='cluster-update', redis_client=redis)
+    scheduler = ClusterUpdateScheduler(store)
+
+    scheduler.schedule(reason='Node(s) added')
+
+    assert not scheduled_tasks
+    assert cluster_updates == ['Node(s) added']
+
+
+
+def test_schedule_failure(redis, monkeypatch, cluster_updates):
+    store = RedisObjectStore(namespace='cluster-update', redis_client=redis)
+    scheduler = ClusterUpdateScheduler(store, window=10)
+
+    scheduled = []
+
+    def apply_async(*args, **kwargs):
+        if not scheduled:
+            scheduled.append(None)
+            raise ConnectionError('broker unavailable')
+
+        scheduled.append(kwargs)
+
+    monkeypatch.setattr(tasks.run_cluster_update, 'apply_async',
+                        apply_async)
+
+    with pytest.raises(ConnectionError):
+        scheduler.schedule(reason='Node(s) added')
+
+    #
+    # Assert that the failed request does not suppress further requests
+    #
+    assert not scheduler.get_status()['pending']
+
+    scheduler.schedule(reason='Node(s) deleted')
+
+    assert scheduled == [None, {'countdown': 10}]
+
+
+def test_request_during_update(redis, monkeypatch, scheduled_tasks):
+    store = RedisObjectStore(namespace='cluster-update', redis_client=redis)
+    scheduler = ClusterUpdateScheduler(store, window=10)
+
+    updates = []
+
+    def scheduleClusterUpdate(self, updateReason=None, opts={}):
+        updates.append(updateReason)
+        scheduler.schedule(reason='reason 1')
+
+    monkeypatch.setattr(SyncWsApi, 'scheduleClusterUpdate',
+                        scheduleClusterUpdate)
+
+    scheduler.schedule(reason='reason 0')
+    scheduler.run_pending_update()
+
+    #
+    # Assert that a request arriving once the pending update has been
+    # taken is not lost, but schedules a new update
+    #
+    assert updates == ['reason 0']
+    assert len(scheduled_tasks) == 2
+    assert scheduler.get_status()['reasons'] == ['reason 1']